@@ -0,0 +1,31 @@
+from smtplib import SMTPException
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from config.celery import RETRY_BACKOFF
+from .models import EmailVerificationToken
+
+
+@shared_task(autoretry_for=(SMTPException, OSError), **RETRY_BACKOFF)
+def send_verification_email(token_id):
+    """
+    회원가입 이메일 인증 메일 발송
+    - 메일 서버 연결 오류는 백오프 후 재시도
+    - 토큰이 삭제되었거나 이미 인증된 경우 발송하지 않음
+
+    Args:
+        token_id: EmailVerificationToken ID
+    """
+    verification_token = EmailVerificationToken.objects.select_related('user').filter(
+        pk=token_id, is_verified=False
+    ).first()
+    if verification_token is None:
+        return
+
+    link = f"{settings.FRONTEND_URL}/verify-email/{verification_token.token}"
+    send_mail(
+        subject='[AI Maker Lab] 이메일 인증을 완료해주세요',
+        message=f'아래 링크를 눌러 이메일 인증을 완료해주세요.\n\n{link}\n',
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[verification_token.user.email],
+    )
@@ -0,0 +1,78 @@
+from smtplib import SMTPException
+from unittest import mock
+from celery.exceptions import Retry
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import EmailVerificationToken
+from .tasks import send_verification_email
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    FRONTEND_URL='https://aimakerlab.com'
+)
+class VerificationEmailTaskTest(TestCase):
+    """
+    회원가입 인증 메일 작업 테스트 클래스
+
+    인증 메일이 커밋 후 작업 큐에서 발송되고, 메일 서버 오류 시 재시도하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('register')
+
+    def _register(self, email='new@example.com'):
+        """회원가입 요청 (커밋 후 작업 실행)"""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(
+                self.url, {'email': email, 'password': 'password123'}, format='json'
+            )
+        return response, callbacks
+
+    def test_register_sends_mail_after_commit(self):
+        """회원가입 응답과 별도로 인증 링크가 담긴 메일을 발송하는지 테스트 함수"""
+        response, callbacks = self._register()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(callbacks), 1)
+
+        token = EmailVerificationToken.objects.get(user__email='new@example.com')
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['new@example.com'])
+        self.assertIn(f'https://aimakerlab.com/verify-email/{token.token}', mail.outbox[0].body)
+
+    def test_failed_register_sends_nothing(self):
+        """회원가입 실패 시 메일 작업을 등록하지 않는지 테스트 함수"""
+        self._register()
+        response, callbacks = self._register()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_verified_token_skipped(self):
+        """이미 인증된 토큰은 메일을 보내지 않는지 테스트 함수"""
+        self._register()
+        token = EmailVerificationToken.objects.get()
+        token.is_verified = True
+        token.save()
+
+        send_verification_email.delay(token.pk)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_retry_on_smtp_error(self):
+        """메일 서버 오류 시 재시도하여 발송하는지 테스트 함수 (eager 실행은 재시도도 즉시 실행)"""
+        self._register()
+        token = EmailVerificationToken.objects.get()
+
+        with mock.patch('accounts.tasks.send_mail', side_effect=[SMTPException('연결 실패'), 1]) as send_mail:
+            # 테스트 설정은 예외를 전달하므로 재시도 예외 확인
+            with self.assertRaises(Retry):
+                send_verification_email.delay(token.pk)
+
+            send_mail.side_effect = [SMTPException('연결 실패'), 1]
+            result = send_verification_email.apply(args=[token.pk], throw=False)
+        self.assertEqual(result.state, 'SUCCESS')
+        self.assertEqual(send_mail.call_count, 3)
@@ -6,6 +6,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import IsAuthenticated
 from .serializers import LoginSerializer, UserProfileSerializer
 from .models import EmailVerificationToken
+from .tasks import send_verification_email
 import os
 import requests
 from django.conf import settings
@@ -100,7 +101,8 @@ class RegisterView(APIView):
             # Create verification token
             verification_token = EmailVerificationToken.objects.create(user=user)
 
-            # TODO: Send verification email
+            # 인증 메일은 작업 큐에서 발송 (메일 서버 응답을 기다리지 않음)
+            send_verification_email.delay_on_commit(verification_token.pk)
 
             refresh = RefreshToken.for_user(user)
             return Response(
@@ -175,7 +177,9 @@ class KakaoCallbackView(APIView):
             }
             print(f"Requesting Kakao token with data: {data}")
 
-            token_response = requests.post(token_url, data=data)
+            token_response = requests.post(
+                token_url, data=data, timeout=settings.OAUTH_REQUEST_TIMEOUT
+            )
             token_data = token_response.json()
             print(f"Kakao token response: {token_data}")
 
@@ -201,7 +205,9 @@ class KakaoCallbackView(APIView):
                 "Content-type": "application/x-www-form-urlencoded;charset=utf-8",
             }
             print("Requesting Kakao user info...")
-            user_response = requests.get(user_url, headers=headers)
+            user_response = requests.get(
+                user_url, headers=headers, timeout=settings.OAUTH_REQUEST_TIMEOUT
+            )
             user_data = user_response.json()
             print(f"Kakao user info response: {user_data}")
 
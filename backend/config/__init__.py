@@ -0,0 +1,4 @@
+# Django 시작 시 Celery 앱을 로드하여 @shared_task가 이 앱을 사용하도록 함
+from .celery import app as celery_app
+
+__all__ = ("celery_app",)
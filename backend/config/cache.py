@@ -0,0 +1,86 @@
+import hashlib
+import time
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+
+def _version_key(group):
+    """캐시 그룹 버전 키"""
+    return f'api-cache-version:{group}'
+
+
+def get_cache_version(group):
+    """
+    캐시 그룹의 현재 버전 반환
+    - 버전 키가 없으면 시간 기반 값으로 생성 (이전 버전과 겹치지 않도록)
+    """
+    version = cache.get(_version_key(group))
+    if version is None:
+        cache.add(_version_key(group), time.time_ns(), None)
+        version = cache.get(_version_key(group))
+    return version
+
+
+def bump_cache_version(group):
+    """
+    캐시 그룹 버전 증가 (기존 캐시 키는 더 이상 조회되지 않음)
+
+    Returns:
+        int: 증가된 버전
+    """
+    try:
+        return cache.incr(_version_key(group))
+    except ValueError:
+        version = time.time_ns()
+        cache.set(_version_key(group), version, None)
+        return version
+
+
+def invalidate_cache_group(*groups):
+    """
+    캐시 그룹 무효화
+    - 즉시 한 번, 트랜잭션 커밋 후 한 번 더 버전을 올려
+      커밋 전에 다시 캐시된 이전 데이터도 무효화
+    """
+    for group in groups:
+        bump_cache_version(group)
+        transaction.on_commit(lambda group=group: bump_cache_version(group))
+
+
+def cached_response(group):
+    """
+    비로그인 GET 요청의 응답 데이터를 캐시하는 뷰 메서드 데코레이터
+    - 캐시 키: 그룹 버전 + scheme / host + 경로 + 정렬된 쿼리 파라미터
+      (응답의 이미지 URL 등이 build_absolute_uri로 만든 절대 URL이므로 host / scheme별로 구분)
+    - 200 응답만 캐시, 유효 시간은 API_CACHE_TIMEOUT 설정
+
+    Args:
+        group: 캐시 그룹명 (모델 시그널로 그룹 단위 무효화)
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method != 'GET' or request.user.is_authenticated:
+                return view_method(view, request, *args, **kwargs)
+
+            params = sorted(
+                (key, sorted(values)) for key, values in request.query_params.lists()
+            )
+            digest = hashlib.md5(
+                repr((request.scheme, request.get_host(), request.path, params)).encode()
+            ).hexdigest()
+            key = f'api-cache:{group}:{get_cache_version(group)}:{digest}'
+
+            cached = cache.get(key)
+            if cached is not None:
+                return Response(cached)
+
+            response = view_method(view, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+            return response
+        return wrapper
+    return decorator
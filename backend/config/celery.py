@@ -0,0 +1,20 @@
+import os
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+# 느린 부수 작업(메일 발송, 이미지 처리, 만료 예약 해제)용 Celery 앱
+# - 설정은 settings.py의 CELERY_ 접두어 값 사용
+# - 각 앱의 tasks.py 작업 자동 등록
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
+
+# 일시적 오류(네트워크, 메일 서버, 파일 저장소) 재시도 정책
+# - 지수 백오프 + jitter, 최대 10분 간격으로 5번까지 재시도
+RETRY_BACKOFF = {
+    "retry_backoff": True,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+    "max_retries": 5,
+}
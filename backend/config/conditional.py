@@ -0,0 +1,48 @@
+import hashlib
+from calendar import timegm
+from functools import wraps
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def conditional_retrieve(*version_fields):
+    """
+    상세 조회(retrieve)에 ETag / Last-Modified 조건부 응답을 적용하는 데코레이터
+    - 직렬화 전에 version_fields만 조회하는 가벼운 쿼리 1번으로 변경 여부 판단
+    - If-None-Match / If-Modified-Since가 일치하면 직렬화 없이 304 반환
+    - 첫 번째 필드(updated_at)는 Last-Modified로 사용
+
+    Args:
+        version_fields: 응답 버전을 결정하는 모델 필드명들 (예: 'updated_at', 'current_students')
+    """
+    def decorator(retrieve):
+        @wraps(retrieve)
+        def wrapper(view, request, *args, **kwargs):
+            lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+            version = view.queryset.prefetch_related(None).filter(
+                **{view.lookup_field: kwargs[lookup_url_kwarg]}
+            ).values_list(*version_fields).first()
+
+            # 존재하지 않는 객체는 원래 retrieve에서 404 처리
+            if version is None:
+                return retrieve(view, request, *args, **kwargs)
+
+            # 쿼리 파라미터에 따라 응답이 달라질 수 있으므로 ETag에 포함
+            digest = hashlib.md5(
+                repr((version, sorted(request.query_params.lists()))).encode()
+            ).hexdigest()
+            etag = quote_etag(digest)
+            last_modified = timegm(version[0].utctimetuple())
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is None:
+                response = retrieve(view, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,115 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+
+# 복제본 조회를 허용하는 HTTP 메서드 (데이터를 변경하지 않는 요청)
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# 쓰기 후 기본 DB 고정 만료 시각(unix time)을 담는 서명 쿠키
+STICKY_COOKIE_NAME = 'db_primary_until'
+
+
+class RoutingState:
+    """요청 단위 DB 라우팅 상태 (복제본 조회 허용 여부, 쓰기 발생 여부)"""
+    __slots__ = ('use_replica', 'wrote')
+
+    def __init__(self, use_replica):
+        self.use_replica = use_replica
+        self.wrote = False
+
+
+# 현재 요청(스레드 / 비동기 태스크)의 라우팅 상태
+_routing_state = ContextVar('db_routing_state', default=None)
+
+
+@contextmanager
+def routing(use_replica):
+    """
+    블록 안의 쿼리 라우팅 상태 설정
+
+    Args:
+        use_replica: 조회 쿼리를 복제본으로 보낼지 여부 (블록 안에서 쓰기가 발생하면 이후 조회는 기본 DB)
+
+    Yields:
+        RoutingState: 블록 종료 후 쓰기 발생 여부(wrote) 확인용
+    """
+    state = RoutingState(use_replica)
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+def replica_reads():
+    """블록 안의 조회 쿼리를 복제본으로 보냄 (복제본이 설정된 경우)"""
+    return routing(use_replica=True)
+
+
+def is_sticky(request):
+    """최근 쓰기로 기본 DB 고정 기간 중인 요청인지 확인 (서명이 잘못된 쿠키는 무시)"""
+    until = request.get_signed_cookie(STICKY_COOKIE_NAME, default=None)
+    try:
+        return until is not None and float(until) > time.time()
+    except ValueError:
+        return False
+
+
+class ReplicaReadMiddleware:
+    """
+    조회 요청을 복제본으로 보내고 쓰기 이후에는 기본 DB로 고정하는 미들웨어
+    - GET/HEAD/OPTIONS 요청의 조회 쿼리는 복제본 사용
+    - 요청 중 쓰기가 발생하면 DATABASE_REPLICA_STICKY_SECONDS 동안 기본 DB를 사용하도록 서명 쿠키 발급
+      (복제 지연 때문에 방금 작성한 문의 / 신청이 목록에서 보이지 않는 문제 방지)
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replica = request.method in SAFE_METHODS and not is_sticky(request)
+        with routing(use_replica) as state:
+            response = self.get_response(request)
+
+        if state.wrote:
+            sticky_seconds = settings.DATABASE_REPLICA_STICKY_SECONDS
+            response.set_signed_cookie(
+                STICKY_COOKIE_NAME,
+                str(time.time() + sticky_seconds),
+                max_age=sticky_seconds,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 복제본 DB 라우터
+    - 조회: 미들웨어가 복제본 조회를 허용한 요청이고 아직 쓰기가 없으면 DATABASE_REPLICAS 중 하나
+    - 쓰기: 항상 기본 DB (요청의 쓰기 발생 여부 기록)
+    - 이미 조회한 객체의 관계 조회는 해당 객체를 읽은 DB 사용
+    """
+    def db_for_read(self, model, **hints):
+        """조회 쿼리 DB 선택"""
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        state = _routing_state.get()
+        replicas = settings.DATABASE_REPLICAS
+        if state and state.use_replica and not state.wrote and replicas:
+            return random.choice(replicas)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        """쓰기 쿼리는 항상 기본 DB"""
+        state = _routing_state.get()
+        if state:
+            state.wrote = True
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """복제본과 기본 DB는 같은 데이터이므로 관계 허용"""
+        return True
@@ -0,0 +1,219 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from config.storage import BLOB_DIR, BLOB_CACHE_CONTROL, is_blob_path
+
+# 단일 구간 Range 헤더 (bytes=시작-끝, bytes=시작-, bytes=-마지막N바이트)
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_range(header, size):
+    """
+    Range 헤더를 바이트 구간으로 변환
+    - 여러 구간 / 잘못된 형식은 무시하고 전체 응답 (RFC 9110 허용)
+
+    Returns:
+        tuple: (시작, 끝) 바이트 위치 (끝 포함), 무시할 헤더면 None
+
+    Raises:
+        ValueError: 파일 범위를 벗어난 구간 (416 응답)
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if not start:
+        # 마지막 N바이트
+        length = int(end)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(start)
+    if end and int(end) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, min(int(end), size - 1) if end else size - 1
+
+
+class RangeFile:
+    """파일의 지정 구간만 읽는 파일 객체 (206 응답 본문)"""
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+class FileServingMiddleware:
+    """
+    정적 파일 / 업로드 파일 응답 미들웨어 (DEBUG 전용 static() URL 대체)
+    - STATIC_URL: collectstatic 결과(STATIC_ROOT), DEBUG에서는 앱 static 폴더도 검색
+    - MEDIA_URL: MEDIA_ROOT (로컬 디스크 저장소일 때만, S3 저장소 파일은 버킷 / CDN에서 응답)
+    - 해시 파일명(ManifestStaticFilesStorage)과 내용 주소 기반 blob은 immutable 영구 캐시,
+      그 외 파일은 STATIC_CACHE_SECONDS / MEDIA_CACHE_SECONDS 동안 캐시 후 ETag로 재검증
+    - ETag / Last-Modified 조건부 응답(304), 단일 구간 Range 요청(206 / 416)
+    - FILE_SENDFILE_BACKEND 설정 시 본문 대신 X-Accel-Redirect(nginx) / X-Sendfile(Apache 등) 헤더로 전송 위임
+    - 그 외에는 열린 파일을 FileResponse로 넘겨 WSGI 서버의 sendfile(wsgi.file_wrapper) 사용
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._hashed_files = (None, frozenset())
+
+    def __call__(self, request):
+        if settings.SERVE_FILES and request.method in ('GET', 'HEAD'):
+            response = self.serve(request)
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    @staticmethod
+    def url_prefix(url):
+        """요청 경로 비교용 URL 접두어 (다른 호스트 URL이면 None)"""
+        if not url or '://' in url or url.startswith('//'):
+            return None
+        return '/' + url.lstrip('/')
+
+    def serve(self, request):
+        """요청 경로에 해당하는 파일 응답 (해당 파일이 없으면 None)"""
+        static_prefix = self.url_prefix(settings.STATIC_URL)
+        media_prefix = self.url_prefix(settings.MEDIA_URL)
+        if static_prefix and request.path.startswith(static_prefix):
+            return self.serve_static(request, request.path[len(static_prefix):])
+        if media_prefix and request.path.startswith(media_prefix):
+            return self.serve_media(request, request.path[len(media_prefix):])
+        return None
+
+    def serve_static(self, request, name):
+        """정적 파일 응답"""
+        full_path = self.find(settings.STATIC_ROOT, name)
+        internal_path = f'static/{name}'
+        if full_path is None and settings.DEBUG:
+            full_path = finders.find(name)
+            internal_path = None
+        if full_path is None or not os.path.isfile(full_path):
+            return None
+        if name in self.hashed_files():
+            cache_control = BLOB_CACHE_CONTROL
+        else:
+            cache_control = f'public, max-age={settings.STATIC_CACHE_SECONDS}'
+        return self.file_response(request, full_path, internal_path, cache_control)
+
+    def serve_media(self, request, name):
+        """업로드 파일 응답 (업로드 중 임시 파일 제외)"""
+        if name.startswith(f'{BLOB_DIR}/tmp/'):
+            return None
+        try:
+            root = default_storage.path('')
+        except NotImplementedError:
+            return None
+        full_path = self.find(root, name)
+        if full_path is None:
+            return None
+        if is_blob_path(name):
+            cache_control = BLOB_CACHE_CONTROL
+        else:
+            cache_control = f'public, max-age={settings.MEDIA_CACHE_SECONDS}'
+        return self.file_response(request, full_path, f'media/{name}', cache_control)
+
+    @staticmethod
+    def find(root, name):
+        """root 하위 파일 경로 (root 밖을 가리키거나 파일이 아니면 None)"""
+        if not root or not name:
+            return None
+        try:
+            full_path = safe_join(root, name)
+        except SuspiciousFileOperation:
+            return None
+        return full_path if os.path.isfile(full_path) else None
+
+    def hashed_files(self):
+        """collectstatic이 만든 해시 파일명 집합 (ManifestStaticFilesStorage가 아니면 빈 집합)"""
+        manifest = getattr(staticfiles_storage, 'hashed_files', None)
+        if manifest is not self._hashed_files[0]:
+            self._hashed_files = (manifest, frozenset(manifest.values()) if manifest else frozenset())
+        return self._hashed_files[1]
+
+    def file_response(self, request, full_path, internal_path, cache_control):
+        """
+        파일 응답 생성
+
+        Args:
+            full_path: 파일 절대 경로
+            internal_path: X-Accel-Redirect 내부 경로 (FILE_SENDFILE_PREFIX 기준, 위임 불가면 None)
+            cache_control: Cache-Control 헤더 값
+        """
+        stat = os.stat(full_path)
+        size = stat.st_size
+        etag = quote_etag(f'{stat.st_mtime_ns:x}-{size:x}')
+        last_modified = int(stat.st_mtime)
+        content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            backend = settings.FILE_SENDFILE_BACKEND
+            if backend and internal_path:
+                # 본문 / Range 처리는 웹 서버가 담당
+                response = HttpResponse(content_type=content_type)
+                if backend == 'x-accel-redirect':
+                    response['X-Accel-Redirect'] = settings.FILE_SENDFILE_PREFIX + quote(internal_path)
+                else:
+                    response['X-Sendfile'] = full_path
+            else:
+                response = self.content_response(request, full_path, size, content_type, etag, last_modified)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = cache_control
+        response['Accept-Ranges'] = 'bytes'
+        return response
+
+    @staticmethod
+    def content_response(request, full_path, size, content_type, etag, last_modified):
+        """파일 본문 응답 (Range 요청이면 206 / 416)"""
+        byte_range = None
+        range_header = request.META.get('HTTP_RANGE')
+        if_range = request.META.get('HTTP_IF_RANGE')
+        # If-Range가 현재 버전과 다르면 Range를 무시하고 전체 응답
+        if range_header and (not if_range or if_range in (etag, http_date(last_modified))):
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1 if size else 0
+        if request.method == 'HEAD':
+            response = HttpResponse(content_type=content_type, status=206 if byte_range else 200)
+        elif byte_range:
+            response = FileResponse(
+                RangeFile(open(full_path, 'rb'), start, length), status=206, content_type=content_type
+            )
+        else:
+            response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+        if byte_range:
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(length)
+        return response
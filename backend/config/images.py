@@ -0,0 +1,120 @@
+import os
+from io import BytesIO
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import models
+from PIL import Image, ImageOps, features
+from rest_framework import serializers
+
+# 출력 형식별 Pillow 저장 옵션 (형식 키, Pillow 형식명, 확장자, 저장 옵션)
+RENDITION_FORMATS = {
+    'avif': ('AVIF', 'avif', {'quality': 60}),
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+# 원본 옆에 rendition을 저장하는 하위 폴더명
+RENDITION_DIR = 'renditions'
+
+
+def available_formats():
+    """설정된 출력 형식 중 현재 Pillow 빌드에서 저장 가능한 형식 목록"""
+    return [
+        key for key in settings.IMAGE_RENDITION_FORMATS
+        if key in RENDITION_FORMATS and (key == 'jpeg' or features.check(key))
+    ]
+
+
+def rendition_name(source, width, extension):
+    """
+    rendition 저장 경로 생성 (원본과 같은 폴더의 renditions 하위 폴더)
+    - 예: 'products/home_1.JPG' -> 'products/renditions/home_1_400w.webp'
+    """
+    directory, filename = os.path.split(source)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, RENDITION_DIR, f'{stem}_{width}w.{extension}')
+
+
+def render(file, widths=None, formats=None):
+    """
+    원본 이미지를 고정 너비의 형식별 rendition으로 변환
+    - EXIF 회전 정보를 반영한 뒤 비율을 유지하여 축소 (원본보다 크게 확대하지 않음)
+    - 원본이 가장 작은 너비보다 작으면 원본 너비로 1개만 생성
+
+    Args:
+        file: 원본 이미지 파일 객체
+        widths: 생성할 너비 목록 (기본값: IMAGE_RENDITION_WIDTHS)
+        formats: 생성할 형식 목록 (기본값: available_formats())
+
+    Yields:
+        tuple: (형식, 너비, 높이, 확장자, 이미지 바이트)
+    """
+    widths = sorted(widths or settings.IMAGE_RENDITION_WIDTHS)
+    formats = formats or available_formats()
+
+    with Image.open(file) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+
+    targets = [width for width in widths if width < image.width] or [image.width]
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        for key in formats:
+            pillow_format, extension, options = RENDITION_FORMATS[key]
+            # JPEG은 투명도를 지원하지 않으므로 흰 배경에 합성
+            output = resized
+            if key == 'jpeg' and resized.mode == 'RGBA':
+                output = Image.new('RGB', resized.size, (255, 255, 255))
+                output.paste(resized, mask=resized.getchannel('A'))
+            buffer = BytesIO()
+            output.save(buffer, pillow_format, **options)
+            yield key, width, height, extension, ContentFile(buffer.getvalue())
+
+
+class SrcsetField(serializers.Field):
+    """
+    이미지 필드의 형식별 srcset 필드 ({'webp': 'URL 200w, URL 400w', ...}, rendition이 없으면 {})
+    - source에 ImageField 경로 지정 (예: source='thumbnail_image.image')
+    - SrcsetListSerializer 목록에서는 목록 전체의 rendition을 쿼리 1번으로 조회
+    """
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        """원본 이미지 경로 반환 (중간 관계나 이미지가 없으면 빈 문자열)"""
+        for attr in self.source_attrs:
+            instance = getattr(instance, attr, None)
+            if instance is None:
+                return ''
+        return instance.name if instance else ''
+
+    def to_representation(self, value):
+        if not value:
+            return {}
+        srcsets = getattr(self.parent, '_srcsets', None)
+        if srcsets is None:
+            from products.models import ProductImageRendition
+            srcsets = ProductImageRendition.srcsets([value], self.context.get('request'))
+        return srcsets.get(value, {})
+
+
+class SrcsetListSerializer(serializers.ListSerializer):
+    """
+    목록의 SrcsetField rendition을 한 번에 조회하는 리스트 시리얼라이저
+    - child 시리얼라이저의 Meta.list_serializer_class로 지정
+    """
+    def to_representation(self, data):
+        from products.models import ProductImageRendition
+
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        fields = [field for field in self.child.fields.values() if isinstance(field, SrcsetField)]
+        sources = [field.get_attribute(item) for item in items for field in fields]
+        self.child._srcsets = ProductImageRendition.srcsets(sources, self.context.get('request'))
+        try:
+            return super().to_representation(items)
+        finally:
+            self.child._srcsets = None
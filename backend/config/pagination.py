@@ -0,0 +1,251 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, DatabaseError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.settings import api_settings
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimate_count(queryset):
+    """
+    COUNT(*) 대신 DB 통계로 행 수 추정
+    - PostgreSQL: EXPLAIN 결과의 예상 행 수 (필터 조건 포함)
+    - SQLite: ANALYZE로 수집된 sqlite_stat1 행 수 (필터가 없는 경우만)
+    - 통계를 사용할 수 없으면 정확한 COUNT(*)로 대체
+
+    Args:
+        queryset: 행 수를 구할 쿼리셋
+
+    Returns:
+        int: 추정 행 수
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                sql, params = queryset.query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]['Plan']['Plan Rows'])
+
+            if connection.vendor == 'sqlite' and not queryset.query.where:
+                # stat의 첫 번째 값이 테이블 행 수
+                cursor.execute(
+                    'SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+                if row:
+                    return int(row[0].split()[0])
+    except DatabaseError:
+        # 통계 테이블이 없는 경우 (ANALYZE 미실행 등)
+        pass
+    return queryset.count()
+
+
+class KeysetPagination(BasePagination):
+    """
+    (정렬 필드, id) 기준 keyset(cursor) 페이지네이션
+    - OFFSET 없이 마지막 행의 (정렬 값, id) 이후만 조회하므로 깊은 페이지도 일정한 속도
+    - 정렬 필드는 기본 -created_at, OrderingFilter 사용 시 요청한 정렬의 첫 번째 필드
+      (정렬 필드는 NULL이 없어야 하며 (정렬 필드, id) 복합 인덱스 필요)
+    - ?count=exact(기본) | estimated(DB 통계 기반 추정) | none(건수 생략)
+    - ?page_size는 max_page_size를 넘을 수 없음 (기본값: 설정의 PAGE_SIZE)
+    - ?page=N(기존 번호 페이지 요청)이면 같은 정렬로 OFFSET 조회 (next / previous도 page 링크)
+
+    응답 형식: {'count', 'next', 'previous', 'results'}
+    """
+    page_size = api_settings.PAGE_SIZE or 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_query_param = 'page'
+    count_query_param = 'count'
+    count_modes = ('exact', 'estimated', 'none')
+    count_mode = 'exact'
+    ordering = '-created_at'
+    invalid_cursor_message = '잘못된 cursor입니다.'
+    invalid_page_message = '잘못된 페이지입니다.'
+
+    def get_page_size(self, request):
+        """요청한 페이지 크기 반환 (max_page_size로 제한)"""
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        """정렬 필드와 방향 반환 (OrderingFilter 요청값 우선)"""
+        ordering = self.ordering
+        for backend in getattr(view, 'filter_backends', []):
+            if issubclass(backend, OrderingFilter):
+                requested = backend().get_ordering(request, queryset, view)
+                if requested:
+                    ordering = requested[0]
+                break
+        return ordering.lstrip('-'), ordering.startswith('-')
+
+    def get_count_mode(self, request):
+        """건수 계산 방식 반환"""
+        count_mode = request.query_params.get(self.count_query_param, self.count_mode)
+        return count_mode if count_mode in self.count_modes else self.count_mode
+
+    def encode_cursor(self, reverse, obj):
+        """(방향, 정렬 값, id)를 URL에 넣을 수 있는 cursor 문자열로 변환"""
+        payload = json.dumps([
+            int(reverse), self.field.value_to_string(obj), obj.pk
+        ])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        """
+        cursor 문자열을 (이전 페이지 여부, 정렬 값, id)로 변환
+
+        Raises:
+            NotFound: cursor 형식이 올바르지 않은 경우
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            reverse, value, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            return bool(reverse), self.field.to_python(value), int(pk)
+        except (TypeError, ValueError, binascii.Error, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """cursor 이후 page_size개 조회"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field_name, descending = self.get_ordering(request, queryset, view)
+        self.field = queryset.model._meta.get_field(field_name)
+
+        count_mode = self.get_count_mode(request)
+        if count_mode == 'exact':
+            self.count = queryset.count()
+        elif count_mode == 'estimated':
+            self.count = estimate_count(queryset)
+        else:
+            self.count = None
+
+        self.page_number = self.get_page_number(request)
+        if self.page_number is not None:
+            return self.paginate_by_number(queryset, field_name, descending)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor[0])
+
+        # 이전 페이지는 역순으로 조회한 뒤 다시 뒤집음
+        newest_first = descending != reverse
+        if cursor:
+            _, value, pk = cursor
+            if newest_first:
+                queryset = queryset.filter(**{f'{field_name}__lte': value}).filter(
+                    Q(**{f'{field_name}__lt': value}) | Q(**{field_name: value, 'pk__lt': pk})
+                )
+            else:
+                queryset = queryset.filter(**{f'{field_name}__gte': value}).filter(
+                    Q(**{f'{field_name}__gt': value}) | Q(**{field_name: value, 'pk__gt': pk})
+                )
+        prefix = '-' if newest_first else ''
+        queryset = queryset.order_by(f'{prefix}{field_name}', f'{prefix}pk')
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else cursor is not None
+        self.has_previous = has_more if reverse else cursor is not None
+        self.page = rows
+        return rows
+
+    def get_page_number(self, request):
+        """
+        ?page 번호 반환 (없으면 None)
+
+        Raises:
+            NotFound: 1 이상의 정수가 아닌 경우
+        """
+        page = request.query_params.get(self.page_query_param)
+        if page is None:
+            return None
+        try:
+            page = int(page)
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        if page < 1:
+            raise NotFound(self.invalid_page_message)
+        return page
+
+    def paginate_by_number(self, queryset, field_name, descending):
+        """번호 페이지 조회 (OFFSET, 정렬은 cursor 방식과 동일)"""
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{field_name}', f'{prefix}pk')
+        offset = (self.page_number - 1) * self.page_size
+        rows = list(queryset[offset:offset + self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.has_previous = self.page_number > 1
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        """다음 페이지 URL"""
+        if not self.has_next or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number is not None:
+            return replace_query_param(url, self.page_query_param, self.page_number + 1)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(False, self.page[-1])
+        )
+
+    def get_previous_link(self):
+        """이전 페이지 URL"""
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number is not None:
+            if self.page_number == 2:
+                return remove_query_param(url, self.page_query_param)
+            return replace_query_param(url, self.page_query_param, self.page_number - 1)
+        if not self.page:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(True, self.page[0])
+        )
+
+    def get_paginated_response(self, data):
+        """페이지네이션 응답 구성"""
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        """OpenAPI 응답 스키마"""
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,79 @@
+import re
+
+# 한글 음절 연속 구간 또는 영문/숫자 연속 구간
+TOKEN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+
+# 한글 음절 자모 (초성 19개, 중성 21개, 종성 27개 + 받침 없음)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', *'ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ']
+
+# 입력 순서대로 나눈 겹모음 / 겹받침 (예: 'ㅘ'는 'ㅗ' 다음 'ㅏ' 입력)
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+
+def is_hangul(token):
+    """한글 음절로 시작하는 토큰인지 확인"""
+    return bool(token) and '가' <= token[0] <= '힣'
+
+
+def decompose_hangul(text):
+    """
+    한글 음절을 입력 순서대로 자모 분해
+    - 입력 중인 글자도 접두어로 비교할 수 있도록 겹모음/겹받침까지 분리
+    - 한글 외 문자는 그대로 유지
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        str: 자모 분해 문자열 (예: '앋' -> 'ㅇㅏㄷ', '아두' -> 'ㅇㅏㄷㅜ')
+    """
+    jamo = []
+    for char in text:
+        if '가' <= char <= '힣':
+            offset = ord(char) - ord('가')
+            jamo.append(CHOSEONG[offset // 588])
+            jamo.append(JUNGSEONG[offset % 588 // 28])
+            jamo.append(JONGSEONG[offset % 28])
+        else:
+            jamo.append(char)
+    return ''.join(COMPOUND_JAMO.get(char, char) for char in ''.join(jamo))
+
+
+def tokenize(text):
+    """
+    검색 색인용 토큰 목록 반환
+    - 한글은 띄어쓰기/조사와 무관하게 찾을 수 있도록 2글자 단위(bigram)로 분리
+    - 한 글자 한글 단어와 영문/숫자 단어는 소문자 단어 그대로 사용
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        list: 토큰 목록 (예: '코딩 키트' -> ['코딩', '키트'], '아두이노' -> ['아두', '두이', '이노'])
+    """
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if is_hangul(word) and len(word) > 1:
+            tokens.extend(word[index:index + 2] for index in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def query_terms(text):
+    """
+    검색어를 (토큰, 접두어 검색 여부) 목록으로 변환
+    - 한글 bigram은 정확히 일치, 한 글자 한글과 영문/숫자 단어는 접두어로 검색
+    - 중복 토큰은 한 번만 사용
+    """
+    terms = []
+    for token in dict.fromkeys(tokenize(text)):
+        prefix = not (is_hangul(token) and len(token) == 2)
+        terms.append((token, prefix))
+    return terms
@@ -12,8 +12,10 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 from datetime import timedelta
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 load_dotenv()
 
@@ -52,12 +54,20 @@ INSTALLED_APPS = [
     "inquiries",
     "lessons",
     "outreach_inquiries",
+    "search",
 ]
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
-    )
+    ),
+    # 목록 API는 기본적으로 cursor 페이지네이션 (page_size 최대 100)
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.KeysetPagination",
+    "PAGE_SIZE": 10,
+    # 범위별 요청 수 제한 (로그인 사용자는 사용자별 / 비로그인은 IP별)
+    "DEFAULT_THROTTLE_RATES": {
+        "seat_hold": os.environ.get("SEAT_HOLD_THROTTLE_RATE", "20/hour"),
+    },
 }
 
 SIMPLE_JWT = {
@@ -99,10 +109,12 @@ CSRF_TRUSTED_ORIGINS = ["http://localhost:3000"]  # Next.js 프론트엔드 주
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # CORS 미들웨어를 최상단에 추가
     "django.middleware.security.SecurityMiddleware",
+    "config.file_serving.FileServingMiddleware",  # /static/, /media/ 파일 응답 (세션 / 인증 처리 전)
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.db_routers.ReplicaReadMiddleware",  # 조회 요청은 읽기 전용 복제본, 쓰기 직후에는 기본 DB
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -130,12 +142,117 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# POSTGRES_DB가 설정되면 PostgreSQL, 없으면 SQLite 사용 (테스트는 항상 SQLite)
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+POSTGRES_DB = os.environ.get("POSTGRES_DB")
+
+# 연결 재사용 방식
+# - "" (기본값): 요청 간 연결 유지 (DB_CONN_MAX_AGE초) + 재사용 전 연결 상태 확인
+# - "psycopg": Django 내장 psycopg 3 연결 풀 (psycopg[pool] 필요, 연결 유지 미사용)
+# - "pgbouncer": PgBouncer transaction pooling 호환 (서버 측 커서 미사용)
+DB_POOL = os.environ.get("DB_POOL", "")
+
+
+def postgres_database(host, port):
+    """PostgreSQL 연결 설정 생성"""
+    database = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": POSTGRES_DB,
+        "USER": os.environ.get("POSTGRES_USER", "postgres"),
+        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+        "HOST": host,
+        "PORT": port,
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", 5)),
+        },
     }
-}
+    if DB_POOL == "psycopg":
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"]["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+            "timeout": int(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        }
+    elif DB_POOL == "pgbouncer":
+        # transaction pooling에서는 트랜잭션 밖의 서버 측 커서(iterator)를 유지할 수 없음
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+    return database
+
+
+# 조회 요청에 사용하는 읽기 전용 복제본 DB 별칭 목록 (config.db_routers.ReplicaRouter)
+DATABASE_REPLICAS = []
+
+if POSTGRES_DB and not TESTING:
+    DATABASES = {
+        "default": postgres_database(
+            os.environ.get("POSTGRES_HOST", "localhost"),
+            os.environ.get("POSTGRES_PORT", "5432"),
+        ),
+    }
+    # 읽기 전용 복제본 (쉼표로 구분한 host 또는 host:port 목록)
+    for index, address in enumerate(filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(","))):
+        host, _, port = address.strip().partition(":")
+        alias = "replica" if index == 0 else f"replica_{index + 1}"
+        DATABASES[alias] = postgres_database(host, port or "5432")
+        DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+        DATABASE_REPLICAS.append(alias)
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+            # 트랜잭션 시작 시 쓰기 잠금 확보 (읽기 후 쓰기로 잠금을 올리다 즉시 실패하지 않고 timeout까지 대기)
+            "OPTIONS": {
+                "transaction_mode": "IMMEDIATE",
+                "timeout": 20,
+            },
+            # 파일 기반 테스트 DB (메모리 DB는 스레드 간 잠금 대기를 지원하지 않아 동시성 테스트 불가)
+            "TEST": {
+                "NAME": BASE_DIR / "test_db.sqlite3",
+            },
+        }
+    }
+    if TESTING:
+        # 라우터 테스트용 별도 복제본 DB (DATABASE_REPLICAS를 override한 테스트에서만 사용)
+        DATABASES["replica"] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db_replica.sqlite3",
+            "TEST": {
+                "NAME": BASE_DIR / "test_replica_db.sqlite3",
+            },
+        }
+
+# 쓰기 후 해당 사용자의 조회를 기본 DB로 고정하는 시간 (초, 복제 지연보다 길게 설정)
+DATABASE_REPLICA_STICKY_SECONDS = int(os.environ.get("DATABASE_REPLICA_STICKY_SECONDS", 15))
+
+DATABASE_ROUTERS = ["config.db_routers.ReplicaRouter"]
+
+
+# Cache
+# REDIS_URL이 설정되면 Redis, 없으면 로컬 메모리 캐시 사용 (개발/테스트)
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# 비로그인 공개 API 응답 캐시 유지 시간 (초)
+API_CACHE_TIMEOUT = int(os.environ.get("API_CACHE_TIMEOUT", 300))
 
 
 # Password validation
@@ -180,6 +297,56 @@ STATICFILES_DIRS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# 업로드 파일 저장소 (같은 내용은 한 번만 저장, 업로드 시 미디어 라이브러리 색인 갱신)
+STORAGES = {
+    "default": {
+        "BACKEND": "config.storage.MediaLibraryStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# 운영 환경은 collectstatic 시 파일명에 내용 해시를 붙여 영구 캐시 (staticfiles.json manifest 필요)
+if not DEBUG and not TESTING:
+    STORAGES["staticfiles"]["BACKEND"] = "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+
+# 정적 / 업로드 파일 응답 (config.file_serving.FileServingMiddleware)
+# - 웹 서버가 /static/, /media/를 직접 응답하면 SERVE_FILES=0
+SERVE_FILES = os.environ.get("SERVE_FILES", "1") == "1"
+# 파일 본문 전송을 웹 서버에 위임: "x-accel-redirect"(nginx) / "x-sendfile"(Apache mod_xsendfile 등) / 없음
+FILE_SENDFILE_BACKEND = os.environ.get("FILE_SENDFILE_BACKEND") or None
+# X-Accel-Redirect 내부 경로 접두어 (nginx internal location)
+FILE_SENDFILE_PREFIX = os.environ.get("FILE_SENDFILE_PREFIX", "/_protected/")
+# 해시 파일명이 아닌 파일의 캐시 시간 (초, 이후 ETag로 재검증)
+STATIC_CACHE_SECONDS = int(os.environ.get("STATIC_CACHE_SECONDS", 3600))
+MEDIA_CACHE_SECONDS = int(os.environ.get("MEDIA_CACHE_SECONDS", 3600))
+
+# 관리자 이미지 선택기(미디어 라이브러리)에 노출할 MEDIA_ROOT 하위 폴더
+MEDIA_LIBRARY_DIRS = ("uploads", "products", "class_thumbnails")
+
+# 내용 주소 기반(blobs/ab/cd/<해시>.<확장자>)으로 저장할 업로드 폴더 (config.storage)
+MEDIA_CONTENT_ADDRESSED_DIRS = MEDIA_LIBRARY_DIRS
+
+# S3 호환 저장소 (AWS_STORAGE_BUCKET_NAME 설정 시 업로드 파일을 S3 / MinIO에 저장, 없으면 MEDIA_ROOT)
+# - 자격 증명은 boto3 기본 방식 (AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY 환경 변수, IAM 역할 등)
+AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME")
+AWS_S3_ENDPOINT_URL = os.environ.get("AWS_S3_ENDPOINT_URL")
+AWS_S3_REGION_NAME = os.environ.get("AWS_S3_REGION_NAME")
+AWS_S3_CUSTOM_DOMAIN = os.environ.get("AWS_S3_CUSTOM_DOMAIN")
+# 브라우저 직접 업로드 presigned URL 유효 시간 (초)
+AWS_S3_PRESIGNED_EXPIRES = int(os.environ.get("AWS_S3_PRESIGNED_EXPIRES", 600))
+# 브라우저 직접 업로드 최대 크기 (bytes)
+MEDIA_DIRECT_UPLOAD_MAX_SIZE = int(os.environ.get("MEDIA_DIRECT_UPLOAD_MAX_SIZE", 20 * 1024 * 1024))
+
+if AWS_STORAGE_BUCKET_NAME:
+    STORAGES["default"]["BACKEND"] = "config.storage.S3MediaStorage"
+
+# 상품 이미지 / 수업 썸네일 rendition (config.images)
+# - 목록 그리드(100~400px)의 고해상도 화면까지 고려한 너비
+IMAGE_RENDITION_WIDTHS = (200, 400, 800)
+IMAGE_RENDITION_FORMATS = ("avif", "webp", "jpeg")
+
 # CKEditor settings
 CKEDITOR_UPLOAD_PATH = "uploads/"
 CKEDITOR_IMAGE_BACKEND = "pillow"
@@ -230,10 +397,39 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"  # For developm
 DEFAULT_FROM_EMAIL = "noreply@aimakerlab.com"
 FRONTEND_URL = "http://localhost:3000"
 
+# 수업 좌석 임시 예약 유지 시간 (분)
+SEAT_HOLD_MINUTES = int(os.environ.get("SEAT_HOLD_MINUTES", 10))
+# 예약당 최대 좌석 수 / 사용자(비로그인은 IP)별 동시에 유지할 수 있는 예약 수
+SEAT_HOLD_MAX_SEATS = int(os.environ.get("SEAT_HOLD_MAX_SEATS", 30))
+SEAT_HOLD_MAX_ACTIVE = int(os.environ.get("SEAT_HOLD_MAX_ACTIVE", 2))
+
+# Celery 작업 큐 (config/celery.py)
+# - 테스트 중이거나 개발 환경(DEBUG)에서 브로커(CELERY_BROKER_URL, 없으면 REDIS_URL)가 없으면 작업을 즉시 실행 (eager 모드)
+# - 운영 환경은 브로커 필수 (요청 안에서 작업이 실행되거나 주기 작업이 빠지지 않도록 시작 시 오류)
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", REDIS_URL)
+CELERY_TASK_ALWAYS_EAGER = TESTING or (DEBUG and not CELERY_BROKER_URL)
+if not CELERY_BROKER_URL and not CELERY_TASK_ALWAYS_EAGER:
+    raise ImproperlyConfigured("운영 환경(DEBUG=False)에서는 CELERY_BROKER_URL 또는 REDIS_URL 설정이 필요합니다.")
+CELERY_TASK_EAGER_PROPAGATES = TESTING
+CELERY_TASK_IGNORE_RESULT = True
+# 작업 완료 후 ack (워커 비정상 종료 시 재전달), 긴 작업이 다른 작업을 붙잡지 않도록 1개씩 가져옴
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TIMEZONE = TIME_ZONE
+# 주기 작업 (celery beat)
+CELERY_BEAT_SCHEDULE = {
+    "release-expired-seat-holds": {
+        "task": "outreach_inquiries.tasks.release_expired_holds",
+        "schedule": 60,
+    },
+}
+
 # Kakao OAuth settings
 KAKAO_CLIENT_ID = os.environ.get("KAKAO_CLIENT_ID")
 KAKAO_CLIENT_SECRET = os.environ.get("KAKAO_CLIENT_SECRET")
 KAKAO_REDIRECT_URI = os.environ.get("KAKAO_REDIRECT_URI")
+# 외부 OAuth 서버 요청 제한 시간 (초, 응답이 없을 때 요청 처리 스레드가 묶이지 않도록)
+OAUTH_REQUEST_TIMEOUT = int(os.environ.get("OAUTH_REQUEST_TIMEOUT", 5))
 
 # Firebase 설정
 FIREBASE_SERVICE_ACCOUNT_PATH = os.path.join(BASE_DIR, "firebase-service-account.json")
@@ -0,0 +1,328 @@
+import base64
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import tempfile
+from urllib.parse import quote
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage, Storage
+from django.utils.functional import cached_property
+from config.images import RENDITION_DIR
+
+# 파일 해시 계산 시 한 번에 읽는 크기 (파일 전체를 메모리에 올리지 않음)
+HASH_CHUNK_SIZE = 64 * 1024
+
+# 내용 주소 기반 파일(blob)을 저장하는 MEDIA_ROOT 하위 폴더
+BLOB_DIR = 'blobs'
+
+# blob은 경로가 바뀌지 않는 한 내용도 바뀌지 않으므로 브라우저 / CDN에 영구 캐시
+BLOB_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# blob 경로 패턴 (blobs/ab/cd/<SHA-256 해시>.<확장자>, 본문 HTML에서 찾을 때도 사용)
+BLOB_PATH_PATTERN = re.compile(
+    r'blobs/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(?:\.[a-z0-9]+)?(?![\w.-])'
+)
+
+
+def file_hash(file):
+    """파일 객체의 SHA-256 해시 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def copy_and_hash(content, destination):
+    """
+    업로드 내용을 청크 단위로 복사하면서 SHA-256 해시 계산
+
+    Returns:
+        tuple: (SHA-256 해시, 파일 크기)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in content.chunks():
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        digest.update(chunk)
+        size += len(chunk)
+        destination.write(chunk)
+    return digest.hexdigest(), size
+
+
+def blob_name(content_hash, extension=''):
+    """
+    내용 해시로 blob 저장 경로 생성 (폴더당 파일 수를 줄이기 위해 해시 앞 4자리로 2단계 분산)
+    - 예: ('ab12cd...', '.JPG') -> 'blobs/ab/12/ab12cd....jpg'
+    """
+    return posixpath.join(
+        BLOB_DIR, content_hash[:2], content_hash[2:4], content_hash + extension.lower()
+    )
+
+
+def is_blob_path(path):
+    """내용 주소 기반 blob 경로인지 확인"""
+    return bool(path) and BLOB_PATH_PATTERN.fullmatch(path) is not None
+
+
+def is_content_addressed(name):
+    """저장 시 blob으로 저장할 경로인지 확인 (MEDIA_CONTENT_ADDRESSED_DIRS 하위 파일, rendition 폴더 제외)"""
+    parts = name.replace('\\', '/').split('/')
+    return len(parts) > 1 and parts[0] in settings.MEDIA_CONTENT_ADDRESSED_DIRS and RENDITION_DIR not in parts
+
+
+class ContentAddressedStorageMixin:
+    """
+    내용 주소 기반(content-addressed) 저장 공통 처리
+    - MEDIA_CONTENT_ADDRESSED_DIRS 하위로 저장하는 파일(상품 이미지, 수업 썸네일, CKEditor 업로드)은
+      내용 해시 경로(blobs/ab/cd/<해시>.<확장자>)에 한 번만 저장
+      (같은 내용은 파일명과 관계없이 같은 경로 / URL → 저장 용량과 CDN 캐시 미스 감소)
+    - 저장한 blob은 참조 수 테이블(products.MediaBlob)에, 라이브러리 이미지는 색인(products.MediaAsset)에 등록
+    - blob 폴더 하위 파일(rendition, CKEditor 썸네일)은 이름이 원본 내용에서 정해지므로 이미 있으면 다시 쓰지 않음
+    - 파일 삭제 시 색인에서도 제거
+    - 저장소별로 _save_blob(name, content) 구현 필요
+    """
+    def get_available_name(self, name, max_length=None):
+        """blob 폴더 하위 경로는 이름 변경 없이 그대로 사용"""
+        if name.replace('\\', '/').startswith(BLOB_DIR + '/'):
+            return name
+        return super().get_available_name(name, max_length=max_length)
+
+    def _save(self, name, content):
+        from products.models import MediaAsset, MediaBlob
+
+        name = name.replace('\\', '/')
+        if name.startswith(BLOB_DIR + '/') and self.exists(name):
+            return name
+        if not is_content_addressed(name):
+            return super()._save(name, content)
+
+        stored, content_hash, size = self._save_blob(name, content)
+        MediaBlob.register(stored, content_hash, size)
+        if MediaAsset.is_library_path(name) and not MediaAsset.objects.filter(path=stored).exists():
+            MediaAsset.record(stored, name=posixpath.basename(name))
+        return stored
+
+    def delete(self, name):
+        from products.models import MediaAsset
+
+        super().delete(name)
+        MediaAsset.objects.filter(path=name).delete()
+
+
+class MediaLibraryStorage(ContentAddressedStorageMixin, FileSystemStorage):
+    """
+    로컬 디스크 업로드 파일 저장소 (MEDIA_ROOT)
+    - 내용 주소 기반 저장은 ContentAddressedStorageMixin 참고
+    """
+    def _save_blob(self, name, content):
+        """
+        업로드 내용을 청크 단위로 임시 파일에 쓰면서 해시를 계산한 뒤 blob 경로로 이동
+        - 같은 내용의 blob이 이미 있으면 임시 파일만 삭제
+
+        Returns:
+            tuple: (blob 경로, SHA-256 해시, 파일 크기)
+        """
+        temp_dir = self.path(posixpath.join(BLOB_DIR, 'tmp'))
+        os.makedirs(temp_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                content_hash, size = copy_and_hash(content, temp_file)
+
+            stored = blob_name(content_hash, posixpath.splitext(name)[1])
+            full_path = self.path(stored)
+            if os.path.exists(full_path):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                # 같은 파일 시스템 안의 이동이므로 원자적 (동시 업로드도 같은 내용으로 덮어씀)
+                os.replace(temp_path, full_path)
+                # mkstemp는 소유자 전용 권한(0600)으로 만들므로 권한 지정 필수
+                os.chmod(full_path, self.file_permissions_mode or 0o644)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return stored, content_hash, size
+
+    def file_stat(self, name):
+        """파일 크기와 수정 시각 (ns)"""
+        stat = os.stat(self.path(name))
+        return stat.st_size, stat.st_mtime_ns
+
+
+class S3Storage(Storage):
+    """
+    S3 호환 오브젝트 저장소 (AWS S3, MinIO 등)
+    - 설정: AWS_STORAGE_BUCKET_NAME, AWS_S3_ENDPOINT_URL(MinIO 등), AWS_S3_REGION_NAME, AWS_S3_CUSTOM_DOMAIN(CDN)
+    - 자격 증명은 boto3 기본 방식 사용 (AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY 환경 변수, IAM 역할 등)
+    - 파일 URL은 버킷을 공개 읽기로 두거나 CDN(AWS_S3_CUSTOM_DOMAIN)을 앞에 두는 구성을 전제로 함
+    """
+    def __init__(self, bucket_name=None, endpoint_url=None, region_name=None, custom_domain=None):
+        self.bucket_name = bucket_name or settings.AWS_STORAGE_BUCKET_NAME
+        self.endpoint_url = endpoint_url or settings.AWS_S3_ENDPOINT_URL
+        self.region_name = region_name or settings.AWS_S3_REGION_NAME
+        self.custom_domain = custom_domain or settings.AWS_S3_CUSTOM_DOMAIN
+
+    @cached_property
+    def client(self):
+        """boto3 S3 클라이언트 (스레드 간 공유 가능)"""
+        return boto3.client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            region_name=self.region_name,
+            config=Config(
+                signature_version='s3v4',
+                # MinIO 등은 가상 호스트 방식 버킷 주소를 지원하지 않으므로 endpoint 지정 시 경로 방식 사용
+                s3={'addressing_style': 'path' if self.endpoint_url else 'auto'},
+                # presigned URL에 SDK 기본 체크섬(CRC32)이 붙지 않도록 필요한 경우에만 계산
+                request_checksum_calculation='when_required',
+                response_checksum_validation='when_required',
+            ),
+        )
+
+    @staticmethod
+    def _is_missing(error):
+        """객체 없음 오류인지 확인"""
+        return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound')
+
+    def _head(self, name):
+        """객체 메타데이터 조회 (없으면 FileNotFoundError)"""
+        try:
+            return self.client.head_object(Bucket=self.bucket_name, Key=name, ChecksumMode='ENABLED')
+        except ClientError as e:
+            if self._is_missing(e):
+                raise FileNotFoundError(name) from e
+            raise
+
+    @staticmethod
+    def object_args(name):
+        """업로드 시 객체 속성 (Content-Type, blob은 영구 캐시)"""
+        args = {'ContentType': mimetypes.guess_type(name)[0] or 'application/octet-stream'}
+        if is_blob_path(name):
+            args['CacheControl'] = BLOB_CACHE_CONTROL
+        return args
+
+    def _open(self, name, mode='rb'):
+        file = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        try:
+            self.client.download_fileobj(self.bucket_name, name, file)
+        except ClientError as e:
+            file.close()
+            if self._is_missing(e):
+                raise FileNotFoundError(name) from e
+            raise
+        file.seek(0)
+        return File(file, name=name)
+
+    def _save(self, name, content):
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        self.client.upload_fileobj(content, self.bucket_name, name, ExtraArgs=self.object_args(name))
+        return name
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket_name, Key=name)
+
+    def exists(self, name):
+        try:
+            self._head(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def listdir(self, path):
+        prefix = path.strip('/') + '/' if path.strip('/') else ''
+        directories, files = [], []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter='/'):
+            directories += [item['Prefix'][len(prefix):].rstrip('/') for item in page.get('CommonPrefixes', [])]
+            files += [item['Key'][len(prefix):] for item in page.get('Contents', [])]
+        return directories, files
+
+    def size(self, name):
+        return self._head(name)['ContentLength']
+
+    def get_modified_time(self, name):
+        return self._head(name)['LastModified']
+
+    def file_stat(self, name):
+        """파일 크기와 수정 시각 (ns)"""
+        head = self._head(name)
+        return head['ContentLength'], int(head['LastModified'].timestamp()) * 10**9
+
+    def url(self, name):
+        key = quote(name.replace('\\', '/'))
+        if self.custom_domain:
+            return f'https://{self.custom_domain}/{key}'
+        return f'{self.client.meta.endpoint_url}/{self.bucket_name}/{key}'
+
+
+class S3MediaStorage(ContentAddressedStorageMixin, S3Storage):
+    """
+    S3 호환 업로드 파일 저장소
+    - 내용 주소 기반 저장은 ContentAddressedStorageMixin 참고
+    - 브라우저가 앱 서버를 거치지 않고 올리도록 blob 경로의 presigned PUT URL 발급
+    """
+    def _save_blob(self, name, content):
+        """
+        업로드 내용을 임시 파일(작으면 메모리)에 쓰면서 해시를 계산한 뒤 같은 내용이 없을 때만 업로드
+
+        Returns:
+            tuple: (blob 경로, SHA-256 해시, 파일 크기)
+        """
+        with tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE) as temp_file:
+            content_hash, size = copy_and_hash(content, temp_file)
+            stored = blob_name(content_hash, posixpath.splitext(name)[1])
+            if not self.exists(stored):
+                temp_file.seek(0)
+                self.client.upload_fileobj(
+                    temp_file, self.bucket_name, stored, ExtraArgs=self.object_args(stored)
+                )
+        return stored, content_hash, size
+
+    def presigned_upload(self, name, content_hash, size):
+        """
+        브라우저 직접 업로드용 presigned PUT 요청 정보
+        - 내용 해시(x-amz-checksum-sha256)와 크기를 서명에 포함하여 다른 내용 / 크기의 업로드는 S3가 거부
+
+        Returns:
+            dict: {'method', 'url', 'headers'} (headers는 PUT 요청에 그대로 포함)
+        """
+        checksum = base64.b64encode(bytes.fromhex(content_hash)).decode()
+        args = self.object_args(name)
+        url = self.client.generate_presigned_url(
+            'put_object',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': name,
+                'ContentLength': size,
+                'ChecksumSHA256': checksum,
+                **args,
+            },
+            ExpiresIn=settings.AWS_S3_PRESIGNED_EXPIRES,
+            HttpMethod='PUT',
+        )
+        headers = {'Content-Type': args['ContentType'], 'x-amz-checksum-sha256': checksum}
+        if 'CacheControl' in args:
+            headers['Cache-Control'] = args['CacheControl']
+        return {'method': 'PUT', 'url': url, 'headers': headers}
+
+    def uploaded_checksum(self, name):
+        """
+        업로드된 객체의 SHA-256 해시 (S3가 체크섬을 저장하지 않았으면 None)
+
+        Raises:
+            FileNotFoundError: 객체가 없는 경우
+        """
+        checksum = self._head(name).get('ChecksumSHA256')
+        if not checksum or '-' in checksum:
+            return None
+        return base64.b64decode(checksum).hex()
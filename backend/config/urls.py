@@ -1,7 +1,5 @@
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
 from django.views.decorators.cache import never_cache
 from ckeditor_uploader import views as ckeditor_views
 from django.contrib.auth.decorators import login_required
@@ -12,14 +10,13 @@ urlpatterns = [
     path('api/v1/auth/', include('accounts.urls')),
     path('api/v1/inquiries/', include('inquiries.urls')),
     path('api/v1/lessons/', include('lessons.urls')),
+    path('api/v1/search/', include('search.urls')),
     path('', include('outreach_inquiries.urls')),
     path('ckeditor/upload/', login_required(ckeditor_views.upload), name='ckeditor_upload'),
     path('ckeditor/browse/', never_cache(login_required(ckeditor_views.browse)), name='ckeditor_browse'),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+# /static/, /media/ 파일은 config.file_serving.FileServingMiddleware에서 응답
 
 ### api/v1/auth/login
 ### data.tokens.access 
\ No newline at end of file
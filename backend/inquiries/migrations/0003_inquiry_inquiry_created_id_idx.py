@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inquiries', '0002_inquiry_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(fields=['created_at', 'id'], name='inquiry_created_id_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from testing.query_plans import QueryPlanTestMixin
 from .models import Inquiry, InquiryType
 
 User = get_user_model()
@@ -249,3 +250,64 @@ class InquiryAPITest(TestCase):
         
         # 삭제 확인
         self.assertEqual(Inquiry.objects.filter(pk=self.inquiry.pk).count(), 0)
+
+
+class InquiryPageNumberTest(TestCase):
+    """
+    견적 문의 목록 번호 페이지 테스트 클래스
+
+    프론트엔드의 ?page=N 요청이 해당 번호의 페이지를 반환하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        for index in range(12):
+            Inquiry.objects.create(
+                title=f'문의 {index}',
+                description='문의 내용',
+                inquiry_type=InquiryType.PRODUCT,
+                requester_name='김교사'
+            )
+        self.expected = list(Inquiry.objects.order_by('-created_at', '-id').values_list('title', flat=True))
+
+    def test_page_number(self):
+        """page=2 요청 테스트 함수"""
+        url = reverse('inquiries:inquiry-list')
+        response = self.client.get(url, {'page': 2, 'page_size': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual([item['title'] for item in response.data['results']], self.expected[5:10])
+
+        response = self.client.get(url, {'page': 3, 'page_size': 5})
+        self.assertEqual([item['title'] for item in response.data['results']], self.expected[10:])
+        self.assertIsNone(response.data['next'])
+
+
+class InquiryQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """
+    견적 문의 목록 API 실행 계획 테스트 클래스
+
+    10만 건 이상의 문의에서 목록 / 다음 페이지 쿼리가 인덱스를 사용하는지 테스트합니다.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """문의 데이터 생성 및 통계 갱신"""
+        cls.seed(Inquiry, [
+            Inquiry(
+                title=f'문의 {index}',
+                description='문의 내용',
+                inquiry_type=InquiryType.PRODUCT,
+                requester_name='김교사'
+            )
+            for index in range(200)
+        ])
+        cls.analyze()
+
+    def test_list_pages(self):
+        """첫 페이지와 다음 페이지 실행 계획 테스트 함수"""
+        client = APIClient()
+        tables = [Inquiry._meta.db_table]
+        response = self.assertIndexedQueries(tables, client.get, reverse('inquiries:inquiry-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.assertIndexedQueries(tables, client.get, response.data['next'])
+        self.assertEqual(len(response.data['results']), 10)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lessoninquiry',
+            index=models.Index(fields=['created_at', 'id'], name='lesson_inquiry_created_id_idx'),
+        ),
+    ]
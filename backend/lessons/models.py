@@ -55,6 +55,10 @@ class LessonInquiry(models.Model):
         verbose_name = '수업 문의'
         verbose_name_plural = '수업 문의 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 목록 cursor 페이지네이션 (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='lesson_inquiry_created_id_idx'),
+        ]
 
     def __str__(self):
         """문의 객체의 문자열 표현을 반환합니다."""
@@ -1,3 +1,118 @@
-from django.test import TestCase
+import time
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from config.db_routers import STICKY_COOKIE_NAME
+from testing.query_plans import QueryPlanTestMixin
+from .models import LessonInquiry, LessonInquiryType
 
-# Create your tests here.
+User = get_user_model()
+
+
+class LessonInquiryQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """
+    수업 문의 목록 API 실행 계획 테스트 클래스
+
+    10만 건 이상의 문의에서 목록 / 다음 페이지 쿼리가 인덱스를 사용하는지 테스트합니다.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """문의 데이터 생성 및 통계 갱신"""
+        inquiry_types = [key for key, _ in LessonInquiryType.choices]
+        cls.seed(LessonInquiry, [
+            LessonInquiry(
+                title=f'수업 문의 {index}',
+                description='문의 내용',
+                inquiry_type=inquiry_types[index % len(inquiry_types)],
+                requester_name='김교사'
+            )
+            for index in range(200)
+        ])
+        cls.analyze()
+
+    def test_list_pages(self):
+        """첫 페이지와 다음 페이지 실행 계획 테스트 함수"""
+        client = APIClient()
+        tables = [LessonInquiry._meta.db_table]
+        response = self.assertIndexedQueries(tables, client.get, reverse('lessons:lesson-inquiry-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.assertIndexedQueries(tables, client.get, response.data['next'])
+        self.assertEqual(len(response.data['results']), 10)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTest(TestCase):
+    """
+    읽기 전용 복제본 라우팅 테스트 클래스
+
+    기본 DB와 복제본을 별도 SQLite DB로 구성하여
+    조회는 복제본, 쓰기 직후의 조회는 기본 DB를 사용하는지 테스트합니다.
+    """
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('lessons:lesson-inquiry-list')
+        self.user = User.objects.create_user(
+            username='teacher',
+            email='teacher@example.com',
+            password='password123'
+        )
+        self.inquiry_data = {
+            'title': '방과후 수업 문의',
+            'description': '방과후 코딩 수업 문의드립니다.',
+            'inquiry_type': LessonInquiryType.choices[0][0],
+            'requester_name': '김교사',
+        }
+        # 복제본에는 이미 복제된 문의만, 기본 DB에는 아직 복제되지 않은 문의가 있는 상태
+        LessonInquiry.objects.using('replica').create(**{**self.inquiry_data, 'title': '복제된 문의'})
+        LessonInquiry.objects.create(**{**self.inquiry_data, 'title': '복제 전 문의'})
+
+    def _titles(self):
+        """목록 API의 문의 제목 목록 반환 함수"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['title'] for item in response.data['results']]
+
+    def test_reads_use_replica(self):
+        """비로그인 / 로그인 조회 모두 복제본을 사용하는지 테스트 함수"""
+        self.assertEqual(self._titles(), ['복제된 문의'])
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self._titles(), ['복제된 문의'])
+
+    def test_write_sticks_to_primary(self):
+        """쓰기 후에는 쿠키로 기본 DB에서 조회하는지 테스트 함수"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse('lessons:lesson-inquiry-create'),
+            {**self.inquiry_data, 'title': '새 문의'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn(STICKY_COOKIE_NAME, response.cookies)
+        self.assertFalse(LessonInquiry.objects.using('replica').filter(title='새 문의').exists())
+
+        self.assertEqual(self._titles(), ['새 문의', '복제 전 문의'])
+
+    def test_expired_or_forged_cookie_uses_replica(self):
+        """만료되었거나 서명이 없는 쿠키는 무시하는지 테스트 함수"""
+        signer = signing.get_cookie_signer(salt=STICKY_COOKIE_NAME)
+        self.client.cookies[STICKY_COOKIE_NAME] = signer.sign(str(time.time() - 1))
+        self.assertEqual(self._titles(), ['복제된 문의'])
+
+        self.client.cookies[STICKY_COOKIE_NAME] = str(time.time() + 60)
+        self.assertEqual(self._titles(), ['복제된 문의'])
+
+        self.client.cookies[STICKY_COOKIE_NAME] = signer.sign(str(time.time() + 60))
+        self.assertEqual(self._titles(), ['복제 전 문의'])
+
+    def test_failed_write_not_sticky(self):
+        """저장되지 않은 요청은 쿠키를 발급하지 않는지 테스트 함수"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(reverse('lessons:lesson-inquiry-create'), {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn(STICKY_COOKIE_NAME, response.cookies)
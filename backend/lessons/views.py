@@ -3,17 +3,18 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
-from rest_framework.pagination import PageNumberPagination
 from django.db.models import Q
+from config.pagination import KeysetPagination
 
 from .models import LessonInquiry
 from .serializers import LessonInquirySerializer
 
 
-class LessonInquiryPagination(PageNumberPagination):
+class LessonInquiryPagination(KeysetPagination):
     """
     수업 문의 목록 페이지네이션 클래스
     
+    (created_at, id) 기준 cursor 방식으로 깊은 페이지도 일정한 속도로 조회합니다.
     페이지당 항목 수와 페이지 크기 매개변수를 설정합니다.
     """
     page_size = 10
@@ -176,6 +176,7 @@ class InternalClassAdmin(admin.ModelAdmin):
     readonly_fields = [
         'created_at', 
         'updated_at',
+        'held_seats',
         'get_enrollment_rate',
         'get_discounted_price',
         'is_full',
@@ -200,6 +201,7 @@ class InternalClassAdmin(admin.ModelAdmin):
                 'target_grade',
                 'max_students',
                 'current_students',
+                'held_seats',
                 'get_enrollment_rate'
             )
         }),
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OutreachInquiriesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'outreach_inquiries'
+
+    def ready(self):
+        """앱이 시작될 때 시그널 등록"""
+        from . import signals  # noqa: F401
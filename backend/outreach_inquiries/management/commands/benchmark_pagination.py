@@ -0,0 +1,103 @@
+import random
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+from accounts.models import User
+from outreach_inquiries.models import OutreachInquiry
+from outreach_inquiries.serializers import OutreachInquiryListSerializer
+from outreach_inquiries.views import OutreachInquiryViewSet
+
+
+class Command(BaseCommand):
+    """
+    문의 목록 페이지네이션 메모리/응답 시간 측정 명령어
+    """
+    help = '임시 문의 데이터를 생성해 전체 직렬화, cursor 페이지, 스트리밍 내보내기의 최대 메모리와 시간을 측정합니다 (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[10000, 100000],
+            help='측정용으로 생성할 문의 수 목록 (기본값: 10000 100000)',
+        )
+
+    def handle(self, *args, **options):
+        """측정 메인 로직 (행 수별로 데이터를 만들고 롤백)"""
+        for rows in options['rows']:
+            with transaction.atomic():
+                admin = User.objects.create_user(
+                    username='benchmark-admin',
+                    email='benchmark-admin@example.com',
+                    password='benchmark',
+                    is_staff=True
+                )
+                self.create_inquiries(rows)
+                self.stdout.write(f'문의 {rows:,}건')
+                for label, func in [
+                    ('전체 직렬화 (기존)', self.serialize_all),
+                    ('첫 페이지', lambda: self.request('list', {})),
+                    ('깊은 페이지', lambda: self.request('list', {'cursor': self.deep_cursor})),
+                    ('전체 내보내기 (스트리밍)', lambda: self.request('export', {}, user=admin)),
+                ]:
+                    elapsed, peak = self.measure(func)
+                    self.stdout.write(f'  {label}: {elapsed:.1f}ms, 최대 메모리 {peak / 1024 / 1024:.2f}MB')
+                # 측정용 데이터는 저장하지 않음
+                transaction.set_rollback(True)
+
+    def create_inquiries(self, count):
+        """측정용 문의 데이터 일괄 생성"""
+        course_keys = [key for key, _ in OutreachInquiry.COURSE_TYPE_CHOICES]
+        OutreachInquiry.objects.bulk_create(
+            (
+                OutreachInquiry(
+                    title=f'측정용 문의 {index}',
+                    requester_name='측정',
+                    course_type=random.choice(course_keys),
+                    student_count=random.randint(1, 100),
+                )
+                for index in range(count)
+            ),
+            batch_size=5000
+        )
+        # 목록 중간 지점의 cursor (깊은 페이지 측정용)
+        pagination = OutreachInquiryViewSet.pagination_class()
+        pagination.field = OutreachInquiry._meta.get_field('created_at')
+        middle = OutreachInquiry.objects.order_by('-created_at', '-id')[count // 2]
+        self.deep_cursor = pagination.encode_cursor(False, middle)
+
+    def serialize_all(self):
+        """페이지네이션 도입 전처럼 전체 목록을 한 번에 직렬화"""
+        data = OutreachInquiryListSerializer(
+            OutreachInquiry.objects.order_by('-created_at'), many=True
+        ).data
+        assert len(data) > 0
+
+    def request(self, action, params, user=None):
+        """목록 API 호출 (스트리밍 응답은 끝까지 소비)"""
+        view = OutreachInquiryViewSet.as_view({'get': action})
+        request = APIRequestFactory().get(
+            f'/api/v1/outreach-inquiries/{action}/', params, SERVER_NAME='localhost'
+        )
+        if user is not None:
+            force_authenticate(request, user=user)
+        response = view(request)
+        assert response.status_code == 200
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        else:
+            response.render()
+
+    def measure(self, func):
+        """실행 시간(ms)과 tracemalloc 최대 메모리(bytes) 반환"""
+        tracemalloc.start()
+        started = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - started) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
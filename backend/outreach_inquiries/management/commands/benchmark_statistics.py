@@ -0,0 +1,83 @@
+import random
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+from config.cache import bump_cache_version
+from outreach_inquiries.models import OutreachInquiry, InquiryStatsSnapshot
+from outreach_inquiries.views import OutreachInquiryViewSet
+
+
+class Command(BaseCommand):
+    """
+    문의 통계 API 응답 시간 측정 명령어
+    """
+    help = '임시 문의 데이터를 생성해 statistics API 응답 시간을 측정합니다 (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100000,
+            help='측정용으로 생성할 문의 수 (기본값: 100000)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='API 호출 반복 횟수 (기본값: 20)',
+        )
+
+    def handle(self, *args, **options):
+        """응답 시간 측정 메인 로직"""
+        with transaction.atomic():
+            self.create_inquiries(options['rows'])
+            timings = self.measure(options['repeat'])
+            # 측정용 데이터는 저장하지 않음
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"문의 {options['rows']:,}건 / {options['repeat']}회 호출: "
+            f"중앙값 {statistics.median(timings):.1f}ms, "
+            f"최소 {min(timings):.1f}ms, 최대 {max(timings):.1f}ms"
+        )
+
+    def create_inquiries(self, count):
+        """측정용 문의 데이터 일괄 생성"""
+        status_keys = [key for key, _ in OutreachInquiry.STATUS_CHOICES]
+        course_keys = [key for key, _ in OutreachInquiry.COURSE_TYPE_CHOICES]
+
+        self.stdout.write(f'측정용 문의 {count:,}건 생성 중...')
+        OutreachInquiry.objects.bulk_create(
+            (
+                OutreachInquiry(
+                    status=random.choice(status_keys),
+                    course_type=random.choice(course_keys),
+                    student_count=random.randint(1, 100),
+                )
+                for _ in range(count)
+            ),
+            batch_size=5000
+        )
+        # bulk_create는 시그널을 발생시키지 않으므로 집계를 직접 재계산
+        InquiryStatsSnapshot.rebuild()
+
+    def measure(self, repeat):
+        """
+        statistics API를 반복 호출하여 응답 시간(ms) 목록 반환
+        - 매 호출 전 'inquiries' 캐시 그룹 버전을 올려 캐시 적중이 아닌 집계 시간을 측정
+        """
+        factory = APIRequestFactory()
+        view = OutreachInquiryViewSet.as_view({'get': 'statistics'})
+        timings = []
+
+        for _ in range(repeat):
+            bump_cache_version('inquiries')
+            request = factory.get('/api/v1/outreach-inquiries/statistics/', SERVER_NAME='localhost')
+            started = time.perf_counter()
+            response = view(request)
+            timings.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200
+
+        return timings
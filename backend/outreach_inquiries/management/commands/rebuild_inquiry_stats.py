@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from outreach_inquiries.models import InquiryStatsSnapshot
+
+
+class Command(BaseCommand):
+    """
+    문의 통계 집계 재계산 명령어
+    """
+    help = '코딩 출강 교육 문의 통계 집계(InquiryStatsSnapshot)를 원본 데이터로 다시 계산합니다'
+
+    def handle(self, *args, **options):
+        """통계 집계 재계산 메인 로직"""
+        self.stdout.write('문의 통계 집계 재계산 중...')
+        bucket_count = InquiryStatsSnapshot.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'{bucket_count}개 집계 행을 생성했습니다.')
+        )
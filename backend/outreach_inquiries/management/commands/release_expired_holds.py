@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from outreach_inquiries.models import SeatHold
+
+
+class Command(BaseCommand):
+    """
+    만료된 좌석 임시 예약 해제 명령어
+    """
+    help = '만료된 수업 좌석 임시 예약(SeatHold)을 일괄 해제합니다 (cron 등으로 주기 실행)'
+
+    def handle(self, *args, **options):
+        """만료 예약 해제 메인 로직"""
+        released_count = SeatHold.release_expired()
+        self.stdout.write(
+            self.style.SUCCESS(f'{released_count}개 임시 예약을 해제했습니다.')
+        )
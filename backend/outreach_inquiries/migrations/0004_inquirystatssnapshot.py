@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:20
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def build_initial_snapshot(apps, schema_editor):
+    """기존 문의 데이터로 통계 집계 초기화"""
+    OutreachInquiry = apps.get_model('outreach_inquiries', 'OutreachInquiry')
+    InquiryStatsSnapshot = apps.get_model('outreach_inquiries', 'InquiryStatsSnapshot')
+
+    rows = (
+        OutreachInquiry.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('day', 'status', 'course_type')
+        .annotate(inquiry_count=Count('id'), student_sum=Sum('student_count'))
+    )
+    InquiryStatsSnapshot.objects.bulk_create(
+        InquiryStatsSnapshot(
+            day=row['day'],
+            status=row['status'],
+            course_type=row['course_type'],
+            inquiry_count=row['inquiry_count'],
+            student_sum=row['student_sum'] or 0
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outreach_inquiries', '0003_outreachinquiry_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InquiryStatsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='생성일')),
+                ('status', models.CharField(choices=[('접수대기', '접수대기'), ('검토중', '검토중'), ('견적발송', '견적발송'), ('확정', '확정'), ('진행중', '진행중'), ('완료', '완료'), ('취소', '취소')], max_length=10, verbose_name='상태')),
+                ('course_type', models.CharField(choices=[('app-inventor', '앱 인벤터'), ('arduino', '아두이노'), ('raspberry-pi', 'Raspberry Pi'), ('ai', 'AI 코딩'), ('python', '파이썬 코딩'), ('scratch', '스크래치'), ('web-development', '웹 개발'), ('game-development', '게임 개발'), ('data-science', '데이터 사이언스'), ('robotics', '로보틱스')], max_length=30, verbose_name='교육 과정')),
+                ('inquiry_count', models.PositiveIntegerField(default=0, verbose_name='문의 수')),
+                ('student_sum', models.PositiveIntegerField(default=0, verbose_name='참여 인원 합계')),
+            ],
+            options={
+                'verbose_name': '문의 통계 집계',
+                'verbose_name_plural': '문의 통계 집계',
+                'ordering': ['day', 'status', 'course_type'],
+                'unique_together': {('day', 'status', 'course_type')},
+            },
+        ),
+        migrations.RunPython(build_initial_snapshot, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:24
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outreach_inquiries', '0004_inquirystatssnapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internalclass',
+            name='held_seats',
+            field=models.PositiveIntegerField(default=0, help_text='신청서 작성 중 임시 예약(SeatHold)된 좌석 수 (자동 관리)', verbose_name='예약 중인 좌석'),
+        ),
+        migrations.CreateModel(
+            name='SeatHold',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='예약 토큰')),
+                ('seat_count', models.PositiveIntegerField(default=1, verbose_name='예약 좌석 수')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='만료일시')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('internal_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seat_holds', to='outreach_inquiries.internalclass', verbose_name='수업')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='seat_holds', to=settings.AUTH_USER_MODEL, verbose_name='예약자')),
+            ],
+            options={
+                'verbose_name': '좌석 임시 예약',
+                'verbose_name_plural': '좌석 임시 예약',
+                'ordering': ['expires_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outreach_inquiries', '0005_seathold'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outreachinquiry',
+            index=models.Index(fields=['created_at', 'id'], name='outreach_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:09
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outreach_inquiries', '0006_outreachinquiry_outreach_created_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internalclass',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_date', 'id', 'is_active'], name='class_active_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internalclass',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['course_type', 'start_date', 'id'], name='class_active_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internalclass',
+            index=models.Index(condition=models.Q(('current_students__lt', django.db.models.expressions.CombinedExpression(models.F('max_students'), '-', models.F('held_seats'))), ('is_active', True)), fields=['start_date', 'id', 'is_active', 'current_students', 'max_students', 'held_seats'], name='class_available_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internalclass',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-current_students'], name='class_active_popular_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='outreachinquiry',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='outreach_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='outreachinquiry',
+            index=models.Index(fields=['course_type', 'created_at', 'id'], name='outreach_course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='outreachinquiry',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='outreach_user_created_idx'),
+        ),
+    ]
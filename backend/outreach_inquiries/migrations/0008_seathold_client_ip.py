@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outreach_inquiries', '0007_internalclass_class_active_start_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seathold',
+            name='client_ip',
+            field=models.GenericIPAddressField(blank=True, null=True, verbose_name='예약 요청 IP'),
+        ),
+        migrations.AddIndex(
+            model_name='seathold',
+            index=models.Index(fields=['client_ip', 'expires_at'], name='seat_hold_ip_active_idx'),
+        ),
+    ]
@@ -1,4 +1,9 @@
-from django.db import models
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, models, transaction, IntegrityError
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
@@ -195,6 +200,15 @@ class OutreachInquiry(models.Model):
         verbose_name = "코딩 출강 교육 문의"
         verbose_name_plural = "코딩 출강 교육 문의들"
         ordering = ['-created_at']  # 최신순 정렬
+        indexes = [
+            # 목록 cursor 페이지네이션 (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='outreach_created_id_idx'),
+            # 상태 / 교육 과정 필터 + 최신순 목록
+            models.Index(fields=['status', 'created_at', 'id'], name='outreach_status_created_idx'),
+            models.Index(fields=['course_type', 'created_at', 'id'], name='outreach_course_created_idx'),
+            # 내 문의 목록 (작성자 필터 + 최신순)
+            models.Index(fields=['user', 'created_at', 'id'], name='outreach_user_created_idx'),
+        ]
         
     def __str__(self):
         return f"{self.title} - {self.requester_name}"
@@ -295,6 +309,11 @@ class InternalClass(models.Model):
         help_text="수강 정원"
     )
     current_students = models.PositiveIntegerField(default=0, verbose_name="현재 신청자")
+    held_seats = models.PositiveIntegerField(
+        default=0,
+        verbose_name="예약 중인 좌석",
+        help_text="신청서 작성 중 임시 예약(SeatHold)된 좌석 수 (자동 관리)"
+    )
     
     # 일정 정보
     start_date = models.DateField(
@@ -387,6 +406,38 @@ class InternalClass(models.Model):
         verbose_name = "내부 교육 수업"
         verbose_name_plural = "내부 교육 수업들"
         ordering = ['start_date']
+        indexes = [
+            # 활성 수업 시작일순 목록 (cursor 페이지네이션 (start_date, id))
+            # - is_active=True 조건은 'WHERE is_active'로 생성되므로 선두 컬럼 대신 부분 인덱스 사용
+            # - 부분 인덱스 조건 컬럼(is_active)을 포함해야 SQLite가 목록 COUNT를 인덱스만으로 처리
+            models.Index(
+                fields=['start_date', 'id', 'is_active'],
+                condition=models.Q(is_active=True),
+                name='class_active_start_idx'
+            ),
+            # 활성 수업 중 교육 과정별 목록
+            models.Index(
+                fields=['course_type', 'start_date', 'id'],
+                condition=models.Q(is_active=True),
+                name='class_active_course_idx'
+            ),
+            # 신청 가능한 활성 수업 (정원 - 임시 예약 좌석에 여유가 있는 수업) 시작일순
+            # - 조건 컬럼도 포함해야 SQLite가 COUNT를 인덱스만으로 처리
+            models.Index(
+                fields=['start_date', 'id', 'is_active', 'current_students', 'max_students', 'held_seats'],
+                condition=models.Q(
+                    is_active=True,
+                    current_students__lt=models.F('max_students') - models.F('held_seats')
+                ),
+                name='class_available_start_idx'
+            ),
+            # 인기 수업 (신청 인원순)
+            models.Index(
+                fields=['-current_students'],
+                condition=models.Q(is_active=True),
+                name='class_active_popular_idx'
+            ),
+        ]
         
     def __str__(self):
         return f"{self.title} ({self.get_class_type_display()})"
@@ -404,18 +455,235 @@ class InternalClass(models.Model):
         return 0
         
     def is_full(self):
-        """정원 마감 여부"""
-        return self.current_students >= self.max_students
+        """정원 마감 여부 (임시 예약 좌석 포함)"""
+        return self.current_students + self.held_seats >= self.max_students
         
     def can_enroll(self):
         """신청 가능 여부"""
         return self.is_active and not self.is_full()
+
+    def reserve_seats(self, seat_count):
+        """
+        수강 인원을 원자적으로 증가
+        - current_students + held_seats + seat_count <= max_students 조건부 UPDATE 한 번으로 처리
+        - 동시 신청 시에도 정원 초과 없음
+        - .update()는 auto_now를 갱신하지 않으므로 updated_at을 함께 갱신 (Last-Modified 조건부 응답용)
+
+        Args:
+            seat_count: 신청 인원 수
+
+        Returns:
+            bool: 신청 가능하여 인원이 증가했으면 True
+        """
+        reserved = InternalClass.objects.filter(
+            pk=self.pk,
+            is_active=True,
+            current_students__lte=models.F('max_students') - models.F('held_seats') - seat_count
+        ).update(
+            current_students=models.F('current_students') + seat_count,
+            updated_at=timezone.now()
+        )
+
+        if reserved:
+            self.refresh_from_db(fields=['current_students', 'held_seats'])
+        return bool(reserved)
+
+    def hold_seats(self, seat_count, user=None, client_ip=None):
+        """
+        신청서 작성 동안 좌석을 임시 예약
+        - 사용자/IP와 수업 행을 잠근 뒤 유효 예약 수(SEAT_HOLD_MAX_ACTIVE)를 확인하여
+          동시 요청으로 제한을 넘지 않도록 함
+        - 만료된 예약을 먼저 해제한 뒤 조건부 UPDATE로 held_seats 증가
+
+        Args:
+            seat_count: 예약할 좌석 수
+            user: 예약한 사용자 (비로그인 시 None)
+            client_ip: 예약 요청 IP (사용자/IP별 예약 수 제한용)
+
+        Returns:
+            SeatHold: 예약 정보 또는 좌석이 부족하면 None
+
+        Raises:
+            SeatHoldLimitExceeded: 사용자/IP의 유효 예약 수가 제한에 도달한 경우
+        """
+        with transaction.atomic():
+            SeatHold.lock_client(user=user, client_ip=client_ip)
+            InternalClass.objects.select_for_update().filter(pk=self.pk).exists()
+            if SeatHold.active_count(user=user, client_ip=client_ip) >= settings.SEAT_HOLD_MAX_ACTIVE:
+                raise SeatHoldLimitExceeded()
+
+            SeatHold.release_expired(internal_class_id=self.pk)
+
+            held = InternalClass.objects.filter(
+                pk=self.pk,
+                is_active=True,
+                current_students__lte=models.F('max_students') - models.F('held_seats') - seat_count
+            ).update(held_seats=models.F('held_seats') + seat_count, updated_at=timezone.now())
+            if not held:
+                return None
+
+            hold = SeatHold.objects.create(
+                internal_class=self,
+                user=user,
+                client_ip=client_ip,
+                seat_count=seat_count,
+                expires_at=timezone.now() + timedelta(minutes=settings.SEAT_HOLD_MINUTES)
+            )
+
+        self.refresh_from_db(fields=['current_students', 'held_seats'])
+        return hold
+
+    def convert_hold(self, token, seat_count=None):
+        """
+        유효한 임시 예약을 수강 신청으로 전환
+        - 예약 좌석 중 seat_count만큼 current_students로 옮기고 나머지는 해제
+        - 호출하는 쪽에서 트랜잭션으로 감싸야 함
+
+        Args:
+            token: 예약 토큰
+            seat_count: 신청 인원 수 (None이면 예약 좌석 전체)
+
+        Returns:
+            int: 전환된 좌석 수 (유효한 예약이 없으면 0)
+        """
+        hold = SeatHold.objects.select_for_update().filter(
+            token=token,
+            internal_class_id=self.pk,
+            expires_at__gt=timezone.now()
+        ).first()
+        if hold is None:
+            return 0
+
+        # 동시에 만료 처리된 경우 삭제된 행이 없음
+        deleted, _ = SeatHold.objects.filter(pk=hold.pk).delete()
+        if not deleted:
+            return 0
+
+        converted = hold.seat_count if seat_count is None else min(hold.seat_count, seat_count)
+        InternalClass.objects.filter(pk=self.pk).update(
+            held_seats=models.F('held_seats') - hold.seat_count,
+            current_students=models.F('current_students') + converted,
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db(fields=['current_students', 'held_seats'])
+        return converted
         
     def get_formatted_schedule(self):
         """일정 포맷팅"""
         return f"{self.start_date.strftime('%Y.%m.%d')} - {self.end_date.strftime('%Y.%m.%d')}"
 
 
+class SeatHoldLimitExceeded(Exception):
+    """사용자/IP의 유효한 좌석 임시 예약 수가 SEAT_HOLD_MAX_ACTIVE에 도달함"""
+
+
+# 좌석 임시 예약 모델
+class SeatHold(models.Model):
+    """
+    수업 좌석 임시 예약 모델
+    - 신청서 작성 중인 사용자를 위해 일정 시간 좌석을 확보
+    - 예약 좌석 수는 InternalClass.held_seats에 합산되어 정원 계산에 포함
+    """
+    internal_class = models.ForeignKey(
+        InternalClass,
+        on_delete=models.CASCADE,
+        related_name='seat_holds',
+        verbose_name="수업"
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='seat_holds',
+        verbose_name="예약자"
+    )
+    client_ip = models.GenericIPAddressField(null=True, blank=True, verbose_name="예약 요청 IP")
+    token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, verbose_name="예약 토큰")
+    seat_count = models.PositiveIntegerField(default=1, verbose_name="예약 좌석 수")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="만료일시")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+
+    class Meta:
+        verbose_name = "좌석 임시 예약"
+        verbose_name_plural = "좌석 임시 예약"
+        ordering = ['expires_at']
+        indexes = [
+            # 비로그인 사용자의 IP별 유효 예약 수 조회
+            models.Index(fields=['client_ip', 'expires_at'], name='seat_hold_ip_active_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.internal_class.title} - {self.seat_count}석 ({self.expires_at:%H:%M} 만료)"
+
+    @classmethod
+    def active_count(cls, user=None, client_ip=None):
+        """
+        사용자(로그인 시) 또는 요청 IP(비로그인 시)의 유효한 예약 수
+
+        Args:
+            user: 예약한 사용자 (비로그인 시 None)
+            client_ip: 예약 요청 IP
+        """
+        holds = cls.objects.filter(expires_at__gt=timezone.now())
+        if user is not None:
+            return holds.filter(user=user).count()
+        return holds.filter(user__isnull=True, client_ip=client_ip).count()
+
+    @staticmethod
+    def lock_client(user=None, client_ip=None):
+        """
+        사용자(로그인 시) 또는 요청 IP(비로그인 시)의 예약 요청을 직렬화하는 잠금
+        - 트랜잭션 안에서 호출, 트랜잭션이 끝나면 해제
+        - PostgreSQL: 사용자/IP 키의 advisory lock (다른 수업 예약 요청도 대기)
+        - SQLite: 쓰기 트랜잭션이 IMMEDIATE 모드로 이미 직렬화되므로 생략
+
+        Args:
+            user: 예약한 사용자 (비로그인 시 None)
+            client_ip: 예약 요청 IP
+        """
+        if connection.vendor != 'postgresql':
+            return
+        key = f'seat-hold:user:{user.pk}' if user is not None else f'seat-hold:ip:{client_ip}'
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(hashtext(%s))', [key])
+
+    @classmethod
+    def release_expired(cls, internal_class_id=None):
+        """
+        만료된 예약을 일괄 해제
+        - 만료 예약 삭제 후 수업별로 held_seats를 한 번씩 차감
+
+        Args:
+            internal_class_id: 특정 수업만 해제할 경우 수업 ID
+
+        Returns:
+            int: 해제된 예약 수
+        """
+        expired = cls.objects.filter(expires_at__lte=timezone.now())
+        if internal_class_id is not None:
+            expired = expired.filter(internal_class_id=internal_class_id)
+
+        with transaction.atomic():
+            holds = list(
+                expired.select_for_update().values_list('pk', 'internal_class_id', 'seat_count')
+            )
+            if not holds:
+                return 0
+
+            released_seats = {}
+            for _, class_id, seat_count in holds:
+                released_seats[class_id] = released_seats.get(class_id, 0) + seat_count
+
+            cls.objects.filter(pk__in=[pk for pk, _, _ in holds]).delete()
+            for class_id, seat_count in released_seats.items():
+                InternalClass.objects.filter(pk=class_id).update(
+                    held_seats=models.F('held_seats') - seat_count,
+                    updated_at=timezone.now()
+                )
+
+        return len(holds)
+
+
 # 커리큘럼 모델 (별도 테이블)
 class Curriculum(models.Model):
     """
@@ -537,3 +805,89 @@ class ClassMaterial(models.Model):
         if self.price_estimate:
             return self.price_estimate * self.quantity * student_count
         return None
+
+
+# 문의 통계 집계 모델 (일자 x 상태 x 교육 과정)
+class InquiryStatsSnapshot(models.Model):
+    """
+    코딩 출강 교육 문의 통계 집계 모델
+    - OutreachInquiry 저장/삭제 시그널로 증분 갱신
+    - statistics API는 원본 테이블 대신 이 집계만 조회
+    """
+    day = models.DateField(verbose_name="생성일")
+    status = models.CharField(
+        max_length=10,
+        choices=OutreachInquiry.STATUS_CHOICES,
+        verbose_name="상태"
+    )
+    course_type = models.CharField(
+        max_length=30,
+        choices=OutreachInquiry.COURSE_TYPE_CHOICES,
+        verbose_name="교육 과정"
+    )
+    inquiry_count = models.PositiveIntegerField(default=0, verbose_name="문의 수")
+    student_sum = models.PositiveIntegerField(default=0, verbose_name="참여 인원 합계")
+
+    class Meta:
+        verbose_name = "문의 통계 집계"
+        verbose_name_plural = "문의 통계 집계"
+        ordering = ['day', 'status', 'course_type']
+        unique_together = ['day', 'status', 'course_type']
+
+    def __str__(self):
+        return f"{self.day} {self.status} {self.course_type}: {self.inquiry_count}건"
+
+    @classmethod
+    def apply_delta(cls, day, status, course_type, count_delta, student_delta):
+        """
+        (일자, 상태, 교육 과정) 집계 값을 증감
+        - 기존 행은 F() 표현식으로 원자적으로 갱신
+        - 행이 없으면 생성 (동시 생성 충돌 시 갱신 재시도)
+        """
+        bucket = cls.objects.filter(day=day, status=status, course_type=course_type)
+        values = {
+            'inquiry_count': models.F('inquiry_count') + count_delta,
+            'student_sum': models.F('student_sum') + student_delta,
+        }
+        if bucket.update(**values):
+            return
+
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    day=day,
+                    status=status,
+                    course_type=course_type,
+                    inquiry_count=count_delta,
+                    student_sum=student_delta
+                )
+        except IntegrityError:
+            bucket.update(**values)
+
+    @classmethod
+    def rebuild(cls):
+        """
+        원본 문의 테이블로부터 집계 전체를 다시 계산
+
+        Returns:
+            int: 생성된 집계 행 수
+        """
+        rows = (
+            OutreachInquiry.objects.order_by()
+            .annotate(day=TruncDate('created_at'))
+            .values('day', 'status', 'course_type')
+            .annotate(inquiry_count=Count('id'), student_sum=Sum('student_count'))
+        )
+        with transaction.atomic():
+            cls.objects.all().delete()
+            snapshots = cls.objects.bulk_create(
+                cls(
+                    day=row['day'],
+                    status=row['status'],
+                    course_type=row['course_type'],
+                    inquiry_count=row['inquiry_count'],
+                    student_sum=row['student_sum'] or 0
+                )
+                for row in rows
+            )
+        return len(snapshots)
@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
-from .models import OutreachInquiry, InternalClass, Curriculum, ClassMaterial
+from config.images import SrcsetField, SrcsetListSerializer
+from .models import OutreachInquiry, InternalClass, Curriculum, ClassMaterial, SeatHold
 
 class OutreachInquirySerializer(serializers.ModelSerializer):
     """
@@ -238,7 +240,9 @@ class ClassMaterialSerializer(serializers.ModelSerializer):
         ]
         
     def get_total_price_for_10(self, obj):
-        """10명 기준 총 비용 계산"""
+        """10명 기준 총 비용 (ViewSet에서 annotate한 값이 있으면 사용)"""
+        if hasattr(obj, 'total_price_for_10'):
+            return obj.total_price_for_10
         return obj.get_total_price_for_students(10)
 
 
@@ -277,8 +281,16 @@ class InternalClassSerializer(serializers.ModelSerializer):
     curriculum_items = CurriculumSerializer(many=True, read_only=True)
     materials = ClassMaterialSerializer(many=True, read_only=True)
     
+    # 교구재 비용 집계 (ViewSet에서 annotate한 값)
+    material_student_count = serializers.IntegerField(read_only=True)
+    material_cost_total = serializers.IntegerField(read_only=True)
+    
+    # 썸네일 이미지의 형식별 srcset
+    thumbnail_srcset = SrcsetField(source='thumbnail')
+    
     class Meta:
         model = InternalClass
+        list_serializer_class = SrcsetListSerializer
         fields = [
             'id',
             'title',
@@ -290,6 +302,7 @@ class InternalClassSerializer(serializers.ModelSerializer):
             'target_grade',
             'max_students',
             'current_students',
+            'held_seats',
             'start_date',
             'end_date',
             'formatted_schedule',
@@ -303,6 +316,7 @@ class InternalClassSerializer(serializers.ModelSerializer):
             'description',
             'prerequisites',
             'thumbnail',
+            'thumbnail_srcset',
             'youtube_url',
             'images',
             'location',
@@ -311,10 +325,12 @@ class InternalClassSerializer(serializers.ModelSerializer):
             'is_enrollable',
             'curriculum_items',
             'materials',
+            'material_student_count',
+            'material_cost_total',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'current_students', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'current_students', 'held_seats', 'created_at', 'updated_at']
 
 class InternalClassListSerializer(serializers.ModelSerializer):
     """
@@ -345,12 +361,16 @@ class InternalClassListSerializer(serializers.ModelSerializer):
         read_only=True
     )
     
-    # 간소화된 커리큘럼과 교구재 정보
-    curriculum_count = serializers.SerializerMethodField()
-    required_materials_count = serializers.SerializerMethodField()
+    # 간소화된 커리큘럼과 교구재 정보 (ViewSet에서 annotate한 값)
+    curriculum_count = serializers.IntegerField(read_only=True)
+    required_materials_count = serializers.IntegerField(read_only=True)
+    
+    # 썸네일 이미지의 형식별 srcset
+    thumbnail_srcset = SrcsetField(source='thumbnail')
     
     class Meta:
         model = InternalClass
+        list_serializer_class = SrcsetListSerializer
         fields = [
             'id',
             'title',
@@ -362,6 +382,7 @@ class InternalClassListSerializer(serializers.ModelSerializer):
             'target_grade',
             'max_students',
             'current_students',
+            'held_seats',
             'formatted_schedule',
             'duration_hours',
             'price',
@@ -369,31 +390,26 @@ class InternalClassListSerializer(serializers.ModelSerializer):
             'discounted_price',
             'enrollment_rate',
             'thumbnail',
+            'thumbnail_srcset',
             'youtube_url',
             'is_active',
             'is_enrollable',
             'curriculum_count',
             'required_materials_count'
         ]
-        
-    def get_curriculum_count(self, obj):
-        """커리큘럼 차시 수"""
-        return obj.curriculum_items.count()
-        
-    def get_required_materials_count(self, obj):
-        """필수 교구재 수"""
-        return obj.materials.filter(is_required=True).count()
 
 class ClassEnrollmentSerializer(serializers.ModelSerializer):
     """
     수업 신청용 시리얼라이저 (OutreachInquiry로 변환)
     """
     class_id = serializers.IntegerField(write_only=True)
+    hold_token = serializers.UUIDField(write_only=True, required=False)
     
     class Meta:
         model = OutreachInquiry
         fields = [
             'class_id',
+            'hold_token',
             'requester_name',
             'phone',
             'email',
@@ -402,17 +418,26 @@ class ClassEnrollmentSerializer(serializers.ModelSerializer):
             'special_requests'
         ]
         
+    def validate_student_count(self, value):
+        """참여 인원 유효성 검사"""
+        if value <= 0:
+            raise serializers.ValidationError("참여 인원은 1명 이상이어야 합니다.")
+        if value > 100:
+            raise serializers.ValidationError("참여 인원은 100명을 초과할 수 없습니다.")
+        return value
+        
     def create(self, validated_data):
-        """수업 신청 시 InternalClass 정보를 기반으로 OutreachInquiry 생성"""
+        """
+        수업 신청 시 InternalClass 정보를 기반으로 OutreachInquiry 생성
+        - 정원 확인 및 인원 증가는 뷰에서 InternalClass.reserve_seats로 처리
+        """
         class_id = validated_data.pop('class_id')
+        validated_data.pop('hold_token', None)
         
         try:
             internal_class = InternalClass.objects.get(id=class_id)
         except InternalClass.DoesNotExist:
             raise serializers.ValidationError("존재하지 않는 수업입니다.")
-            
-        if not internal_class.can_enroll():
-            raise serializers.ValidationError("신청할 수 없는 수업입니다.")
         
         # InternalClass 정보를 바탕으로 OutreachInquiry 생성
         inquiry_data = {
@@ -427,4 +452,28 @@ class ClassEnrollmentSerializer(serializers.ModelSerializer):
             **validated_data
         }
         
-        return OutreachInquiry.objects.create(**inquiry_data) 
\ No newline at end of file
+        return OutreachInquiry.objects.create(**inquiry_data)
+
+
+class SeatHoldSerializer(serializers.ModelSerializer):
+    """
+    수업 좌석 임시 예약 시리얼라이저
+    """
+    class Meta:
+        model = SeatHold
+        fields = [
+            'token',
+            'seat_count',
+            'expires_at'
+        ]
+        read_only_fields = ['token', 'expires_at']
+
+    def validate_seat_count(self, value):
+        """예약 좌석 수 유효성 검사"""
+        if value <= 0:
+            raise serializers.ValidationError("예약 좌석 수는 1석 이상이어야 합니다.")
+        if value > settings.SEAT_HOLD_MAX_SEATS:
+            raise serializers.ValidationError(
+                f"예약 좌석 수는 {settings.SEAT_HOLD_MAX_SEATS}석을 초과할 수 없습니다."
+            )
+        return value
@@ -0,0 +1,109 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from config.cache import invalidate_cache_group
+from products.models.product_image_rendition import renditions_generated
+from products.tasks import generate_image_renditions
+from .models import (
+    OutreachInquiry, InquiryStatsSnapshot, InternalClass, Curriculum, ClassMaterial, SeatHold
+)
+
+
+def _stats_key(values):
+    """통계 집계 키 (생성일, 상태, 교육 과정) 반환"""
+    return (
+        timezone.localdate(values['created_at']),
+        values['status'],
+        values['course_type'],
+    )
+
+
+@receiver(pre_save, sender=OutreachInquiry)
+def remember_previous_stats(sender, instance, **kwargs):
+    """
+    수정 전 집계 기준 값 보관
+    - 상태/교육 과정/인원 변경 시 이전 집계에서 차감하기 위함
+    """
+    instance._previous_stats = None
+    if instance.pk:
+        instance._previous_stats = sender.objects.filter(pk=instance.pk).values(
+            'created_at', 'status', 'course_type', 'student_count'
+        ).first()
+
+
+@receiver(post_save, sender=OutreachInquiry)
+def update_stats_on_save(sender, instance, created, **kwargs):
+    """문의 생성/수정 시 통계 집계 증분 갱신"""
+    current = {
+        'created_at': instance.created_at,
+        'status': instance.status,
+        'course_type': instance.course_type,
+        'student_count': instance.student_count,
+    }
+    previous = None if created else getattr(instance, '_previous_stats', None)
+
+    if previous:
+        if (_stats_key(previous) == _stats_key(current)
+                and previous['student_count'] == current['student_count']):
+            return
+        InquiryStatsSnapshot.apply_delta(*_stats_key(previous), -1, -previous['student_count'])
+
+    InquiryStatsSnapshot.apply_delta(*_stats_key(current), 1, current['student_count'])
+
+
+@receiver(post_delete, sender=OutreachInquiry)
+def update_stats_on_delete(sender, instance, **kwargs):
+    """문의 삭제 시 통계 집계에서 차감"""
+    InquiryStatsSnapshot.apply_delta(
+        timezone.localdate(instance.created_at),
+        instance.status,
+        instance.course_type,
+        -1,
+        -instance.student_count
+    )
+
+
+@receiver(post_save, sender=Curriculum)
+@receiver(post_delete, sender=Curriculum)
+@receiver(post_save, sender=ClassMaterial)
+@receiver(post_delete, sender=ClassMaterial)
+def touch_class_on_related_change(sender, instance, **kwargs):
+    """
+    커리큘럼/교구재 저장/삭제 시 수업 수정일 갱신
+    - 수정일은 상세 조회 ETag / Last-Modified 계산에 사용
+    """
+    InternalClass.objects.filter(pk=instance.internal_class_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=InternalClass)
+@receiver(post_delete, sender=InternalClass)
+@receiver(post_save, sender=Curriculum)
+@receiver(post_delete, sender=Curriculum)
+@receiver(post_save, sender=ClassMaterial)
+@receiver(post_delete, sender=ClassMaterial)
+@receiver(post_save, sender=SeatHold)
+@receiver(post_delete, sender=SeatHold)
+def invalidate_class_cache(sender, **kwargs):
+    """수업/커리큘럼/교구재/좌석 홀드 변경 시 수업 목록 응답 캐시 무효화"""
+    invalidate_cache_group('classes')
+
+
+@receiver(post_save, sender=OutreachInquiry)
+@receiver(post_delete, sender=OutreachInquiry)
+def invalidate_inquiry_cache(sender, **kwargs):
+    """문의 변경 시 최근 문의/통계 응답 캐시 무효화"""
+    invalidate_cache_group('inquiries')
+
+
+@receiver(post_save, sender=InternalClass)
+def generate_class_thumbnail_renditions(sender, instance, **kwargs):
+    """수업 저장 시 커밋 후 썸네일 rendition 생성 작업 등록 (이미 있으면 생략)"""
+    if instance.thumbnail:
+        generate_image_renditions.delay_on_commit(instance.thumbnail.name)
+
+
+@receiver(renditions_generated)
+def touch_classes_on_renditions(sender, source, **kwargs):
+    """rendition 생성 시 해당 썸네일을 쓰는 수업의 수정일 갱신 및 응답 캐시 무효화"""
+    if InternalClass.objects.filter(thumbnail=source).update(updated_at=timezone.now()):
+        invalidate_cache_group('classes')
@@ -0,0 +1,13 @@
+from celery import shared_task
+from outreach_inquiries.models import SeatHold
+
+
+@shared_task
+def release_expired_holds():
+    """
+    만료된 좌석 임시 예약 일괄 해제 (celery beat로 1분마다 실행)
+
+    Returns:
+        int: 해제된 예약 수
+    """
+    return SeatHold.release_expired()
@@ -1,3 +1,1049 @@
-from django.test import TestCase
+import json
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection, OperationalError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from PIL import Image
+from config.images import rendition_name
+from testing.query_plans import QueryPlanTestMixin
+from .models import (
+    OutreachInquiry,
+    InquiryStatsSnapshot,
+    InternalClass,
+    SeatHold,
+    Curriculum,
+    ClassMaterial
+)
+from .tasks import release_expired_holds
+from .throttles import SeatHoldThrottle
 
-# Create your tests here.
+User = get_user_model()
+
+
+class OutreachInquiryStatisticsTest(TestCase):
+    """
+    코딩 출강 교육 문의 통계 API 테스트 클래스
+
+    통계 응답 값과 쿼리 수, 날짜 범위 필터를 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('outreachinquiry-statistics')
+
+        OutreachInquiry.objects.create(course_type='python', student_count=10, status='접수대기')
+        OutreachInquiry.objects.create(course_type='python', student_count=5, status='확정')
+        OutreachInquiry.objects.create(course_type='arduino', student_count=20, status='완료')
+
+        old_inquiry = OutreachInquiry.objects.create(
+            course_type='ai', student_count=7, status='검토중'
+        )
+        # auto_now_add 필드는 update로 과거 날짜 지정 (시그널이 동작하지 않으므로 집계 재계산)
+        OutreachInquiry.objects.filter(pk=old_inquiry.pk).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+        InquiryStatsSnapshot.rebuild()
+
+    def test_statistics_values(self):
+        """통계 응답 값 테스트 함수"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data
+        self.assertEqual(data['total_inquiries'], 4)
+        self.assertEqual(data['total_students'], 42)
+        self.assertEqual(data['status_breakdown']['접수대기'], 1)
+        self.assertEqual(data['status_breakdown']['취소'], 0)
+        self.assertEqual(data['course_type_breakdown']['python'], 2)
+        self.assertEqual(data['course_type_breakdown']['robotics'], 0)
+        self.assertEqual(data['pending_count'], 1)
+        self.assertEqual(data['in_progress_count'], 2)
+        self.assertEqual(data['completed_count'], 1)
+
+    def test_statistics_single_query(self):
+        """통계 집계가 집계 테이블 쿼리 1번으로 수행되는지 테스트 함수"""
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_statistics_created_range(self):
+        """생성일 범위 필터 테스트 함수"""
+        today = timezone.localdate()
+
+        response = self.client.get(self.url, {'created_after': today.isoformat()})
+        self.assertEqual(response.data['total_inquiries'], 3)
+        self.assertEqual(response.data['course_type_breakdown']['ai'], 0)
+
+        before = (today - timedelta(days=1)).isoformat()
+        response = self.client.get(self.url, {'created_before': before})
+        self.assertEqual(response.data['total_inquiries'], 1)
+        self.assertEqual(response.data['total_students'], 7)
+
+    def test_statistics_invalid_date(self):
+        """잘못된 날짜 형식 요청 테스트 함수"""
+        response = self.client.get(self.url, {'created_after': '2025-13-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'created_before': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class InquiryStatsSnapshotTest(TestCase):
+    """
+    문의 통계 집계 테스트 클래스
+
+    문의 생성/수정/삭제 시 집계 테이블이 증분 갱신되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.today = timezone.localdate()
+
+    def _bucket(self, status_key, course_type):
+        """오늘 일자의 (상태, 교육 과정) 집계 값 반환"""
+        snapshot = InquiryStatsSnapshot.objects.filter(
+            day=self.today,
+            status=status_key,
+            course_type=course_type
+        ).first()
+        if snapshot is None:
+            return (0, 0)
+        return (snapshot.inquiry_count, snapshot.student_sum)
+
+    def test_create_and_delete(self):
+        """문의 생성/삭제 시 집계 갱신 테스트 함수"""
+        first = OutreachInquiry.objects.create(course_type='python', student_count=10)
+        OutreachInquiry.objects.create(course_type='python', student_count=5)
+        self.assertEqual(self._bucket('접수대기', 'python'), (2, 15))
+
+        first.delete()
+        self.assertEqual(self._bucket('접수대기', 'python'), (1, 5))
+
+    def test_status_and_student_count_change(self):
+        """상태/인원 변경 시 이전 집계에서 이동하는지 테스트 함수"""
+        inquiry = OutreachInquiry.objects.create(course_type='arduino', student_count=10)
+
+        inquiry.status = '확정'
+        inquiry.student_count = 12
+        inquiry.save()
+
+        self.assertEqual(self._bucket('접수대기', 'arduino'), (0, 0))
+        self.assertEqual(self._bucket('확정', 'arduino'), (1, 12))
+
+        # 집계 기준 값이 바뀌지 않은 저장은 집계에 영향 없음
+        inquiry.title = '제목 수정'
+        inquiry.save()
+        self.assertEqual(self._bucket('확정', 'arduino'), (1, 12))
+
+    def test_update_status_action(self):
+        """update_status API로 상태 변경 시 집계 갱신 테스트 함수"""
+        admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpassword'
+        )
+        inquiry = OutreachInquiry.objects.create(course_type='ai', student_count=3)
+
+        self.client.force_authenticate(user=admin_user)
+        url = reverse('outreachinquiry-update-status', args=[inquiry.pk])
+        response = self.client.patch(url, {'status': '완료'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self._bucket('접수대기', 'ai'), (0, 0))
+        self.assertEqual(self._bucket('완료', 'ai'), (1, 3))
+
+    def test_rebuild_matches_incremental(self):
+        """재계산 결과가 증분 갱신 결과와 같은지 테스트 함수"""
+        OutreachInquiry.objects.create(course_type='python', student_count=4)
+        inquiry = OutreachInquiry.objects.create(course_type='scratch', student_count=6)
+        inquiry.status = '취소'
+        inquiry.save()
+
+        incremental = set(
+            InquiryStatsSnapshot.objects.filter(inquiry_count__gt=0).values_list(
+                'day', 'status', 'course_type', 'inquiry_count', 'student_sum'
+            )
+        )
+        InquiryStatsSnapshot.rebuild()
+        rebuilt = set(
+            InquiryStatsSnapshot.objects.values_list(
+                'day', 'status', 'course_type', 'inquiry_count', 'student_sum'
+            )
+        )
+        self.assertEqual(incremental, rebuilt)
+
+
+class InternalClassEnrollTest(TestCase):
+    """
+    수업 신청 API 테스트 클래스
+
+    신청 인원만큼 좌석이 확보되고, 정원 초과 시 409를 반환하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.internal_class = InternalClass.objects.create(
+            title='아두이노 기초',
+            course_type='arduino',
+            max_students=10,
+            current_students=6
+        )
+        self.url = reverse('internalclass-enroll', args=[self.internal_class.pk])
+        self.enrollment_data = {
+            'requester_name': '김교사',
+            'phone': '010-1234-5678',
+            'email': 'teacher@example.com',
+            'message': '수업 신청합니다.',
+        }
+
+    def test_enroll_reserves_student_count_seats(self):
+        """신청 인원만큼 수강 인원이 증가하는지 테스트 함수"""
+        response = self.client.post(
+            self.url, {**self.enrollment_data, 'student_count': 3}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.current_students, 9)
+        self.assertTrue(OutreachInquiry.objects.filter(pk=response.data['inquiry_id']).exists())
+
+    def test_enroll_full_class_returns_conflict(self):
+        """정원 초과 신청 시 409를 반환하고 문의가 생성되지 않는지 테스트 함수"""
+        response = self.client.post(
+            self.url, {**self.enrollment_data, 'student_count': 5}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.current_students, 6)
+        self.assertFalse(OutreachInquiry.objects.exists())
+
+
+class InternalClassConcurrentEnrollTest(TransactionTestCase):
+    """
+    수업 동시 신청 / 임시 예약 테스트 클래스
+
+    여러 스레드가 동시에 신청해도 정원을, 동시에 예약해도 사용자/IP별 예약 수 제한을 넘지 않는지 테스트합니다.
+    SQLite와 PostgreSQL 모두 현재 테스트 데이터베이스에서 그대로 실행됩니다.
+    """
+    thread_count = 20
+    max_students = 7
+
+    def _enroll(self, url, results):
+        """스레드별 수업 신청 함수"""
+        client = APIClient()
+        try:
+            response = client.post(url, {
+                'requester_name': '동시 신청자',
+                'phone': '010-0000-0000',
+                'email': 'user@example.com',
+                'message': '수업 신청합니다.',
+                'student_count': 1,
+            }, format='json')
+            results.append(response.status_code)
+        except OperationalError:
+            # SQLite 잠금 오류는 신청 실패로 처리
+            results.append(None)
+        finally:
+            connection.close()
+
+    def test_no_overbooking(self):
+        """동시 신청 시 정원 초과가 발생하지 않는지 테스트 함수"""
+        internal_class = InternalClass.objects.create(
+            title='인기 수업',
+            max_students=self.max_students
+        )
+        url = reverse('internalclass-enroll', args=[internal_class.pk])
+        results = []
+        barrier = threading.Barrier(self.thread_count)
+
+        def worker():
+            barrier.wait()
+            self._enroll(url, results)
+
+        threads = [threading.Thread(target=worker) for _ in range(self.thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        internal_class.refresh_from_db()
+        enrolled = results.count(status.HTTP_201_CREATED)
+
+        # 정원만큼 정확히 신청되고 나머지는 모두 409 (잠금 오류 등 다른 결과는 실패)
+        self.assertEqual(len(results), self.thread_count)
+        self.assertEqual(enrolled, self.max_students)
+        self.assertEqual(Counter(results), {
+            status.HTTP_201_CREATED: self.max_students,
+            status.HTTP_409_CONFLICT: self.thread_count - self.max_students,
+        })
+        self.assertEqual(internal_class.current_students, enrolled)
+        self.assertEqual(OutreachInquiry.objects.count(), enrolled)
+
+    def test_concurrent_holds_respect_active_limit(self):
+        """같은 IP의 동시 예약 요청이 유효 예약 수 제한을 넘지 않는지 테스트 함수"""
+        cache.clear()
+        internal_class = InternalClass.objects.create(title='인기 수업', max_students=100)
+        url = reverse('internalclass-hold', args=[internal_class.pk])
+        results = []
+        barrier = threading.Barrier(self.thread_count)
+
+        def worker():
+            barrier.wait()
+            try:
+                response = APIClient().post(url, {'seat_count': 1}, format='json')
+                results.append(response.status_code)
+            except OperationalError:
+                results.append(None)
+            finally:
+                connection.close()
+
+        with mock.patch.object(SeatHoldThrottle, 'THROTTLE_RATES', {'seat_hold': '1000/minute'}):
+            threads = [threading.Thread(target=worker) for _ in range(self.thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # 제한 수만큼만 예약되고 나머지는 모두 429
+        self.assertEqual(Counter(results), {
+            status.HTTP_201_CREATED: settings.SEAT_HOLD_MAX_ACTIVE,
+            status.HTTP_429_TOO_MANY_REQUESTS: self.thread_count - settings.SEAT_HOLD_MAX_ACTIVE,
+        })
+        self.assertEqual(SeatHold.objects.count(), settings.SEAT_HOLD_MAX_ACTIVE)
+        internal_class.refresh_from_db()
+        self.assertEqual(internal_class.held_seats, settings.SEAT_HOLD_MAX_ACTIVE)
+
+
+class SeatHoldTest(TestCase):
+    """
+    수업 좌석 임시 예약 테스트 클래스
+
+    임시 예약이 정원 계산에 포함되고, 신청 전환과 만료 해제가 되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (요청 수 제한 기록 초기화)"""
+        cache.clear()
+        self.client = APIClient()
+        self.internal_class = InternalClass.objects.create(
+            title='파이썬 기초',
+            max_students=5,
+            current_students=1
+        )
+        self.hold_url = reverse('internalclass-hold', args=[self.internal_class.pk])
+        self.enroll_url = reverse('internalclass-enroll', args=[self.internal_class.pk])
+        self.enrollment_data = {
+            'requester_name': '김교사',
+            'phone': '010-1234-5678',
+            'email': 'teacher@example.com',
+            'message': '수업 신청합니다.',
+        }
+
+    def test_hold_counts_against_capacity(self):
+        """임시 예약 좌석이 정원에 포함되는지 테스트 함수"""
+        response = self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('token', response.data)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.held_seats, 4)
+        self.assertFalse(self.internal_class.can_enroll())
+
+        # 남은 좌석이 없으므로 예약/신청 모두 409
+        response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        response = self.client.post(self.enroll_url, self.enrollment_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        # 신청 가능한 수업 목록에서도 제외
+        response = self.client.get(reverse('internalclass-available'))
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_enroll_with_hold_token(self):
+        """예약 토큰으로 신청 시 예약 좌석이 신청으로 전환되는지 테스트 함수"""
+        response = self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        token = response.data['token']
+
+        response = self.client.post(
+            self.enroll_url,
+            {**self.enrollment_data, 'hold_token': token, 'student_count': 3},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.current_students, 4)
+        self.assertEqual(self.internal_class.held_seats, 0)
+        self.assertFalse(SeatHold.objects.exists())
+        self.assertEqual(OutreachInquiry.objects.get().student_count, 3)
+
+    def test_release_expired_holds(self):
+        """만료된 예약이 일괄 해제되는지 테스트 함수"""
+        self.client.post(self.hold_url, {'seat_count': 2}, format='json')
+        self.client.post(self.hold_url, {'seat_count': 2}, format='json')
+        SeatHold.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        call_command('release_expired_holds', stdout=StringIO())
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.held_seats, 0)
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_release_expired_holds_task(self):
+        """주기 작업이 만료된 예약만 해제하는지 테스트 함수"""
+        self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+        self.client.post(self.hold_url, {'seat_count': 3}, format='json')
+        SeatHold.objects.filter(seat_count=1).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        self.assertEqual(release_expired_holds.delay().get(), 1)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.held_seats, 3)
+        self.assertEqual(SeatHold.objects.count(), 1)
+
+    def test_expired_hold_released_on_new_hold(self):
+        """새 예약 시 해당 수업의 만료 예약이 먼저 해제되는지 테스트 함수"""
+        self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        SeatHold.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        response = self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.held_seats, 4)
+        self.assertEqual(SeatHold.objects.count(), 1)
+
+
+    @override_settings(SEAT_HOLD_MAX_SEATS=3)
+    def test_hold_seat_limit(self):
+        """예약당 최대 좌석 수를 넘으면 400을 반환하는지 테스트 함수"""
+        response = self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_active_hold_limit_per_client(self):
+        """같은 IP의 유효 예약 수가 제한을 넘으면 429, 다른 IP는 예약 가능한지 테스트 함수"""
+        self.internal_class.max_students = 20
+        self.internal_class.save()
+        for _ in range(settings.SEAT_HOLD_MAX_ACTIVE):
+            response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.post(
+            self.hold_url, {'seat_count': 1}, format='json', REMOTE_ADDR='10.0.0.2'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # 만료된 예약은 제한에 포함되지 않음
+        SeatHold.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+        response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_hold_throttle(self):
+        """예약 요청 수 제한을 넘으면 429를 반환하는지 테스트 함수"""
+        with mock.patch.object(SeatHoldThrottle, 'THROTTLE_RATES', {'seat_hold': '2/minute'}):
+            for _ in range(2):
+                response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            SeatHold.objects.all().delete()
+            response = self.client.post(self.hold_url, {'seat_count': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_expired_hold_does_not_block_enroll(self):
+        """주기 작업이 해제하지 않은 만료 예약이 신청을 막지 않는지 테스트 함수"""
+        self.client.post(self.hold_url, {'seat_count': 4}, format='json')
+        SeatHold.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+
+        response = self.client.post(
+            self.enroll_url, {**self.enrollment_data, 'student_count': 4}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.internal_class.refresh_from_db()
+        self.assertEqual(self.internal_class.current_students, 5)
+        self.assertEqual(self.internal_class.held_seats, 0)
+        self.assertFalse(SeatHold.objects.exists())
+
+
+class InternalClassListQueryTest(TestCase):
+    """
+    수업 목록 API 쿼리 수 테스트 클래스
+
+    목록형 액션이 수업 수와 관계없이 일정한 쿼리 수로 응답하는지 테스트합니다.
+    (페이지네이션 액션은 COUNT 1번 + 페이지 조회 1번)
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+
+    def _create_classes(self, count):
+        """커리큘럼 3차시, 교구재(필수 2, 선택 1)를 가진 수업을 count개 생성하는 함수"""
+        for index in range(count):
+            internal_class = InternalClass.objects.create(
+                title=f'수업 {index}',
+                course_type='python',
+                current_students=1
+            )
+            for session_number in range(1, 4):
+                Curriculum.objects.create(
+                    internal_class=internal_class,
+                    session_number=session_number,
+                    session_title=f'{session_number}차시',
+                    description='차시 설명'
+                )
+            ClassMaterial.objects.create(internal_class=internal_class, name='보드')
+            ClassMaterial.objects.create(internal_class=internal_class, name='센서')
+            ClassMaterial.objects.create(internal_class=internal_class, name='케이스', is_required=False)
+
+    def _assert_constant_queries(self, url, params=None, queries=2):
+        """수업 수가 늘어나도 쿼리 수가 일정한지 확인하는 함수"""
+        self._create_classes(1)
+        with self.assertNumQueries(queries):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self._create_classes(4)
+        with self.assertNumQueries(queries):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_list(self):
+        """목록 조회 쿼리 수 및 집계 값 테스트 함수"""
+        response = self._assert_constant_queries(reverse('internalclass-list'))
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(response.data['results'][0]['curriculum_count'], 3)
+        self.assertEqual(response.data['results'][0]['required_materials_count'], 2)
+
+    def test_available(self):
+        """신청 가능 수업 조회 쿼리 수 테스트 함수"""
+        response = self._assert_constant_queries(reverse('internalclass-available'))
+        self.assertEqual(response.data['results'][0]['required_materials_count'], 2)
+
+    def test_by_course_type(self):
+        """교육 과정별 수업 조회 쿼리 수 테스트 함수"""
+        response = self._assert_constant_queries(
+            reverse('internalclass-by-course-type'), {'course_type': 'python'}
+        )
+        self.assertEqual(response.data['results'][0]['curriculum_count'], 3)
+
+    def test_popular(self):
+        """인기 수업 조회 쿼리 수 테스트 함수"""
+        response = self._assert_constant_queries(reverse('internalclass-popular'), queries=1)
+        self.assertEqual(len(response.data), 5)
+
+    def test_thumbnail_srcset(self):
+        """썸네일 rendition이 목록의 thumbnail_srcset으로 한 번에 조회되는지 테스트 함수"""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        buffer = BytesIO()
+        Image.new('RGB', (600, 450), 'blue').save(buffer, 'JPEG')
+
+        with override_settings(MEDIA_ROOT=media_root):
+            with self.captureOnCommitCallbacks(execute=True):
+                internal_class = InternalClass(title='썸네일 수업', course_type='python')
+                internal_class.thumbnail.save('class.jpg', ContentFile(buffer.getvalue()))
+            InternalClass.objects.create(title='썸네일 없는 수업', course_type='python')
+
+            # COUNT, 페이지 조회, rendition 일괄 조회
+            with self.assertNumQueries(3):
+                response = self.client.get(reverse('internalclass-list'))
+
+        srcsets = {item['title']: item['thumbnail_srcset'] for item in response.data['results']}
+        self.assertEqual(srcsets['썸네일 없는 수업'], {})
+        self.assertEqual(
+            srcsets['썸네일 수업']['jpeg'],
+            f'http://testserver/media/{rendition_name(internal_class.thumbnail.name, 200, "jpg")} 200w, '
+            f'http://testserver/media/{rendition_name(internal_class.thumbnail.name, 400, "jpg")} 400w'
+        )
+
+
+class InternalClassDetailQueryTest(TestCase):
+    """
+    수업 상세 API 테스트 클래스
+
+    커리큘럼/교구재 수와 관계없이 고정된 쿼리 수로 응답하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.internal_class = InternalClass.objects.create(title='아두이노 기초')
+        self.url = reverse('internalclass-detail', args=[self.internal_class.pk])
+
+        for session_number in (3, 1, 2):
+            Curriculum.objects.create(
+                internal_class=self.internal_class,
+                session_number=session_number,
+                session_title=f'{session_number}차시',
+                description='차시 설명'
+            )
+        ClassMaterial.objects.create(
+            internal_class=self.internal_class, name='보드', quantity=1, price_estimate=20000
+        )
+        ClassMaterial.objects.create(
+            internal_class=self.internal_class, name='LED', quantity=5, price_estimate=100
+        )
+        ClassMaterial.objects.create(internal_class=self.internal_class, name='가위')
+
+    def test_detail_query_count(self):
+        """상세 조회 쿼리 수 테스트 함수"""
+        # ETag 확인, 수업 + 비용 집계, 커리큘럼 prefetch, 교구재 prefetch
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        sessions = [item['session_number'] for item in response.data['curriculum_items']]
+        self.assertEqual(sessions, [1, 2, 3])
+
+    def test_material_costs(self):
+        """교구재 비용 집계 테스트 함수"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['material_student_count'], 10)
+        self.assertEqual(response.data['material_cost_total'], 205000)
+
+        totals = {item['name']: item['total_price_for_10'] for item in response.data['materials']}
+        self.assertEqual(totals, {'보드': 200000, 'LED': 5000, '가위': None})
+
+        response = self.client.get(self.url, {'student_count': 3})
+        self.assertEqual(response.data['material_student_count'], 3)
+        self.assertEqual(response.data['material_cost_total'], 61500)
+
+        response = self.client.get(self.url, {'student_count': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class InternalClassDetailConditionalTest(TestCase):
+    """
+    수업 상세 API 조건부 요청 테스트 클래스
+
+    ETag 기반으로 변경이 없으면 304를, 변경되면 200을 반환하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.internal_class = InternalClass.objects.create(title='파이썬 기초', max_students=10)
+        self.url = reverse('internalclass-detail', args=[self.internal_class.pk])
+
+    def test_not_modified(self):
+        """변경이 없으면 쿼리 1번으로 304를 반환하는지 테스트 함수"""
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 쿼리 파라미터가 다르면 다른 응답
+        response = self.client.get(self.url, {'student_count': 5}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_changes_invalidate_etag(self):
+        """신청 인원/커리큘럼 변경 시 ETag가 바뀌는지 테스트 함수"""
+        etag = self.client.get(self.url)['ETag']
+
+        self.internal_class.reserve_seats(2)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_students'], 2)
+
+        etag = response['ETag']
+        Curriculum.objects.create(
+            internal_class=self.internal_class,
+            session_number=1,
+            session_title='1차시',
+            description='차시 설명'
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['curriculum_items']), 1)
+
+    def backdated_last_modified(self):
+        """수정일을 과거로 옮긴 뒤 상세 응답의 Last-Modified 반환 (같은 초 안의 변경과 구분)"""
+        InternalClass.objects.filter(pk=self.internal_class.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+        return self.client.get(self.url)['Last-Modified']
+
+    def assert_modified_since(self, last_modified, current_students, held_seats):
+        """If-Modified-Since만 보낸 요청이 최신 인원으로 200을 반환하는지 확인"""
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_students'], current_students)
+        self.assertEqual(response.data['held_seats'], held_seats)
+
+    def test_seat_changes_update_last_modified(self):
+        """신청/임시 예약/예약 전환/만료 해제 시 Last-Modified가 갱신되는지 테스트 함수"""
+        last_modified = self.backdated_last_modified()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.internal_class.reserve_seats(2)
+        self.assert_modified_since(last_modified, 2, 0)
+
+        last_modified = self.backdated_last_modified()
+        hold = self.internal_class.hold_seats(3)
+        self.assert_modified_since(last_modified, 2, 3)
+
+        last_modified = self.backdated_last_modified()
+        self.internal_class.convert_hold(hold.token, seat_count=1)
+        self.assert_modified_since(last_modified, 3, 0)
+
+        self.internal_class.hold_seats(2)
+        SeatHold.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+        last_modified = self.backdated_last_modified()
+        SeatHold.release_expired()
+        self.assert_modified_since(last_modified, 3, 0)
+
+
+class InternalClassResponseCacheTest(TestCase):
+    """
+    수업 목록 / 문의 통계 응답 캐시 테스트 클래스
+
+    비로그인 요청은 캐시에서 응답하고, 관련 데이터 변경 시 무효화되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        cache.clear()
+        self.client = APIClient()
+        self.internal_class = InternalClass.objects.create(
+            title='아두이노 기초',
+            course_type='arduino',
+            class_type='오프라인',
+            max_students=10,
+            current_students=2
+        )
+        self.list_url = reverse('internalclass-list')
+        self.available_url = reverse('internalclass-available')
+
+    def test_cache_hit_without_queries(self):
+        """같은 요청은 쿼리 없이 캐시에서 응답하는지 테스트 함수"""
+        first = self.client.get(self.list_url, {'course_type': 'arduino', 'class_type': '오프라인'})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        # 쿼리 파라미터 순서가 달라도 같은 캐시 사용
+        with self.assertNumQueries(0):
+            second = self.client.get(self.list_url, {'class_type': '오프라인', 'course_type': 'arduino'})
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json(), first.json())
+
+    def test_related_change_invalidates_cache(self):
+        """커리큘럼 추가 시 목록 캐시가 무효화되는지 테스트 함수"""
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data['results'][0]['curriculum_count'], 0)
+
+        Curriculum.objects.create(
+            internal_class=self.internal_class,
+            session_number=1,
+            session_title='1차시',
+            description='차시 설명'
+        )
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data['results'][0]['curriculum_count'], 1)
+
+    def test_enroll_invalidates_cache(self):
+        """수업 신청으로 정원이 차면 신청 가능 목록에서 제외되는지 테스트 함수"""
+        response = self.client.get(self.available_url)
+        self.assertEqual(len(response.data['results']), 1)
+
+        response = self.client.post(
+            reverse('internalclass-enroll', args=[self.internal_class.pk]),
+            {
+                'requester_name': '김교사',
+                'phone': '010-1234-5678',
+                'email': 'teacher@example.com',
+                'message': '수업 신청합니다.',
+                'student_count': 8,
+            },
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(self.available_url)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_statistics_invalidated_by_new_inquiry(self):
+        """문의 생성 시 통계 캐시가 무효화되는지 테스트 함수"""
+        url = reverse('outreachinquiry-statistics')
+        self.assertEqual(self.client.get(url).data['total_inquiries'], 0)
+
+        OutreachInquiry.objects.create(requester_name='김교사', student_count=5)
+        self.assertEqual(self.client.get(url).data['total_inquiries'], 1)
+
+    def test_authenticated_request_bypasses_cache(self):
+        """로그인 사용자 요청은 캐시를 사용하지 않는지 테스트 함수"""
+        self.client.get(self.list_url)
+        user = User.objects.create_user(
+            username='teacher',
+            email='teacher@example.com',
+            password='password123'
+        )
+        self.client.force_authenticate(user=user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class OutreachInquiryKeysetPaginationTest(TestCase):
+    """
+    문의 목록 cursor 페이지네이션 테스트 클래스
+
+    (created_at, id) 기준으로 중복/누락 없이 앞뒤 페이지를 이동하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('outreachinquiry-list')
+        same_time = timezone.now() - timedelta(days=1)
+        for index in range(7):
+            OutreachInquiry.objects.create(title=f'문의 {index}', student_count=index + 1)
+        # 생성일이 같은 행도 id로 순서가 정해지는지 확인하기 위해 일부를 같은 시각으로 변경
+        OutreachInquiry.objects.filter(student_count__lte=4).update(created_at=same_time)
+        self.expected = list(
+            OutreachInquiry.objects.order_by('-created_at', '-id').values_list('title', flat=True)
+        )
+
+    def _titles(self, response):
+        """응답의 문의 제목 목록 반환 함수"""
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['title'] for item in response.data['results']]
+
+    def test_forward_and_backward(self):
+        """다음 페이지로 끝까지 이동한 뒤 이전 페이지로 돌아오는지 테스트 함수"""
+        pages = []
+        response = self.client.get(self.url, {'page_size': 3})
+        self.assertEqual(response.data['count'], 7)
+        self.assertIsNone(response.data['previous'])
+        pages.append(self._titles(response))
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            pages.append(self._titles(response))
+
+        self.assertEqual([title for page in pages for title in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(self._titles(response), pages[1])
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(self._titles(response), pages[0])
+        self.assertIsNone(response.data['previous'])
+
+    def test_ordering_param(self):
+        """ordering 파라미터 필드로 cursor가 동작하는지 테스트 함수"""
+        response = self.client.get(self.url, {'page_size': 4, 'ordering': 'student_count'})
+        self.assertEqual(self._titles(response), ['문의 0', '문의 1', '문의 2', '문의 3'])
+        response = self.client.get(response.data['next'])
+        self.assertEqual(self._titles(response), ['문의 4', '문의 5', '문의 6'])
+        self.assertIsNone(response.data['next'])
+
+    def test_deep_page_without_count_query(self):
+        """count=none이면 COUNT 없이 한 번의 쿼리로 조회하는지 테스트 함수"""
+        first = self.client.get(self.url, {'page_size': 3, 'count': 'none'})
+        self.assertIsNone(first.data['count'])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(first.data['next'])
+        self.assertEqual(self._titles(response), self.expected[3:6])
+
+    def test_estimated_count(self):
+        """count=estimated는 통계가 없으면 정확한 건수로 대체되는지 테스트 함수"""
+        response = self.client.get(self.url, {'count': 'estimated', 'status': '접수대기'})
+        self.assertEqual(response.data['count'], 7)
+
+    def test_invalid_cursor(self):
+        """잘못된 cursor는 404를 반환하는지 테스트 함수"""
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number(self):
+        """기존 ?page=N 요청도 해당 번호의 페이지를 반환하는지 테스트 함수"""
+        response = self.client.get(self.url, {'page': 2, 'page_size': 3})
+        self.assertEqual(self._titles(response), self.expected[3:6])
+        self.assertEqual(response.data['count'], 7)
+        self.assertIn('page=3', response.data['next'])
+        self.assertNotIn('page=', response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(self._titles(response), self.expected[6:])
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get(self.url, {'page': 0})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_max_page_size(self):
+        """page_size는 최대 100으로 제한되는지 테스트 함수"""
+        OutreachInquiry.objects.bulk_create(
+            OutreachInquiry(title=f'추가 문의 {index}') for index in range(120)
+        )
+        response = self.client.get(self.url, {'page_size': 1000, 'count': 'none'})
+        self.assertEqual(len(response.data['results']), 100)
+        self.assertIsNotNone(response.data['next'])
+
+
+class OutreachInquiryListEndpointsTest(TestCase):
+    """
+    내 문의 목록 / 수업 목록 페이지네이션과 전체 내보내기 테스트 클래스
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='teacher',
+            email='teacher@example.com',
+            password='password123'
+        )
+        for index in range(12):
+            OutreachInquiry.objects.create(
+                title=f'내 문의 {index}',
+                user=self.user if index % 2 == 0 else None
+            )
+
+    def test_my_inquiries_paginated(self):
+        """내 문의 목록이 페이지 단위로 반환되는지 테스트 함수"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('outreachinquiry-my-inquiries')
+
+        response = self.client.get(url, {'page_size': 4})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 6)
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertTrue(all(item['is_owner'] for item in response.data['results']))
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['next'])
+
+    def test_internal_class_pages(self):
+        """수업 목록이 시작일순 cursor 페이지로 반환되는지 테스트 함수"""
+        start = timezone.localdate()
+        for index in range(3):
+            InternalClass.objects.create(title=f'수업 {index}', start_date=start + timedelta(days=index))
+
+        response = self.client.get(reverse('internalclass-list'), {'page_size': 2})
+        self.assertEqual([item['title'] for item in response.data['results']], ['수업 0', '수업 1'])
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['title'] for item in response.data['results']], ['수업 2'])
+
+    def test_export_streams_all_rows(self):
+        """관리자는 전체 문의를 NDJSON으로 내보낼 수 있는지 테스트 함수"""
+        url = reverse('outreachinquiry-export')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url, {'search': '내 문의 1'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual([row['title'] for row in rows], ['내 문의 11', '내 문의 10', '내 문의 1'])
+
+
+class OutreachQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """
+    문의 / 수업 목록 API 실행 계획 테스트 클래스
+
+    10만 건 이상의 데이터에서 목록 API 쿼리가 인덱스를 사용하는지(전체 스캔이 없는지) 테스트합니다.
+    """
+    inquiry_table = OutreachInquiry._meta.db_table
+    class_table = InternalClass._meta.db_table
+
+    @classmethod
+    def setUpTestData(cls):
+        """문의 / 수업 데이터 생성 및 통계 갱신"""
+        cls.users = User.objects.bulk_create(
+            User(username=f'teacher{index}', email=f'teacher{index}@example.com')
+            for index in range(20)
+        )
+        status_keys = [key for key, _ in OutreachInquiry.STATUS_CHOICES]
+        course_keys = [key for key, _ in OutreachInquiry.COURSE_TYPE_CHOICES]
+        cls.seed(OutreachInquiry, [
+            OutreachInquiry(
+                title=f'문의 {index}',
+                status=status_keys[index % len(status_keys)],
+                course_type=course_keys[index % len(course_keys)],
+                user=cls.users[index % 40] if index % 40 < len(cls.users) else None
+            )
+            for index in range(400)
+        ])
+
+        class_course_keys = [key for key, _ in InternalClass._meta.get_field('course_type').choices]
+        class_type_keys = [key for key, _ in InternalClass.CLASS_TYPE_CHOICES]
+        start = timezone.localdate()
+        cls.seed(InternalClass, [
+            InternalClass(
+                title=f'수업 {index}',
+                course_type=class_course_keys[index % len(class_course_keys)],
+                class_type=class_type_keys[index % len(class_type_keys)],
+                is_active=index % 10 != 0,
+                start_date=start + timedelta(days=index),
+                max_students=20,
+                current_students=index % 25 if index % 25 <= 20 else 20
+            )
+            for index in range(400)
+        ])
+        cls.analyze()
+
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        cache.clear()
+        self.client = APIClient()
+
+    def _get(self, url, params=None):
+        """GET 요청 후 200 응답인지 확인하는 함수"""
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_inquiry_list(self):
+        """문의 목록 / 상태·교육 과정 필터 / 다음 페이지 실행 계획 테스트 함수"""
+        url = reverse('outreachinquiry-list')
+        tables = [self.inquiry_table]
+        response = self.assertIndexedQueries(tables, self._get, url)
+        self.assertIndexedQueries(tables, self._get, response.data['next'])
+        self.assertIndexedQueries(tables, self._get, url, {'status': '검토중'})
+        self.assertIndexedQueries(tables, self._get, url, {'course_type': 'python'})
+
+    def test_my_inquiries(self):
+        """내 문의 목록 실행 계획 테스트 함수"""
+        self.client.force_authenticate(user=self.users[0])
+        response = self.assertIndexedQueries(
+            [self.inquiry_table], self._get, reverse('outreachinquiry-my-inquiries')
+        )
+        self.assertGreater(response.data['count'], 0)
+
+    def test_class_lists(self):
+        """수업 목록 / 교육 과정별 / 인기 / 신청 가능 수업 실행 계획 테스트 함수"""
+        tables = [self.class_table]
+        url = reverse('internalclass-list')
+        response = self.assertIndexedQueries(tables, self._get, url)
+        self.assertIndexedQueries(tables, self._get, response.data['next'])
+        self.assertIndexedQueries(tables, self._get, url, {'course_type': 'python'})
+        self.assertIndexedQueries(
+            tables, self._get, reverse('internalclass-by-course-type'), {'course_type': 'arduino'}
+        )
+        self.assertIndexedQueries(tables, self._get, reverse('internalclass-popular'))
+        self.assertIndexedQueries(tables, self._get, reverse('internalclass-available'))
@@ -0,0 +1,9 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class SeatHoldThrottle(UserRateThrottle):
+    """
+    좌석 임시 예약 요청 수 제한
+    - 로그인 사용자는 사용자별, 비로그인 사용자는 IP별 (settings의 seat_hold 비율)
+    """
+    scope = 'seat_hold'
@@ -1,21 +1,53 @@
+import json
 from django.shortcuts import render
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, F
-from .models import OutreachInquiry, InternalClass
+from django.db import transaction
+from django.db.models import Q, F, Sum, Count, Value, Prefetch, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_date
+from .models import (
+    OutreachInquiry,
+    InternalClass,
+    InquiryStatsSnapshot,
+    Curriculum,
+    ClassMaterial,
+    SeatHold,
+    SeatHoldLimitExceeded
+)
 from .permissions import IsOwnerOrReadOnly
+from .throttles import SeatHoldThrottle
+from config.cache import cached_response, invalidate_cache_group
+from config.conditional import conditional_retrieve
+from config.pagination import KeysetPagination
 from .serializers import (
     OutreachInquirySerializer,
     OutreachInquiryCreateSerializer,
     OutreachInquiryListSerializer,
     InternalClassSerializer,
     InternalClassListSerializer,
-    ClassEnrollmentSerializer
+    ClassEnrollmentSerializer,
+    SeatHoldSerializer
 )
 
+# 전체 내보내기 시 한 번에 DB에서 읽어오는 행 수
+EXPORT_CHUNK_SIZE = 2000
+
+
+class InternalClassPagination(KeysetPagination):
+    """
+    수업 목록 페이지네이션 클래스
+    - 기본 정렬인 (start_date, id) 기준 cursor 방식
+    """
+    ordering = 'start_date'
+
+
 class OutreachInquiryViewSet(viewsets.ModelViewSet):
     """
     코딩 출강 교육 문의 ViewSet
@@ -23,10 +55,13 @@ class OutreachInquiryViewSet(viewsets.ModelViewSet):
     - 상세 조회: 로그인한 사용자만 가능 
     - 생성: 모든 사용자 가능 (로그인 시 작성자 자동 설정)
     - 수정/삭제: 작성자만 가능
+    - 목록은 (정렬 필드, id) 기준 cursor 페이지네이션
+    - 전체 목록이 필요한 경우 export 액션으로 스트리밍 (관리자만)
     """
     queryset = OutreachInquiry.objects.all()
     serializer_class = OutreachInquirySerializer
     permission_classes = [AllowAny]  # 기본적으로 모든 사용자 허용
+    pagination_class = KeysetPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'requester_name', 'location']
     ordering_fields = ['created_at', 'preferred_date', 'student_count']
@@ -39,8 +74,11 @@ class OutreachInquiryViewSet(viewsets.ModelViewSet):
         - create: 로그인한 사용자만 허용 (새 요구사항)
         - retrieve: 로그인한 사용자만 허용
         - update, partial_update, destroy: 작성자만 허용
+        - export: 관리자만 허용
         """
-        if self.action in ['retrieve', 'create']:
+        if self.action == 'export':
+            permission_classes = [IsAdminUser]
+        elif self.action in ['retrieve', 'create']:
             # 상세 조회와 생성은 로그인 필요
             permission_classes = [IsAuthenticated]
         elif self.action in ['update', 'partial_update', 'destroy']:
@@ -110,38 +148,104 @@ class OutreachInquiryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        my_inquiries = self.queryset.filter(user=request.user)
-        serializer = OutreachInquiryListSerializer(my_inquiries, many=True)
-        return Response(serializer.data)
+        my_inquiries = self.queryset.filter(user=request.user).select_related('user')
+        page = self.paginate_queryset(my_inquiries)
+        serializer = OutreachInquiryListSerializer(
+            page, many=True, context={'request': request}
+        )
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        전체 문의 목록 내보내기 (관리자만)
+        GET /api/v1/outreach-inquiries/export/
+        - 목록과 같은 필터/정렬을 적용하고 한 줄에 문의 하나씩 JSON(NDJSON)으로 스트리밍
+        - iterator로 EXPORT_CHUNK_SIZE씩 읽으므로 행 수와 관계없이 메모리 사용량 일정
+        """
+        queryset = self.filter_queryset(self.get_queryset()).select_related('user')
+        # 행마다 시리얼라이저를 새로 만들지 않고 필드 구성을 재사용
+        serializer = OutreachInquiryListSerializer(context=self.get_serializer_context())
+
+        def rows():
+            for inquiry in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                data = serializer.to_representation(inquiry)
+                yield json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+        response = StreamingHttpResponse(rows(), content_type='application/x-ndjson; charset=utf-8')
+        response['Content-Disposition'] = 'attachment; filename="outreach_inquiries.ndjson"'
+        return response
     
     @action(detail=False, methods=['get'])
+    @cached_response('inquiries')
     def statistics(self, request):
         """
         문의 통계 정보 반환
-        GET /api/v1/outreach-inquiries/statistics/
+        GET /api/v1/outreach-inquiries/statistics/?created_after=2025-01-01&created_before=2025-12-31
+        - 원본 문의 테이블 대신 (일자, 상태, 교육 과정) 집계 테이블만 조회
+        - 비로그인 요청은 응답 캐시 사용 (문의 변경 시 무효화)
         """
-        total_count = self.queryset.count()
-        status_counts = {}
-        course_type_counts = {}
-        
-        # 상태별 집계
-        for status_choice in OutreachInquiry.STATUS_CHOICES:
-            status_key = status_choice[0]
-            count = self.queryset.filter(status=status_key).count()
-            status_counts[status_key] = count
-            
-        # 교육 과정별 집계
-        for course_choice in OutreachInquiry.COURSE_TYPE_CHOICES:
-            course_key = course_choice[0]
-            count = self.queryset.filter(course_type=course_key).count()
-            course_type_counts[course_key] = count
-            
-        # 총 교육 대상자 수
-        total_students = sum(
-            inquiry.student_count for inquiry in self.queryset.all()
+        snapshots = InquiryStatsSnapshot.objects.order_by()
+        try:
+            created_after = self._parse_date_param(request.query_params, 'created_after')
+            created_before = self._parse_date_param(request.query_params, 'created_before')
+        except ValueError:
+            return Response(
+                {'error': '날짜는 YYYY-MM-DD 형식이어야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 두 날짜 모두 해당 일자를 포함
+        if created_after:
+            snapshots = snapshots.filter(day__gte=created_after)
+        if created_before:
+            snapshots = snapshots.filter(day__lte=created_before)
+
+        rows = snapshots.values('status', 'course_type').annotate(
+            count=Sum('inquiry_count'),
+            students=Sum('student_sum')
         )
-        
-        return Response({
+        return Response(self._build_statistics(rows))
+
+    def _parse_date_param(self, params, name):
+        """
+        YYYY-MM-DD 형식의 쿼리 파라미터를 date로 변환
+
+        Raises:
+            ValueError: 날짜 형식이 올바르지 않은 경우
+        """
+        value = params.get(name)
+        if not value:
+            return None
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(value)
+        return date
+
+    def _build_statistics(self, rows):
+        """
+        (status, course_type)별 집계 행으로 통계 응답 구성
+
+        Args:
+            rows: status, course_type, count, students 키를 가진 dict 목록
+
+        Returns:
+            dict: 통계 응답 데이터
+        """
+        status_counts = {key: 0 for key, _ in OutreachInquiry.STATUS_CHOICES}
+        course_type_counts = {key: 0 for key, _ in OutreachInquiry.COURSE_TYPE_CHOICES}
+        total_count = 0
+        total_students = 0
+
+        for row in rows:
+            total_count += row['count']
+            total_students += row['students'] or 0
+            if row['status'] in status_counts:
+                status_counts[row['status']] += row['count']
+            if row['course_type'] in course_type_counts:
+                course_type_counts[row['course_type']] += row['count']
+
+        return {
             'total_inquiries': total_count,
             'total_students': total_students,
             'status_breakdown': status_counts,
@@ -154,13 +258,15 @@ class OutreachInquiryViewSet(viewsets.ModelViewSet):
                 status_counts.get('진행중', 0)
             ),
             'completed_count': status_counts.get('완료', 0)
-        })
+        }
     
     @action(detail=False, methods=['get'])
+    @cached_response('inquiries')
     def recent(self, request):
         """
         최근 문의 목록 반환 (최대 5개)
         GET /api/v1/outreach-inquiries/recent/
+        - 비로그인 요청은 응답 캐시 사용 (문의 변경 시 무효화)
         """
         recent_inquiries = self.queryset[:5]
         serializer = OutreachInquiryListSerializer(recent_inquiries, many=True)
@@ -198,6 +304,7 @@ class InternalClassViewSet(viewsets.ReadOnlyModelViewSet):
     """
     내부 교육 수업 ViewSet
     Read-Only 기능만 제공 (Admin에서 관리)
+    - 목록형 액션은 (시작일, id) 기준 cursor 페이지네이션 (인기 수업은 상위 5개)
     """
     queryset = InternalClass.objects.filter(is_active=True)
     serializer_class = InternalClassSerializer
@@ -207,6 +314,7 @@ class InternalClassViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['start_date', 'price', 'current_students']
     ordering = ['start_date']  # 기본 정렬: 시작일순
     permission_classes = [AllowAny]  # 모든 사용자 조회 허용
+    pagination_class = InternalClassPagination
     
     def get_queryset(self):
         """쿼리 파라미터를 사용한 필터링"""
@@ -232,28 +340,103 @@ class InternalClassViewSet(viewsets.ReadOnlyModelViewSet):
         if instructor:
             queryset = queryset.filter(instructor__icontains=instructor)
         
-        return queryset.order_by('start_date')
+        if self.action == 'retrieve':
+            return self._with_details(queryset)
+        return self._with_counts(queryset).order_by('start_date')
+
+    def _with_details(self, queryset):
+        """
+        상세 시리얼라이저용 커리큘럼/교구재 prefetch 및 교구재 비용 집계
+        - 커리큘럼은 차시순으로, 교구재는 10명 기준 비용을 SQL로 계산하여 prefetch
+        - ?student_count=N (기본 10명) 기준 수업 전체 교구재 비용을 SQL로 집계
+        """
+        student_count = self.request.query_params.get('student_count', 10)
+        try:
+            student_count = int(student_count)
+        except (TypeError, ValueError):
+            student_count = 0
+        if not 1 <= student_count <= 100:
+            raise ValidationError({'student_count': '학생 수는 1~100 사이의 숫자여야 합니다.'})
+
+        return queryset.prefetch_related(
+            Prefetch(
+                'curriculum_items',
+                queryset=Curriculum.objects.order_by('session_number')
+            ),
+            Prefetch(
+                'materials',
+                queryset=ClassMaterial.objects.annotate(
+                    total_price_for_10=F('price_estimate') * F('quantity') * 10
+                )
+            )
+        ).annotate(
+            material_student_count=Value(student_count),
+            material_cost_total=Sum(
+                F('materials__price_estimate') * F('materials__quantity') * student_count
+            )
+        )
+
+    def _with_counts(self, queryset):
+        """
+        목록 시리얼라이저용 커리큘럼 차시 수 / 필수 교구재 수 annotate
+        - 행마다 COUNT 쿼리를 보내지 않도록 한 번의 쿼리로 집계
+        - JOIN + GROUP BY 대신 상관 서브쿼리로 집계하여 페이지 조회는 (시작일, id) 인덱스 순서로
+          LIMIT만큼만 읽고, 페이지네이션 COUNT에서는 annotate가 제거되도록 함
+        """
+        def count_of(related):
+            return Coalesce(Subquery(
+                related.filter(internal_class=OuterRef('pk'))
+                .order_by()
+                .values('internal_class')
+                .annotate(count=Count('pk'))
+                .values('count')
+            ), 0)
+
+        return queryset.annotate(
+            curriculum_count=count_of(Curriculum.objects.all()),
+            required_materials_count=count_of(ClassMaterial.objects.filter(is_required=True))
+        )
     
     def get_serializer_class(self):
         """액션에 따라 다른 시리얼라이저 사용"""
         if self.action == 'list':
             return InternalClassListSerializer
         return InternalClassSerializer
+
+    @conditional_retrieve('updated_at', 'current_students', 'held_seats')
+    def retrieve(self, request, *args, **kwargs):
+        """
+        수업 상세 조회
+        - updated_at과 신청/예약 인원 기반 ETag / Last-Modified, 변경이 없으면 304 반환
+        - 커리큘럼/교구재 변경 시 시그널로 updated_at 갱신
+        """
+        return super().retrieve(request, *args, **kwargs)
+
+    @cached_response('classes')
+    def list(self, request, *args, **kwargs):
+        """
+        수업 목록 조회
+        - 비로그인 요청은 응답 캐시 사용 (수업/커리큘럼/교구재/좌석 변경 시 무효화)
+        """
+        return super().list(request, *args, **kwargs)
     
     @action(detail=False, methods=['get'])
+    @cached_response('classes')
     def available(self, request):
         """
         신청 가능한 수업만 반환
         GET /api/v1/internal-classes/available/
         """
-        available_classes = self.queryset.filter(
+        available_classes = self._with_counts(self.queryset).filter(
             is_active=True,
-            current_students__lt=F('max_students')
+            current_students__lt=F('max_students') - F('held_seats')
         )
-        serializer = InternalClassListSerializer(available_classes, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(available_classes)
+        serializer = InternalClassListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @cached_response('classes')
     def by_course_type(self, request):
         """
         교육 과정별 수업 목록
@@ -266,15 +449,20 @@ class InternalClassViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        classes = self.queryset.filter(course_type=course_type)
-        serializer = InternalClassListSerializer(classes, many=True)
-        return Response(serializer.data)
+        classes = self._with_counts(self.queryset).filter(course_type=course_type)
+        page = self.paginate_queryset(classes)
+        serializer = InternalClassListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=True, methods=['post'])
     def enroll(self, request, pk=None):
         """
         수업 신청 (OutreachInquiry로 변환)
         POST /api/v1/internal-classes/{id}/enroll/
+        - 신청 인원(student_count)만큼 좌석을 조건부 UPDATE로 확보
+        - 만료된 임시 예약을 먼저 해제하고, hold_token이 유효하면 임시 예약 좌석을 먼저 사용
+        - 좌석 확보와 문의 생성은 하나의 트랜잭션으로 처리
+        - 정원이 부족하면 409 반환
         """
         internal_class = self.get_object()
         
@@ -287,33 +475,86 @@ class InternalClassViewSet(viewsets.ReadOnlyModelViewSet):
             context={'request': request}
         )
         
-        if serializer.is_valid():
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        seat_count = serializer.validated_data.get('student_count')
+        hold_token = serializer.validated_data.get('hold_token')
+
+        with transaction.atomic():
+            # 주기 작업이 아직 해제하지 않은 만료 예약 좌석도 신청 가능하도록 먼저 해제
+            SeatHold.release_expired(internal_class_id=internal_class.pk)
+
+            # 유효한 임시 예약이 있으면 예약 좌석을 먼저 전환
+            converted = internal_class.convert_hold(hold_token, seat_count) if hold_token else 0
+            seat_count = seat_count or converted or 1
+
+            if seat_count > converted and not internal_class.reserve_seats(seat_count - converted):
+                transaction.set_rollback(True)
+                return Response(
+                    {'error': '정원이 마감되어 신청할 수 없습니다.'},
+                    status=status.HTTP_409_CONFLICT
+                )
+
             # 로그인한 사용자인 경우 작성자로 설정
             if request.user and request.user.is_authenticated:
-                inquiry = serializer.save(user=request.user)
+                inquiry = serializer.save(user=request.user, student_count=seat_count)
             else:
-                inquiry = serializer.save(user=None)
-            
-            # 신청자 수 증가
-            internal_class.current_students += 1
-            internal_class.save()
-            
-            return Response({
-                'message': '수업 신청이 완료되었습니다.',
-                'inquiry_id': inquiry.id,
-                'class_title': internal_class.title,
-                'status': '접수대기'
-            }, status=status.HTTP_201_CREATED)
-        else:
+                inquiry = serializer.save(user=None, student_count=seat_count)
+
+            # 신청 인원은 UPDATE로 변경되어 시그널이 없으므로 목록 캐시 직접 무효화
+            invalidate_cache_group('classes')
+        
+        return Response({
+            'message': '수업 신청이 완료되었습니다.',
+            'inquiry_id': inquiry.id,
+            'class_title': internal_class.title,
+            'status': '접수대기'
+        }, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['post'], throttle_classes=[SeatHoldThrottle])
+    def hold(self, request, pk=None):
+        """
+        신청서 작성 동안 좌석 임시 예약
+        POST /api/v1/internal-classes/{id}/hold/
+        - 예약 좌석은 SEAT_HOLD_MINUTES 동안 정원 계산에 포함
+        - 발급된 token을 enroll 요청의 hold_token으로 전달하면 예약 좌석으로 신청
+        - 요청 수는 사용자/IP별로 제한 (seat_hold throttle, 초과 시 429)
+        - 예약당 좌석 수는 SEAT_HOLD_MAX_SEATS, 사용자/IP별 유효 예약 수는 SEAT_HOLD_MAX_ACTIVE까지 (초과 시 429)
+        - 좌석이 부족하면 409 반환
+        """
+        internal_class = self.get_object()
+        serializer = SeatHoldSerializer(data=request.data)
+        if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        user = request.user if request.user and request.user.is_authenticated else None
+        client_ip = SeatHoldThrottle().get_ident(request)
+        try:
+            hold = internal_class.hold_seats(
+                serializer.validated_data.get('seat_count', 1), user=user, client_ip=client_ip
+            )
+        except SeatHoldLimitExceeded:
+            return Response(
+                {'error': '진행 중인 좌석 예약이 너무 많습니다. 기존 예약으로 신청하거나 만료 후 다시 시도해 주세요.'},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+        if hold is None:
+            return Response(
+                {'error': '정원이 마감되어 좌석을 예약할 수 없습니다.'},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        return Response(SeatHoldSerializer(hold).data, status=status.HTTP_201_CREATED)
     
     @action(detail=False, methods=['get'])
+    @cached_response('classes')
     def popular(self, request):
         """
         인기 수업 목록 (신청률 기준)
         GET /api/v1/internal-classes/popular/
         """
-        popular_classes = self.queryset.filter(
+        popular_classes = self._with_counts(self.queryset).filter(
             current_students__gt=0
         ).order_by('-current_students')[:5]
         
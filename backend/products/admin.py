@@ -4,7 +4,14 @@ from django.core.exceptions import ValidationError
 from django.forms import BaseInlineFormSet, ModelForm, Select
 from django import forms
 from django.conf import settings
+from django.core.files.storage import default_storage
+from django.contrib.admin.widgets import get_select2_language
+from django.http import JsonResponse
+from django.urls import path, reverse
 import os
+from config.storage import is_blob_path
+from products.models.media_asset import MediaAsset
+from products.models.media_blob import MediaBlob
 from products.models.product import Product
 from products.models.product_image import ProductImage
 from products.models.category import Category
@@ -12,22 +19,62 @@ from products.models.tag import Tag
 from ckeditor_uploader.widgets import CKEditorUploadingWidget
 from django.utils.safestring import mark_safe
 
-def get_media_files():
+class MediaAssetAutocomplete(forms.Select):
     """
-    media 폴더의 이미지 파일들을 찾아서 반환
+    미디어 라이브러리 검색형 선택 위젯
+    - 관리자 select2 자동완성으로 MediaAssetAdmin의 검색 API를 페이지 단위로 조회
+    - 전체 파일 목록 대신 선택된 값만 <option>으로 렌더링
     """
-    media_path = os.path.join(settings.MEDIA_ROOT, 'uploads')
-    choices = [('', '---------')]  # 빈 선택 옵션 추가
-    
-    if os.path.exists(media_path):
-        for root, dirs, files in os.walk(media_path):
-            for file in files:
-                if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                    full_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(full_path, settings.MEDIA_ROOT)
-                    choices.append((rel_path, os.path.basename(rel_path)))
-    
-    return choices
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        attrs.update({
+            'class': (attrs.get('class', '') + ' admin-autocomplete').strip(),
+            'data-ajax--cache': 'true',
+            'data-ajax--delay': 250,
+            'data-ajax--type': 'GET',
+            'data-ajax--url': reverse('admin:products_mediaasset_autocomplete'),
+            'data-theme': 'admin-autocomplete',
+            'data-allow-clear': 'true',
+            'data-placeholder': '파일명으로 검색',
+            'lang': get_select2_language() or '',
+            # 미리보기 URL 접두어 (S3 호환 저장소면 버킷 / CDN 주소)
+            'data-media-url': default_storage.url(''),
+        })
+        # 저장소가 presigned URL을 지원하면 브라우저 직접 업로드 사용 (admin/js/direct_upload.js)
+        if hasattr(default_storage, 'presigned_upload'):
+            attrs.update({
+                'data-direct-upload-url': reverse('products:media-upload'),
+                'data-direct-upload-complete-url': reverse('products:media-upload-complete'),
+            })
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        """선택된 파일만 옵션으로 구성 (blob은 해시 대신 업로드 시 파일명 표시)"""
+        names = dict(MediaAsset.objects.filter(path__in=[path for path in value if path]).values_list('path', 'name'))
+        self.choices = [('', '')] + [(path, names.get(path) or os.path.basename(path)) for path in value if path]
+        return super().optgroups(name, value, attrs)
+
+    @property
+    def media(self):
+        extra = '' if settings.DEBUG else '.min'
+        language = get_select2_language()
+        i18n_file = (f'admin/js/vendor/select2/i18n/{language}.js',) if language else ()
+        return forms.Media(
+            js=(
+                f'admin/js/vendor/jquery/jquery{extra}.js',
+                f'admin/js/vendor/select2/select2.full{extra}.js',
+            ) + i18n_file + (
+                'admin/js/jquery.init.js',
+                'admin/js/autocomplete.js',
+                'admin/js/direct_upload.js',
+            ),
+            css={
+                'screen': (
+                    f'admin/css/vendor/select2/select2{extra}.css',
+                    'admin/css/autocomplete.css',
+                ),
+            },
+        )
 
 class ProductImageForm(ModelForm):
     """
@@ -36,9 +83,9 @@ class ProductImageForm(ModelForm):
     - 신규/기존 상품별 검증 로직 분리
     """
     
-    media_file = forms.ChoiceField(
-        choices=get_media_files,
+    media_file = forms.CharField(
         required=False,
+        widget=MediaAssetAutocomplete(),
         label='미디어 파일에서 선택'
     )
     
@@ -59,10 +106,16 @@ class ProductImageForm(ModelForm):
             rel_path = str(self.instance.image)
             if rel_path.startswith('/'):
                 rel_path = rel_path[1:]
-            choices_dict = dict(get_media_files())
-            if rel_path in choices_dict:
+            if MediaAsset.objects.filter(path=rel_path).exists():
                 self.initial['media_file'] = rel_path
 
+    def clean_media_file(self):
+        """미디어 라이브러리 색인에 있는 파일인지 확인"""
+        media_file = self.cleaned_data.get('media_file')
+        if media_file and not MediaAsset.objects.filter(path=media_file).exists():
+            raise ValidationError('미디어 라이브러리에 없는 파일입니다.')
+        return media_file
+
     def clean(self):
         """
         폼 유효성 검사 수행
@@ -75,8 +128,9 @@ class ProductImageForm(ModelForm):
         media_file = cleaned_data.get('media_file')
         is_thumbnail = cleaned_data.get('is_thumbnail', False)
 
-        # 미디어 파일이 선택되었으면 이미지로 사용
-        if media_file:
+        # 미디어 파일을 새로 선택했으면 이미지로 사용
+        # (기존 이미지가 선택기 초기값으로 채워진 경우는 업로드한 이미지 유지)
+        if media_file and 'media_file' in self.changed_data:
             cleaned_data['image'] = self._process_media_file(media_file)
         
         # 빈 폼인지 확인 (모든 필드가 비어있는 경우)
@@ -106,48 +160,22 @@ class ProductImageForm(ModelForm):
     
     def _process_media_file(self, media_file):
         """
-        선택된 미디어 파일을 이미지 필드로 변환
-        - 안전한 파일 경로 처리
-        - 파일 존재 여부 확인
+        선택된 미디어 파일을 이미지 필드 값으로 변환
+        - 파일을 읽거나 복사하지 않고 저장된 파일 경로를 그대로 참조
+          (같은 파일을 여러 상품 이미지가 공유하며, 삭제는 참조 수 기준으로 처리)
         
         Args:
-            media_file (str): 미디어 파일 경로
+            media_file (str): MEDIA_ROOT 기준 미디어 파일 경로
             
         Returns:
-            File: Django File 객체 또는 None
-        """
-        from django.core.files import File
-        import os
-        from io import BytesIO
+            str: 이미지 필드에 저장할 파일 경로
         
-        if not media_file:
-            return None
-            
-        # 다양한 경로 패턴 시도
-        file_paths = [
-            os.path.join(settings.MEDIA_ROOT, media_file),
-            os.path.join(settings.MEDIA_ROOT, 'uploads', media_file),
-            os.path.join(settings.MEDIA_ROOT, 'products', media_file)
-        ]
-        
-        for file_path in file_paths:
-            if os.path.exists(file_path):
-                try:
-                    # 파일을 메모리에 완전히 읽어서 처리
-                    with open(file_path, 'rb') as f:
-                        file_content = f.read()
-                        file_name = os.path.basename(media_file)
-                        
-                    # 파일 내용으로부터 새 File 객체 생성
-                    file_buffer = BytesIO(file_content)
-                    file_buffer.name = file_name
-                    return File(file_buffer)
-                except Exception as e:
-                    print(f"파일 처리 오류: {file_path}, {e}")
-                    continue
-        
-        print(f"미디어 파일을 찾을 수 없습니다: {media_file}")
-        return None
+        Raises:
+            ValidationError: 색인에는 있지만 디스크에서 사라진 파일인 경우
+        """
+        if not default_storage.exists(media_file):
+            raise ValidationError({'media_file': '파일을 찾을 수 없습니다. 미디어 라이브러리를 다시 검사해주세요.'})
+        return media_file
 
 class ProductImageInlineFormSet(BaseInlineFormSet):
     """
@@ -251,64 +279,7 @@ class ProductAdmin(admin.ModelAdmin):
     search_fields = ('name', 'description')
     filter_horizontal = ('tags',)
     inlines = [ProductImageInline]
-    
-    def save_related(self, request, form, formsets, change):
-        """
-        관련 객체들 저장 처리
-        - 인라인 이미지들의 안전한 저장
-        - 대표 이미지 자동 지정 로직
-        
-        Args:
-            request: HTTP 요청 객체
-            form: 메인 폼 인스턴스
-            formsets: 인라인 폼셋들
-            change: 수정 여부
-        """
-        # 기본 관련 객체 저장
-        super().save_related(request, form, formsets, change)
-        
-        # 이미지 관련 후처리
-        self._post_process_images(form.instance)
-    
-    def _post_process_images(self, product_instance):
-        """
-        이미지 저장 후 스마트 처리 로직
-        - 대표 이미지 자동 지정 및 중복 방지
-        - 유연한 이미지 관리
-        
-        Args:
-            product_instance: Product 모델 인스턴스
-        """
-        images = product_instance.images.all()
-        
-        # 이미지가 없는 경우 처리 불필요
-        if not images.exists():
-            return
-            
-        # 대표 이미지 상태 확인 및 정리
-        self._ensure_single_thumbnail(images)
-    
-    def _ensure_single_thumbnail(self, images):
-        """
-        대표 이미지 단일 지정 보장
-        - 대표 이미지가 없으면 첫 번째를 지정
-        - 여러 개 있으면 첫 번째만 유지
-        
-        Args:
-            images: ProductImage 쿼리셋
-        """
-        thumbnail_images = images.filter(is_thumbnail=True)
-        
-        if not thumbnail_images.exists():
-            # 대표 이미지가 없으면 첫 번째 이미지를 대표로 지정
-            first_image = images.first()
-            if first_image:
-                first_image.is_thumbnail = True
-                first_image.save()
-        elif thumbnail_images.count() > 1:
-            # 여러 개의 대표 이미지가 있으면 첫 번째만 유지
-            first_thumbnail = thumbnail_images.first()
-            thumbnail_images.exclude(id=first_thumbnail.id).update(is_thumbnail=False)
+    list_select_related = ('category', 'thumbnail_image')
     
     def _handle_new_product_creation(self, obj):
         """
@@ -329,12 +300,9 @@ class ProductAdmin(admin.ModelAdmin):
     tag_list.short_description = '태그'
 
     def thumbnail(self, obj):
-        if obj.images.filter(is_thumbnail=True).exists():
-            image = obj.images.filter(is_thumbnail=True).first()
-        else:
-            image = obj.images.first()
-            
-        if image:
+        # 시그널로 관리되는 대표 이미지 포인터 사용
+        image = obj.thumbnail_image
+        if image and image.image:
             return format_html('<img src="{}" style="width: 100px; height: 100px; object-fit: cover;" />', image.image.url)
         return format_html('<div style="width: 100px; height: 100px; background-color: #f0f0f0; display: flex; align-items: center; justify-content: center;">No Image</div>')
     
@@ -376,3 +344,79 @@ class ProductImageAdmin(admin.ModelAdmin):
         return "No Image"
     
     thumbnail_preview.short_description = '이미지 미리보기'
+
+@admin.register(MediaAsset)
+class MediaAssetAdmin(admin.ModelAdmin):
+    """
+    미디어 라이브러리 관리자 클래스
+    - 색인은 업로드 시 자동 등록, scan_media 명령어로 디스크와 동기화
+    - 상품 이미지 선택기용 파일명 검색 API 제공 (autocomplete/)
+    """
+    list_display = ('preview', 'path', 'dimensions', 'size', 'updated_at')
+    search_fields = ('name',)
+    readonly_fields = ('path', 'directory', 'name', 'size', 'mtime_ns', 'width', 'height', 'content_hash')
+    # 선택기 한 번 조회 시 결과 수
+    autocomplete_page_size = 20
+
+    def has_add_permission(self, request):
+        return False
+
+    def preview(self, obj):
+        return format_html('<img src="{}" style="width: 60px; height: 60px; object-fit: cover;" />', obj.url)
+    preview.short_description = '미리보기'
+
+    def dimensions(self, obj):
+        return f'{obj.width}x{obj.height}' if obj.width else '-'
+    dimensions.short_description = '크기 (px)'
+
+    def get_urls(self):
+        return [
+            path(
+                'autocomplete/',
+                self.admin_site.admin_view(self.autocomplete_view),
+                name='products_mediaasset_autocomplete'
+            ),
+        ] + super().get_urls()
+
+    def autocomplete_view(self, request):
+        """
+        select2 자동완성 응답 ({'results': [{'id', 'text'}], 'pagination': {'more'}})
+        - 파일명 접두어 검색, page 파라미터로 다음 결과 조회
+        """
+        if not self.has_view_or_change_permission(request):
+            return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        offset = (page - 1) * self.autocomplete_page_size
+        assets = list(
+            MediaAsset.search(request.GET.get('term')).values_list('path', 'name')[
+                offset:offset + self.autocomplete_page_size + 1
+            ]
+        )
+        return JsonResponse({
+            'results': [
+                {'id': media_path, 'text': name if is_blob_path(media_path) else media_path}
+                for media_path, name in assets[:self.autocomplete_page_size]
+            ],
+            'pagination': {'more': len(assets) > self.autocomplete_page_size},
+        })
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    """
+    미디어 blob 참조 수 관리자 클래스 (조회 전용)
+    - 참조 수 0인 blob은 gc_media 명령어로 삭제
+    """
+    list_display = ('path', 'size', 'ref_count', 'uploaded_at')
+    list_filter = ('ref_count',)
+    search_fields = ('content_hash',)
+    readonly_fields = ('path', 'content_hash', 'size', 'ref_count', 'uploaded_at', 'created_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
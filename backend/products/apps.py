@@ -5,3 +5,7 @@ class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products'
     verbose_name = '상품 관리'
+
+    def ready(self):
+        """앱이 시작될 때 시그널 등록"""
+        from . import signals  # noqa: F401
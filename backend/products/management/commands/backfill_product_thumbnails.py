@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from products.models import Product, ProductImage
+
+
+class Command(BaseCommand):
+    """
+    상품 대표 이미지 포인터 재계산 명령어
+    """
+    help = '모든 상품의 대표 이미지(thumbnail_image)를 ProductImage 기준으로 다시 채웁니다'
+
+    def handle(self, *args, **options):
+        """대표 이미지 포인터 재계산 메인 로직"""
+        product_ids = Product.objects.values_list('id', flat=True)
+        updated_count = 0
+
+        for product_id in product_ids.iterator():
+            if ProductImage.sync_thumbnail(product_id):
+                updated_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{updated_count}개 상품에 대표 이미지를 지정했습니다.')
+        )
@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.utils.http import http_date
+from django.views.static import serve
+from config.file_serving import FileServingMiddleware
+
+
+class Command(BaseCommand):
+    """
+    파일 응답 방식별 응답 시간/메모리 측정 명령어
+    - 기존: DEBUG 전용 static() URL (django.views.static.serve)
+    - 변경: FileServingMiddleware (조건부 응답, Range, X-Accel-Redirect)
+    - 프로세스 안에서 응답 본문을 끝까지 읽어 측정하므로 WSGI 서버의 sendfile 효과는 포함되지 않음
+    """
+    help = '임시 파일로 static() 뷰와 FileServingMiddleware의 전체 / 304 / Range / X-Accel-Redirect 응답을 측정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[50, 5000],
+            help='측정용 파일 크기 목록 (KB, 기본값: 50 5000)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=50,
+            help='항목별 반복 요청 수 (기본값: 50)',
+        )
+
+    def handle(self, *args, **options):
+        """측정 메인 로직 (임시 MEDIA_ROOT에 파일을 만들고 삭제)"""
+        try:
+            default_storage.path('')
+        except NotImplementedError:
+            raise CommandError('로컬 디스크 저장소(MEDIA_ROOT)에서만 사용할 수 있습니다.')
+
+        self.factory = RequestFactory()
+        self.repeat = options['repeat']
+        root = tempfile.mkdtemp()
+        try:
+            with override_settings(MEDIA_ROOT=root, SERVE_FILES=True, FILE_SENDFILE_BACKEND=None):
+                for size in options['sizes']:
+                    self.benchmark_file(root, size)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def benchmark_file(self, root, size):
+        """파일 크기별 측정"""
+        name = f'benchmark/sample-{size}kb.bin'
+        full_path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as file:
+            file.write(os.urandom(size * 1024))
+        url = f'/media/{name}'
+        middleware = FileServingMiddleware(lambda request: None)
+        etag = middleware(self.factory.get(url))['ETag']
+        modified = http_date(os.stat(full_path).st_mtime)
+        range_kb = min(size, 64)
+        last_kb = f'bytes=-{range_kb * 1024}'
+
+        self.stdout.write(f'파일 {size:,}KB (요청 {self.repeat}회)')
+        for label, func, headers in [
+            ('전체 응답 (기존 static())', lambda request: serve(request, name, document_root=root), {}),
+            ('전체 응답 (미들웨어)', middleware, {}),
+            ('재검증 If-Modified-Since (기존 static())',
+             lambda request: serve(request, name, document_root=root), {'HTTP_IF_MODIFIED_SINCE': modified}),
+            ('재검증 If-None-Match (미들웨어)', middleware, {'HTTP_IF_NONE_MATCH': etag}),
+            (f'Range 마지막 {range_kb}KB (기존 static(), 전체 응답)',
+             lambda request: serve(request, name, document_root=root), {'HTTP_RANGE': last_kb}),
+            (f'Range 마지막 {range_kb}KB (미들웨어)', middleware, {'HTTP_RANGE': last_kb}),
+        ]:
+            self.report(label, lambda: self.request(func, url, headers))
+
+        with override_settings(FILE_SENDFILE_BACKEND='x-accel-redirect'):
+            self.report('X-Accel-Redirect (미들웨어)', lambda: self.request(middleware, url, {}))
+
+    def report(self, label, func):
+        """반복 요청 측정 결과 출력"""
+        elapsed, peak, sent = self.measure(func)
+        self.stdout.write(
+            f'  {label}: 요청당 {elapsed / self.repeat:.2f}ms, '
+            f'최대 메모리 {peak / 1024 / 1024:.2f}MB, 본문 {sent / self.repeat / 1024:.0f}KB'
+        )
+
+    def request(self, handler, url, headers):
+        """
+        반복 요청 후 전송한 본문 크기 합계 반환 (스트리밍 응답은 끝까지 소비)
+        """
+        sent = 0
+        for _ in range(self.repeat):
+            response = handler(self.factory.get(url, **headers))
+            assert response.status_code in (200, 206, 304)
+            if response.streaming:
+                for chunk in response.streaming_content:
+                    sent += len(chunk)
+            else:
+                sent += len(response.content)
+            response.close()
+        return sent
+
+    def measure(self, func):
+        """실행 시간(ms), tracemalloc 최대 메모리(bytes), func 반환값"""
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak, result
@@ -0,0 +1,87 @@
+import os
+import posixpath
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from config.cache import invalidate_cache_group
+from config.images import RENDITION_DIR
+from products.models import MediaBlob
+
+
+class Command(BaseCommand):
+    """
+    기존 media 폴더를 내용 주소 기반 blob으로 옮기는 명령어
+    - MEDIA_CONTENT_ADDRESSED_DIRS 하위 파일을 해시하여 같은 내용은 blob 하나로 합침
+    - 상품 이미지 / 수업 썸네일 경로, 상품 상세 본문 URL, 미디어 라이브러리 색인, rendition 정보를 blob 경로로 변경
+    - blob을 하드 링크로 만든 뒤 참조를 바꾸고 마지막에 기존 파일을 삭제 (중간에 실패해도 참조가 깨지지 않음)
+    """
+    help = '기존 업로드 파일의 중복을 제거하고 내용 주소 기반 경로(blobs/)로 옮깁니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='파일을 옮기지 않고 중복 현황만 출력',
+        )
+
+    def handle(self, *args, **options):
+        """중복 제거 메인 로직"""
+        try:
+            default_storage.path('')
+        except NotImplementedError:
+            raise CommandError('로컬 디스크 저장소(MEDIA_ROOT)에서만 사용할 수 있습니다.')
+
+        paths = sorted(self.legacy_files())
+        if options['dry_run']:
+            self.report(paths)
+            return
+
+        mapping = {path: MediaBlob.adopt(path) for path in paths}
+        with transaction.atomic():
+            MediaBlob.relocate(mapping)
+            MediaBlob.recount()
+
+        for path in mapping:
+            self.remove_legacy_file(path)
+        invalidate_cache_group('products')
+        invalidate_cache_group('classes')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(mapping)}개 파일을 {len(set(mapping.values()))}개 blob으로 옮겼습니다.'
+        ))
+
+    def legacy_files(self):
+        """blob으로 옮길 기존 파일 경로 (rendition 폴더, CKEditor 썸네일 제외)"""
+        for directory in settings.MEDIA_CONTENT_ADDRESSED_DIRS:
+            root = default_storage.path(directory)
+            for current, dirs, files in os.walk(root):
+                dirs[:] = [name for name in dirs if name != RENDITION_DIR]
+                relative = posixpath.join(directory, os.path.relpath(current, root).replace(os.sep, '/'))
+                for name in files:
+                    if not os.path.splitext(name)[0].endswith('_thumb'):
+                        yield posixpath.normpath(posixpath.join(relative, name))
+
+    def report(self, paths):
+        """중복 현황 출력 (--dry-run)"""
+        blobs = {}
+        saved_size = 0
+        for path in paths:
+            stored, content_hash, size = MediaBlob.locate(path)
+            if stored in blobs:
+                saved_size += size
+            blobs.setdefault(stored, []).append(path)
+
+        for stored, group in blobs.items():
+            if len(group) > 1:
+                self.stdout.write(f'{stored}: {", ".join(group)}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(paths)}개 파일 → {len(blobs)}개 blob ({saved_size} bytes 절약 가능)'
+        ))
+
+    def remove_legacy_file(self, path):
+        """기존 파일과 CKEditor 썸네일 삭제"""
+        from ckeditor_uploader.utils import get_thumb_filename
+
+        default_storage.delete(get_thumb_filename(path))
+        default_storage.delete(path)
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from products.models import MediaBlob
+
+
+class Command(BaseCommand):
+    """
+    참조되지 않는 미디어 blob 삭제 명령어
+    - 삭제 전 파일 필드와 본문 HTML을 다시 검사하여 참조 수 보정
+    - CKEditor 업로드처럼 아직 저장되지 않은 본문에서 쓰는 파일을 지우지 않도록
+      마지막 업로드 후 유예 시간(--min-age)이 지난 blob만 삭제
+    """
+    help = '참조 수가 0인 미디어 blob과 rendition을 삭제합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age',
+            type=float,
+            default=24,
+            help='마지막 업로드 후 유예 시간 (시간 단위, 기본값: 24)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='삭제하지 않고 대상만 출력',
+        )
+
+    def handle(self, *args, **options):
+        """blob 정리 메인 로직"""
+        min_age = timedelta(hours=options['min_age'])
+        dry_run = options['dry_run']
+
+        recounted = MediaBlob.recount()
+        if recounted:
+            self.stdout.write(f'{recounted}개 blob의 참조 수를 보정했습니다.')
+
+        removed_count = removed_size = 0
+        for blob in MediaBlob.garbage(min_age).iterator():
+            if not dry_run and not blob.purge(min_age):
+                # 조회 후 다시 참조되거나 업로드된 blob
+                continue
+            self.stdout.write(f'{"삭제 대상" if dry_run else "삭제"}: {blob.path} ({blob.size} bytes)')
+            removed_count += 1
+            removed_size += blob.size
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f'{removed_count}개 blob ({removed_size} bytes)을 삭제할 수 있습니다.'
+            ))
+            return
+
+        stale_count = MediaBlob.remove_stale_uploads(min_age)
+        self.stdout.write(self.style.SUCCESS(
+            f'{removed_count}개 blob ({removed_size} bytes), 임시 파일 {stale_count}개를 삭제했습니다.'
+        ))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from outreach_inquiries.models import InternalClass
+from products.models import ProductImage, ProductImageRendition
+
+
+class Command(BaseCommand):
+    """
+    기존 이미지 rendition 일괄 생성 명령어
+    """
+    help = '상품 이미지와 수업 썸네일의 rendition(WebP/AVIF/JPEG, 고정 너비)을 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 rendition이 있는 이미지도 다시 생성',
+        )
+
+    def handle(self, *args, **options):
+        """rendition 생성 메인 로직 (같은 파일은 한 번만 생성)"""
+        sources = set(
+            ProductImage.objects.exclude(image='').exclude(image=None).values_list('image', flat=True)
+        ) | set(
+            InternalClass.objects.exclude(thumbnail='').exclude(thumbnail=None).values_list('thumbnail', flat=True)
+        )
+        if not options['force']:
+            sources -= set(ProductImageRendition.objects.values_list('source', flat=True))
+
+        generated_count = 0
+        for source in sorted(sources):
+            try:
+                renditions = ProductImageRendition.generate(source)
+            except OSError as e:
+                self.stderr.write(f'rendition 생성 실패: {source} ({e})')
+                continue
+            if renditions:
+                generated_count += 1
+            else:
+                self.stderr.write(f'원본 파일을 찾을 수 없습니다: {source}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{generated_count}개 이미지의 rendition을 생성했습니다.')
+        )
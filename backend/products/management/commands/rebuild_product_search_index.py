@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from products.models import Product, ProductSearchDocument
+
+
+class Command(BaseCommand):
+    """
+    상품 검색 문서 재생성 명령어
+    """
+    help = '모든 상품의 검색 문서(ProductSearchDocument)를 다시 생성합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 상품 수 (기본값: 500)',
+        )
+
+    def handle(self, *args, **options):
+        """검색 문서 재생성 메인 로직"""
+        product_ids = list(Product.objects.values_list('id', flat=True))
+        batch_size = options['batch_size']
+
+        for start in range(0, len(product_ids), batch_size):
+            ProductSearchDocument.refresh(product_ids[start:start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{len(product_ids)}개 상품의 검색 문서를 생성했습니다.')
+        )
@@ -0,0 +1,93 @@
+import os
+import posixpath
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from config.images import RENDITION_DIR
+from products.models import MediaAsset, MediaDirectory
+
+
+class Command(BaseCommand):
+    """
+    미디어 라이브러리 색인 동기화 명령어
+    - 폴더 수정 시각(파일 추가/삭제/이름 변경 시 바뀜)이 그대로인 폴더는 파일을 stat하지 않음
+    - 같은 이름으로 내용만 바뀐 파일까지 확인하려면 --full 사용
+    """
+    help = '미디어 라이브러리 색인(MediaAsset)을 디스크와 동기화합니다 (변경된 폴더만 검사)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='폴더 수정 시각과 관계없이 모든 파일 검사',
+        )
+
+    def handle(self, *args, **options):
+        """색인 동기화 메인 로직"""
+        try:
+            default_storage.path('')
+        except NotImplementedError:
+            raise CommandError('로컬 디스크 저장소(MEDIA_ROOT)에서만 사용할 수 있습니다.')
+
+        self.full = options['full']
+        self.known = dict(MediaDirectory.objects.values_list('path', 'mtime_ns'))
+        self.visited = set()
+        self.stats = {'scanned': 0, 'skipped': 0, 'recorded': 0, 'removed': 0}
+
+        for directory in settings.MEDIA_LIBRARY_DIRS:
+            self.scan_directory(directory)
+
+        # 디스크에서 사라진 폴더
+        removed = set(self.known) - self.visited
+        if removed:
+            self.stats['removed'] += MediaAsset.objects.filter(directory__in=removed).count()
+            MediaAsset.objects.filter(directory__in=removed).delete()
+            MediaDirectory.objects.filter(path__in=removed).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            '폴더 {scanned}개 검사, {skipped}개 변경 없음 / '
+            '파일 {recorded}개 등록, {removed}개 삭제'.format(**self.stats)
+        ))
+
+    def scan_directory(self, directory):
+        """폴더와 하위 폴더 검사 (rendition 폴더 제외)"""
+        full_path = default_storage.path(directory)
+        try:
+            # 목록 조회 전 수정 시각을 기록 (검사 중 추가된 파일은 다음 검사에서 반영)
+            mtime_ns = os.stat(full_path).st_mtime_ns
+            entries = list(os.scandir(full_path))
+        except FileNotFoundError:
+            return
+        self.visited.add(directory)
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and entry.name != RENDITION_DIR:
+                self.scan_directory(posixpath.join(directory, entry.name))
+
+        if not self.full and self.known.get(directory) == mtime_ns:
+            self.stats['skipped'] += 1
+            return
+        self.stats['scanned'] += 1
+
+        indexed = {
+            path: (size, file_mtime_ns)
+            for path, size, file_mtime_ns in MediaAsset.objects.filter(
+                directory=directory
+            ).values_list('path', 'size', 'mtime_ns')
+        }
+        on_disk = set()
+        for entry in entries:
+            path = posixpath.join(directory, entry.name)
+            if not entry.is_file() or not MediaAsset.is_library_path(path):
+                continue
+            on_disk.add(path)
+            stat = entry.stat()
+            if indexed.get(path) != (stat.st_size, stat.st_mtime_ns):
+                MediaAsset.record(path, stat)
+                self.stats['recorded'] += 1
+
+        missing = set(indexed) - on_disk
+        if missing:
+            MediaAsset.objects.filter(path__in=missing).delete()
+            self.stats['removed'] += len(missing)
+        MediaDirectory.objects.update_or_create(path=directory, defaults={'mtime_ns': mtime_ns})
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_thumbnails(apps, schema_editor):
+    """상품별 대표 이미지를 1개로 정리하고 thumbnail_image를 채움"""
+    Product = apps.get_model('products', 'Product')
+    ProductImage = apps.get_model('products', 'ProductImage')
+
+    for product in Product.objects.all():
+        images = ProductImage.objects.filter(product_id=product.pk)
+        thumbnail = images.order_by('-is_thumbnail', 'id').first()
+        if thumbnail is None:
+            continue
+        images.exclude(pk=thumbnail.pk).update(is_thumbnail=False)
+        images.filter(pk=thumbnail.pk).update(is_thumbnail=True)
+        Product.objects.filter(pk=product.pk).update(thumbnail_image=thumbnail)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_alter_productimage_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='thumbnail_image',
+            field=models.ForeignKey(blank=True, editable=False, help_text='ProductImage 저장/삭제 시 자동으로 갱신되는 대표 이미지', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='products.productimage', verbose_name='대표 이미지'),
+        ),
+        migrations.RunPython(backfill_thumbnails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='productimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_thumbnail', True)), fields=('product',), name='unique_product_thumbnail'),
+        ),
+    ]
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:31
+
+import html
+import re
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# 마이그레이션 작성 시점의 검색 색인 정의 (products.search / config.search 변경과 무관하게 고정)
+DOCUMENT_TABLE = 'products_productsearchdocument'
+FTS_TABLE = 'products_search_fts'
+POSTGRES_VECTOR = (
+    "(setweight(to_tsvector('simple', name_tokens), 'A') || "
+    "setweight(to_tsvector('simple', body_tokens), 'B'))"
+)
+TOKEN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+
+
+def tokenize(text):
+    """검색 색인용 토큰 목록 (한글은 2글자 단위, 영문/숫자는 소문자 단어)"""
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.extend(word[index:index + 2] for index in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def create_search_index(apps, schema_editor):
+    """DB별 전문 검색 인덱스 생성 (SQLite FTS5 / PostgreSQL GIN)"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        columns = 'name_tokens, body_tokens'
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"{columns}, content='{DOCUMENT_TABLE}', content_rowid='product_id', "
+            f"tokenize='unicode61')"
+        )
+        insert = (
+            f"INSERT INTO {FTS_TABLE}(rowid, {columns}) "
+            f"VALUES (new.product_id, new.name_tokens, new.body_tokens);"
+        )
+        delete = (
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.product_id, old.name_tokens, old.body_tokens);"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN {insert} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN {delete} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} "
+            f"BEGIN {delete} {insert} END"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX products_search_vector_gin ON {DOCUMENT_TABLE} "
+            f"USING gin ({POSTGRES_VECTOR})"
+        )
+        schema_editor.execute(
+            "CREATE INDEX products_product_name_trgm ON products_product "
+            "USING gin (name gin_trgm_ops)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """DB별 전문 검색 인덱스 삭제"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS products_search_vector_gin")
+        schema_editor.execute("DROP INDEX IF EXISTS products_product_name_trgm")
+
+
+def backfill_search_documents(apps, schema_editor):
+    """기존 상품의 검색 문서 생성 (상품명 / 설명, 상세 설명, 태그, 카테고리 경로)"""
+    Product = apps.get_model('products', 'Product')
+    ProductSearchDocument = apps.get_model('products', 'ProductSearchDocument')
+
+    for product in Product.objects.select_related('category__parent').prefetch_related('tags'):
+        category_path = []
+        category = product.category
+        while category is not None:
+            category_path.insert(0, category.name)
+            category = category.parent
+        body = ' '.join([
+            product.description or '',
+            html.unescape(strip_tags(product.product_detail_info or '')),
+            ' '.join(tag.name for tag in product.tags.all()),
+            ' '.join(category_path),
+        ])
+        ProductSearchDocument.objects.create(
+            product=product,
+            name_tokens=' '.join(tokenize(product.name)),
+            body_tokens=' '.join(tokenize(body))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_product_thumbnail_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSearchDocument',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='products.product', verbose_name='상품')),
+                ('name_tokens', models.TextField(blank=True, verbose_name='상품명 토큰')),
+                ('body_tokens', models.TextField(blank=True, verbose_name='본문 토큰')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='색인 갱신일')),
+            ],
+            options={
+                'verbose_name': '상품 검색 문서',
+                'verbose_name_plural': '상품 검색 문서 목록',
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_product_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductImageRendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='원본 이미지 경로 (storage 기준, 예: products/home_1.JPG)', max_length=255)),
+                ('format', models.CharField(choices=[('avif', 'AVIF'), ('webp', 'WebP'), ('jpeg', 'JPEG')], help_text='이미지 형식', max_length=10)),
+                ('width', models.PositiveIntegerField(help_text='너비 (px)')),
+                ('height', models.PositiveIntegerField(help_text='높이 (px)')),
+                ('file', models.FileField(help_text='rendition 파일', max_length=255, upload_to='')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성일')),
+            ],
+            options={
+                'verbose_name': '이미지 rendition',
+                'verbose_name_plural': '이미지 rendition 목록',
+                'ordering': ['source', 'format', 'width'],
+                'constraints': [models.UniqueConstraint(fields=('source', 'format', 'width'), name='unique_image_rendition')],
+            },
+        ),
+    ]
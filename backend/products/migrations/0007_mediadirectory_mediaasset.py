@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_productimagerendition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaDirectory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(help_text='MEDIA_ROOT 기준 폴더 경로 (예: uploads/2024/01)', max_length=255, unique=True)),
+                ('mtime_ns', models.BigIntegerField(help_text='마지막 검사 시점의 폴더 수정 시각 (ns)')),
+            ],
+            options={
+                'verbose_name': '미디어 폴더',
+                'verbose_name_plural': '미디어 폴더 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='MediaAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(help_text='MEDIA_ROOT 기준 파일 경로 (예: uploads/20240101_120000_ab12cd34.jpg)', max_length=255, unique=True)),
+                ('directory', models.CharField(db_index=True, help_text='파일이 있는 폴더 경로', max_length=255)),
+                ('name', models.CharField(help_text='검색용 파일명 (소문자)', max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='파일 크기 (bytes)')),
+                ('mtime_ns', models.BigIntegerField(help_text='파일 수정 시각 (ns)')),
+                ('width', models.PositiveIntegerField(blank=True, help_text='이미지 너비 (px)', null=True)),
+                ('height', models.PositiveIntegerField(blank=True, help_text='이미지 높이 (px)', null=True)),
+                ('content_hash', models.CharField(db_index=True, help_text='파일 내용 SHA-256 해시', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='등록일')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정일')),
+            ],
+            options={
+                'verbose_name': '미디어 파일',
+                'verbose_name_plural': '미디어 라이브러리',
+                'ordering': ['name', 'path'],
+                'indexes': [models.Index(fields=['name', 'path'], name='media_asset_name_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:35
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_mediadirectory_mediaasset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(help_text='MEDIA_ROOT 기준 blob 경로 (예: blobs/ab/cd/<해시>.jpg)', max_length=255, unique=True)),
+                ('content_hash', models.CharField(db_index=True, help_text='파일 내용 SHA-256 해시', max_length=64)),
+                ('size', models.PositiveBigIntegerField(help_text='파일 크기 (bytes)')),
+                ('ref_count', models.PositiveIntegerField(default=0, help_text='참조 수')),
+                ('uploaded_at', models.DateTimeField(default=django.utils.timezone.now, help_text='마지막 업로드 시각 (gc 유예 시간 기준)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='등록일')),
+            ],
+            options={
+                'verbose_name': '미디어 blob',
+                'verbose_name_plural': '미디어 blob 목록',
+                'ordering': ['path'],
+                'indexes': [models.Index(fields=['ref_count', 'uploaded_at'], name='media_blob_gc_idx')],
+            },
+        ),
+    ]
@@ -2,5 +2,9 @@ from .product import Product
 from .product_image import ProductImage
 from .category import Category
 from .tag import Tag
+from .product_search_document import ProductSearchDocument
+from .product_image_rendition import ProductImageRendition
+from .media_blob import MediaBlob
+from .media_asset import MediaAsset, MediaDirectory
 
-__all__ = ['Product', 'ProductImage', 'Category', 'Tag'] 
\ No newline at end of file
+__all__ = ['Product', 'ProductImage', 'Category', 'Tag', 'ProductSearchDocument', 'ProductImageRendition', 'MediaBlob', 'MediaAsset', 'MediaDirectory'] 
\ No newline at end of file
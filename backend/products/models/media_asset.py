@@ -0,0 +1,201 @@
+import posixpath
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models
+from PIL import Image
+from config.storage import file_hash, is_blob_path
+from .media_blob import MEDIA_REFERENCES
+from .product_image_rendition import ProductImageRendition
+
+# 미디어 라이브러리 대상 이미지 확장자
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+
+class MediaDirectory(models.Model):
+    """
+    미디어 라이브러리 폴더 정보를 저장하는 모델
+    - scan_media 명령어가 폴더 수정 시각이 바뀐 폴더만 다시 살펴보기 위해 사용
+    """
+    path = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="MEDIA_ROOT 기준 폴더 경로 (예: uploads/2024/01)"
+    )
+    mtime_ns = models.BigIntegerField(help_text="마지막 검사 시점의 폴더 수정 시각 (ns)")
+
+    class Meta:
+        verbose_name = '미디어 폴더'
+        verbose_name_plural = '미디어 폴더 목록'
+
+    def __str__(self):
+        return self.path
+
+
+class MediaAsset(models.Model):
+    """
+    미디어 라이브러리 이미지 색인 모델
+    - 업로드 시(config.storage.MediaLibraryStorage) 바로 등록, scan_media 명령어로 디스크와 동기화
+    - 관리자 이미지 선택기는 디스크를 탐색하지 않고 이 테이블만 조회
+    """
+    path = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="MEDIA_ROOT 기준 파일 경로 (예: uploads/20240101_120000_ab12cd34.jpg)"
+    )
+    directory = models.CharField(
+        max_length=255,
+        db_index=True,
+        help_text="파일이 있는 폴더 경로"
+    )
+    name = models.CharField(
+        max_length=255,
+        help_text="검색용 파일명 (소문자)"
+    )
+    size = models.PositiveBigIntegerField(help_text="파일 크기 (bytes)")
+    mtime_ns = models.BigIntegerField(help_text="파일 수정 시각 (ns)")
+    width = models.PositiveIntegerField(null=True, blank=True, help_text="이미지 너비 (px)")
+    height = models.PositiveIntegerField(null=True, blank=True, help_text="이미지 높이 (px)")
+    content_hash = models.CharField(
+        max_length=64,
+        db_index=True,
+        help_text="파일 내용 SHA-256 해시"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, help_text="등록일")
+    updated_at = models.DateTimeField(auto_now=True, help_text="수정일")
+
+    class Meta:
+        verbose_name = '미디어 파일'
+        verbose_name_plural = '미디어 라이브러리'
+        ordering = ['name', 'path']
+        indexes = [
+            # 파일명 접두어 검색 (name 범위 조회 + 정렬)
+            models.Index(fields=['name', 'path'], name='media_asset_name_idx'),
+        ]
+
+    def __str__(self):
+        return self.path
+
+    @property
+    def url(self):
+        """파일 URL"""
+        return default_storage.url(self.path)
+
+    @staticmethod
+    def is_library_path(path):
+        """
+        미디어 라이브러리 대상 경로인지 확인
+        - MEDIA_LIBRARY_DIRS 하위의 이미지 파일 (rendition 폴더 제외)
+        """
+        parts = path.split('/')
+        return (
+            len(parts) > 1
+            and parts[0] in settings.MEDIA_LIBRARY_DIRS
+            and 'renditions' not in parts
+            and path.lower().endswith(IMAGE_EXTENSIONS)
+        )
+
+    @classmethod
+    def search(cls, term):
+        """
+        파일명 접두어 검색 (대소문자 무시)
+        - LIKE 대신 범위 조건으로 조회하여 (name, path) 인덱스 사용
+        """
+        queryset = cls.objects.order_by('name', 'path')
+        term = (term or '').strip().lower()
+        if term:
+            queryset = queryset.filter(name__gte=term, name__lt=term + '\U0010ffff')
+        return queryset
+
+    @classmethod
+    def record(cls, path, stat=None, name=None):
+        """
+        파일 정보를 읽어 색인에 등록 / 갱신
+
+        Args:
+            path: MEDIA_ROOT 기준 파일 경로
+            stat: 이미 조회한 os.stat 결과 (없으면 저장소에서 조회)
+            name: 검색용 파일명 (기본값: 경로의 파일명, blob은 업로드 시 파일명 전달)
+
+        Returns:
+            MediaAsset: 등록된 파일 정보 (파일이 없으면 None)
+        """
+        try:
+            size, mtime_ns = (stat.st_size, stat.st_mtime_ns) if stat else default_storage.file_stat(path)
+            with default_storage.open(path, 'rb') as file:
+                content_hash = file_hash(file)
+                file.seek(0)
+                try:
+                    with Image.open(file) as image:
+                        width, height = image.size
+                except (OSError, ValueError):
+                    width = height = None
+        except FileNotFoundError:
+            cls.objects.filter(path=path).delete()
+            return None
+
+        asset, _ = cls.objects.update_or_create(
+            path=path,
+            defaults={
+                'directory': posixpath.dirname(path),
+                'name': (name or posixpath.basename(path)).lower(),
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'width': width,
+                'height': height,
+                'content_hash': content_hash,
+            }
+        )
+        return asset
+
+    @classmethod
+    def register_upload(cls, path, content_hash, size, mtime_ns, name=None):
+        """
+        브라우저 직접 업로드 파일을 파일을 읽지 않고 색인에 등록
+        - 이미지 크기는 비워 두고 record_media_asset 작업에서 record()로 채움
+        - 이미 등록된 파일은 유지
+
+        Returns:
+            MediaAsset: 등록된 파일 정보
+        """
+        asset, _ = cls.objects.get_or_create(
+            path=path,
+            defaults={
+                'directory': posixpath.dirname(path),
+                'name': (name or posixpath.basename(path)).lower(),
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'content_hash': content_hash,
+            }
+        )
+        return asset
+
+    @staticmethod
+    def reference_count(path):
+        """파일을 사용하는 상품 이미지 / 수업 썸네일 수"""
+        return sum(
+            apps.get_model(model).objects.filter(**{field: path}).count()
+            for model, field in MEDIA_REFERENCES
+        )
+
+    @classmethod
+    def release(cls, path):
+        """
+        참조가 없어진 파일과 rendition 삭제
+        - 다른 상품 이미지 / 수업 썸네일이 같은 파일을 쓰고 있으면 유지
+        - CKEditor 업로드 폴더 파일은 본문 HTML에서 참조할 수 있으므로 유지
+        - blob은 참조 수(MediaBlob)만 관리하고 삭제는 gc_media 명령어에서 처리
+
+        Returns:
+            bool: 파일 삭제 여부
+        """
+        if (
+            not path
+            or is_blob_path(path)
+            or path.startswith(settings.CKEDITOR_UPLOAD_PATH)
+            or cls.reference_count(path)
+        ):
+            return False
+        ProductImageRendition.remove(path)
+        default_storage.delete(path)
+        return True
@@ -0,0 +1,330 @@
+import os
+import posixpath
+import re
+import shutil
+from collections import Counter
+from urllib.parse import unquote
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+from config.storage import BLOB_DIR, BLOB_PATH_PATTERN, blob_name, file_hash, is_blob_path
+from .product_image_rendition import ProductImageRendition
+
+# 미디어 파일 경로를 저장하는 (모델, 파일 필드) 목록
+MEDIA_REFERENCES = [
+    ('products.ProductImage', 'image'),
+    ('outreach_inquiries.InternalClass', 'thumbnail'),
+]
+
+# 본문 HTML에서 미디어 파일을 참조하는 (모델, CKEditor 필드) 목록
+RICH_TEXT_REFERENCES = [
+    ('products.Product', 'product_detail_info'),
+]
+
+
+class MediaBlob(models.Model):
+    """
+    내용 주소 기반 파일(blob) 참조 수 모델
+    - 업로드 시(config.storage.MediaLibraryStorage) 등록, 상품 이미지 / 수업 썸네일 / 상품 상세 본문 저장 시 참조 수 갱신
+    - 참조 수가 0인 blob은 gc_media 명령어가 유예 시간 후 삭제
+      (CKEditor 업로드는 본문을 저장하기 전까지 참조가 없으므로 즉시 삭제하지 않음)
+    """
+    path = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="MEDIA_ROOT 기준 blob 경로 (예: blobs/ab/cd/<해시>.jpg)"
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        db_index=True,
+        help_text="파일 내용 SHA-256 해시"
+    )
+    size = models.PositiveBigIntegerField(help_text="파일 크기 (bytes)")
+    ref_count = models.PositiveIntegerField(default=0, help_text="참조 수")
+    uploaded_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="마지막 업로드 시각 (gc 유예 시간 기준)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, help_text="등록일")
+
+    class Meta:
+        verbose_name = '미디어 blob'
+        verbose_name_plural = '미디어 blob 목록'
+        ordering = ['path']
+        indexes = [
+            # gc 대상 조회 (참조 수 0 + 업로드 시각)
+            models.Index(fields=['ref_count', 'uploaded_at'], name='media_blob_gc_idx'),
+        ]
+
+    def __str__(self):
+        return self.path
+
+    @classmethod
+    def register(cls, path, content_hash, size):
+        """업로드된 blob 등록 (이미 있으면 업로드 시각만 갱신하여 gc 유예 시간 연장)"""
+        blob, created = cls.objects.get_or_create(
+            path=path,
+            defaults={'content_hash': content_hash, 'size': size}
+        )
+        if not created:
+            cls.objects.filter(pk=blob.pk).update(uploaded_at=timezone.now())
+        return blob
+
+    @staticmethod
+    def reference_fields(model):
+        """
+        모델의 미디어 참조 필드 목록
+
+        Returns:
+            list: [(필드명, 본문 HTML 여부), ...]
+        """
+        label = model._meta.label
+        return [
+            (field, False) for name, field in MEDIA_REFERENCES if name == label
+        ] + [
+            (field, True) for name, field in RICH_TEXT_REFERENCES if name == label
+        ]
+
+    @staticmethod
+    def paths_in(value, html=False):
+        """필드 값이 참조하는 blob 경로 집합 (본문 HTML은 URL에서 추출)"""
+        value = getattr(value, 'name', value) or ''
+        if html:
+            return set(BLOB_PATH_PATTERN.findall(value))
+        return {value} if is_blob_path(value) else set()
+
+    @classmethod
+    def referenced_paths(cls, model, values):
+        """
+        모델 인스턴스 값에서 참조하는 blob 경로 집합
+
+        Args:
+            model: 미디어 참조 모델
+            values: {필드명: 값} (파일 필드 값 또는 본문 HTML)
+        """
+        paths = set()
+        for field, html in cls.reference_fields(model):
+            paths |= cls.paths_in(values.get(field), html)
+        return paths
+
+    @classmethod
+    def retain(cls, paths):
+        """blob 참조 수 증가"""
+        if paths:
+            cls.objects.filter(path__in=paths).update(ref_count=F('ref_count') + 1)
+
+    @classmethod
+    def release(cls, paths):
+        """blob 참조 수 감소 (파일 삭제는 gc_media 명령어에서 처리)"""
+        if paths:
+            cls.objects.filter(path__in=paths, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+
+    @classmethod
+    def recount(cls):
+        """
+        전체 참조 수 다시 계산 (queryset.update 등 시그널 없이 바뀐 참조 반영)
+        - 같은 레코드가 같은 blob을 여러 번 참조해도 1로 계산
+
+        Returns:
+            int: 참조 수가 바뀐 blob 수
+        """
+        counts = Counter()
+        for label, field in MEDIA_REFERENCES + RICH_TEXT_REFERENCES:
+            model = apps.get_model(label)
+            html = (label, field) in RICH_TEXT_REFERENCES
+            for value in model.objects.exclude(**{field: ''}).values_list(field, flat=True).iterator():
+                counts.update(cls.paths_in(value, html))
+
+        changed = []
+        for blob in cls.objects.only('pk', 'path', 'ref_count').iterator():
+            if blob.ref_count != counts[blob.path]:
+                blob.ref_count = counts[blob.path]
+                changed.append(blob)
+        cls.objects.bulk_update(changed, ['ref_count'], batch_size=500)
+        return len(changed)
+
+    @classmethod
+    def garbage(cls, min_age):
+        """
+        삭제 대상 blob 목록 (참조 수 0이고 마지막 업로드 후 유예 시간이 지난 blob)
+
+        Args:
+            min_age: 유예 시간 (timedelta)
+        """
+        return cls.objects.filter(ref_count=0, uploaded_at__lt=timezone.now() - min_age)
+
+    def purge(self, min_age):
+        """
+        blob 파일, rendition, CKEditor 썸네일과 참조 수 정보 삭제
+        - 조회 후 다시 참조되거나 업로드된 blob은 삭제하지 않도록
+          잠금을 잡은 상태에서 삭제 조건을 다시 확인하고 행을 먼저 삭제한 뒤 파일 삭제
+
+        Args:
+            min_age: 유예 시간 (timedelta)
+
+        Returns:
+            bool: 삭제 여부
+        """
+        from ckeditor_uploader.utils import get_thumb_filename
+
+        with transaction.atomic():
+            garbage = MediaBlob.garbage(min_age).filter(pk=self.pk)
+            if not garbage.select_for_update().exists():
+                return False
+            deleted, _ = garbage.delete()
+            if not deleted:
+                return False
+            ProductImageRendition.remove(self.path)
+            default_storage.delete(get_thumb_filename(self.path))
+            default_storage.delete(self.path)
+        return True
+
+    @staticmethod
+    def remove_stale_uploads(min_age):
+        """업로드 중 중단되어 남은 임시 파일 삭제 (로컬 디스크 저장소, 유예 시간이 지난 파일만)"""
+        threshold = (timezone.now() - min_age).timestamp()
+        removed = 0
+        try:
+            entries = list(os.scandir(default_storage.path(posixpath.join(BLOB_DIR, 'tmp'))))
+        except (FileNotFoundError, NotImplementedError):
+            return 0
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < threshold:
+                os.remove(entry.path)
+                removed += 1
+        return removed
+
+    @staticmethod
+    def path_hash(path):
+        """blob 경로의 내용 해시 (파일명)"""
+        return posixpath.splitext(posixpath.basename(path))[0]
+
+    @classmethod
+    def prepare_upload(cls, filename, content_hash, size):
+        """
+        브라우저 직접 업로드 준비 (presigned PUT 요청 발급)
+        - 같은 내용의 blob이 이미 저장소에 있으면 업로드 생략 (upload: None)
+        - 업로드 전에 blob을 등록하여 완료되지 않은 업로드도 gc_media가 정리
+
+        Args:
+            filename: 업로드할 파일명 (확장자 사용)
+            content_hash: 브라우저에서 계산한 SHA-256 해시
+            size: 파일 크기 (bytes)
+
+        Returns:
+            dict: {'path': blob 경로, 'url': 파일 URL, 'upload': presigned 요청 정보 또는 None}
+        """
+        path = blob_name(content_hash, posixpath.splitext(filename)[1])
+        upload = None
+        if not default_storage.exists(path):
+            upload = default_storage.presigned_upload(path, content_hash, size)
+        cls.register(path, content_hash, size)
+        return {'path': path, 'url': default_storage.url(path), 'upload': upload}
+
+    @classmethod
+    def complete_upload(cls, path, name=None):
+        """
+        브라우저 직접 업로드 완료 확인
+        - 업로드된 객체의 체크섬이 경로의 해시와 다르면 삭제
+        - 완료 즉시 미디어 라이브러리 색인에 등록하여 관리자 폼에서 바로 선택 가능
+          (이미지 크기 확인 / 내용 검증은 record_media_asset 작업에서 처리)
+
+        Args:
+            path: blob 경로
+            name: 검색용 원본 파일명
+
+        Returns:
+            MediaBlob: 등록된 blob (객체가 없거나 내용이 다르면 None)
+        """
+        content_hash = cls.path_hash(path)
+        try:
+            checksum = default_storage.uploaded_checksum(path)
+            size, mtime_ns = default_storage.file_stat(path)
+        except FileNotFoundError:
+            return None
+        if checksum and checksum != content_hash:
+            default_storage.delete(path)
+            return None
+        blob = cls.register(path, content_hash, size)
+        if blob.size != size:
+            cls.objects.filter(pk=blob.pk).update(size=size)
+        apps.get_model('products', 'MediaAsset').register_upload(path, content_hash, size, mtime_ns, name=name)
+        return blob
+
+    @staticmethod
+    def locate(path):
+        """
+        기존 파일의 내용 해시와 blob 경로 계산
+
+        Returns:
+            tuple: (blob 경로, SHA-256 해시, 파일 크기)
+        """
+        full_path = default_storage.path(path)
+        with open(full_path, 'rb') as file:
+            content_hash = file_hash(file)
+        return blob_name(content_hash, posixpath.splitext(path)[1]), content_hash, os.path.getsize(full_path)
+
+    @classmethod
+    def adopt(cls, path):
+        """
+        기존 파일을 blob 경로에 등록 (dedupe_media 명령어용)
+        - 같은 내용의 blob이 이미 있으면 새로 만들지 않음
+        - 하드 링크로 연결하여 복사하지 않음 (지원하지 않는 파일 시스템이면 복사)
+        - 기존 파일은 참조를 옮긴 뒤 삭제하도록 남겨 둠
+
+        Returns:
+            str: blob 경로
+        """
+        stored, content_hash, size = cls.locate(path)
+        target = default_storage.path(stored)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                os.link(default_storage.path(path), target)
+            except OSError:
+                shutil.copy2(default_storage.path(path), target)
+        cls.register(stored, content_hash, size)
+        return stored
+
+    @classmethod
+    def relocate(cls, mapping):
+        """
+        기존 경로 참조를 blob 경로로 변경 (파일 필드, 본문 HTML URL, 미디어 라이브러리 색인, rendition)
+        - 시그널 없이 변경하므로 호출 후 recount() 필요
+
+        Args:
+            mapping: {기존 경로: blob 경로}
+        """
+        from .media_asset import MediaAsset
+
+        for label, field in MEDIA_REFERENCES:
+            model = apps.get_model(label)
+            used = set(model.objects.values_list(field, flat=True).distinct()) & mapping.keys()
+            for old in used:
+                model.objects.filter(**{field: old}).update(**{field: mapping[old]})
+
+        url_pattern = re.compile(re.escape(settings.MEDIA_URL) + r'([^"\'\s<>?#)]+)')
+
+        def replace_url(match):
+            new = mapping.get(unquote(match.group(1)))
+            return settings.MEDIA_URL + new if new else match.group(0)
+
+        for label, field in RICH_TEXT_REFERENCES:
+            model = apps.get_model(label)
+            for pk, html in model.objects.exclude(**{field: ''}).values_list('pk', field).iterator():
+                rewritten = url_pattern.sub(replace_url, html or '')
+                if rewritten != html:
+                    model.objects.filter(pk=pk).update(**{field: rewritten})
+
+        for old, new in mapping.items():
+            if MediaAsset.objects.filter(path=new).exists():
+                MediaAsset.objects.filter(path=old).delete()
+            else:
+                MediaAsset.objects.filter(path=old).update(path=new, directory=posixpath.dirname(new))
+            if ProductImageRendition.objects.filter(source=new).exists():
+                ProductImageRendition.remove(old)
+            else:
+                ProductImageRendition.objects.filter(source=old).update(source=new)
@@ -60,9 +60,27 @@ class Product(models.Model):
         auto_now=True,
         help_text="상품 수정일"
     )
+    thumbnail_image = models.ForeignKey(
+        'products.ProductImage',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        verbose_name='대표 이미지',
+        help_text="ProductImage 저장/삭제 시 자동으로 갱신되는 대표 이미지"
+    )
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 기본 최신순 / 가격순 정렬
+            models.Index(fields=['-created_at'], name='product_created_idx'),
+            models.Index(fields=['price'], name='product_price_idx'),
+            # 카테고리 / 판매 상태 필터 + 최신순
+            models.Index(fields=['category', '-created_at'], name='product_category_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='product_status_created_idx'),
+        ]
         verbose_name = '상품'
         verbose_name_plural = '상품 목록'
 
@@ -34,10 +34,55 @@ class ProductImage(models.Model):
     class Meta:
         verbose_name = '상품 이미지'
         verbose_name_plural = '상품 이미지 목록'
+        constraints = [
+            # 상품당 대표 이미지는 최대 1개
+            models.UniqueConstraint(
+                fields=['product'],
+                condition=models.Q(is_thumbnail=True),
+                name='unique_product_thumbnail'
+            )
+        ]
 
     def __str__(self):
         return f"{self.product.name}의 이미지"
 
+    def save(self, *args, **kwargs):
+        """
+        이미지 저장
+        - 대표 이미지로 저장하는 경우 같은 상품의 기존 대표 이미지를 해제
+        """
+        if self.is_thumbnail and self.product_id:
+            ProductImage.objects.filter(
+                product_id=self.product_id,
+                is_thumbnail=True
+            ).exclude(pk=self.pk).update(is_thumbnail=False)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def sync_thumbnail(cls, product_id):
+        """
+        상품의 대표 이미지 포인터(Product.thumbnail_image) 갱신
+        - 대표 이미지가 없으면 첫 번째 이미지를 대표로 지정
+        - 이미지가 없으면 포인터를 비움
+
+        Args:
+            product_id: 대상 상품 ID
+
+        Returns:
+            ProductImage: 대표 이미지 또는 None
+        """
+        images = cls.objects.filter(product_id=product_id)
+        thumbnail = images.order_by('-is_thumbnail', 'id').first()
+
+        if thumbnail and not thumbnail.is_thumbnail:
+            images.filter(pk=thumbnail.pk).update(is_thumbnail=True)
+            thumbnail.is_thumbnail = True
+
+        Product.objects.filter(pk=product_id).exclude(
+            thumbnail_image=thumbnail
+        ).update(thumbnail_image=thumbnail)
+        return thumbnail
+
     def clean(self):
         """
         모델 유효성 검사 수행
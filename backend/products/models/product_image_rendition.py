@@ -0,0 +1,133 @@
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.dispatch import Signal
+from config.images import render, rendition_name
+
+# rendition 생성 완료 시그널 (source: 원본 이미지 경로)
+# - 원본을 사용하는 상품 / 수업의 수정일과 응답 캐시 갱신용
+renditions_generated = Signal()
+
+
+class ProductImageRendition(models.Model):
+    """
+    이미지 rendition(크기/형식별 변환본) 정보를 저장하는 모델
+    - 원본 이미지 경로(source) 기준으로 저장하므로 같은 파일을 쓰는
+      상품 이미지(ProductImage.image)와 수업 썸네일(InternalClass.thumbnail)이 함께 사용
+    - 파일은 원본 옆의 renditions 폴더에 저장
+    """
+    FORMAT_CHOICES = [
+        ('avif', 'AVIF'),
+        ('webp', 'WebP'),
+        ('jpeg', 'JPEG'),
+    ]
+
+    source = models.CharField(
+        max_length=255,
+        help_text="원본 이미지 경로 (storage 기준, 예: products/home_1.JPG)"
+    )
+    format = models.CharField(
+        max_length=10,
+        choices=FORMAT_CHOICES,
+        help_text="이미지 형식"
+    )
+    width = models.PositiveIntegerField(help_text="너비 (px)")
+    height = models.PositiveIntegerField(help_text="높이 (px)")
+    file = models.FileField(
+        max_length=255,
+        help_text="rendition 파일"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="생성일"
+    )
+
+    class Meta:
+        verbose_name = '이미지 rendition'
+        verbose_name_plural = '이미지 rendition 목록'
+        ordering = ['source', 'format', 'width']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['source', 'format', 'width'],
+                name='unique_image_rendition'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.source} ({self.format}, {self.width}w)"
+
+    @classmethod
+    def generate(cls, source):
+        """
+        원본 이미지의 rendition 생성 (기존 rendition은 교체)
+        - 원본 파일이 없거나 이미지가 아니면 생성하지 않음
+
+        Args:
+            source: 원본 이미지 경로
+
+        Returns:
+            list: 생성된 ProductImageRendition 목록
+        """
+        if not source or not default_storage.exists(source):
+            return []
+
+        with default_storage.open(source, 'rb') as file:
+            outputs = list(render(file))
+
+        cls.remove(source)
+        renditions = [
+            cls(
+                source=source,
+                format=key,
+                width=width,
+                height=height,
+                file=default_storage.save(rendition_name(source, width, extension), content),
+            )
+            for key, width, height, extension, content in outputs
+        ]
+        cls.objects.bulk_create(renditions)
+        transaction.on_commit(lambda: renditions_generated.send(sender=cls, source=source))
+        return renditions
+
+    @classmethod
+    def generate_missing(cls, source):
+        """rendition이 아직 없는 원본만 생성 (백그라운드 작업용)"""
+        if source and not cls.objects.filter(source=source).exists():
+            cls.generate(source)
+
+    @classmethod
+    def remove(cls, source):
+        """원본 이미지의 rendition 파일과 정보 삭제"""
+        renditions = list(cls.objects.filter(source=source))
+        for rendition in renditions:
+            rendition.file.delete(save=False)
+        cls.objects.filter(pk__in=[rendition.pk for rendition in renditions]).delete()
+
+    @classmethod
+    def srcsets(cls, sources, request=None):
+        """
+        원본 경로별 형식별 srcset 일괄 조회 (쿼리 1번, 원본이 없으면 쿼리 없음)
+
+        Args:
+            sources: 원본 이미지 경로 목록
+            request: 절대 URL 생성용 요청 (없으면 상대 URL)
+
+        Returns:
+            dict: {원본 경로: {형식: 'URL 200w, URL 400w, ...'}}
+        """
+        sources = {source for source in sources if source}
+        if not sources:
+            return {}
+
+        candidates = {}
+        for source, key, width, name in cls.objects.filter(source__in=sources).order_by(
+            'source', 'format', 'width'
+        ).values_list('source', 'format', 'width', 'file'):
+            url = default_storage.url(name)
+            if request:
+                url = request.build_absolute_uri(url)
+            candidates.setdefault(source, {}).setdefault(key, []).append(f'{url} {width}w')
+
+        return {
+            source: {key: ', '.join(items) for key, items in formats.items()}
+            for source, formats in candidates.items()
+        }
@@ -0,0 +1,57 @@
+from django.db import models
+from .product import Product
+
+
+class ProductSearchDocument(models.Model):
+    """
+    상품 검색 문서 모델
+    - 상품명/설명/상세 설명/태그/카테고리를 토큰화하여 저장
+    - DB별 전문 검색 인덱스(SQLite FTS5, PostgreSQL GIN)는 이 테이블을 기준으로 유지
+    """
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+        verbose_name='상품'
+    )
+    name_tokens = models.TextField(
+        blank=True,
+        verbose_name='상품명 토큰'
+    )
+    body_tokens = models.TextField(
+        blank=True,
+        verbose_name='본문 토큰'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='색인 갱신일'
+    )
+
+    class Meta:
+        verbose_name = '상품 검색 문서'
+        verbose_name_plural = '상품 검색 문서 목록'
+
+    def __str__(self):
+        return f"{self.product_id} 검색 문서"
+
+    @classmethod
+    def refresh(cls, product_ids):
+        """
+        상품 검색 문서 재생성
+        - 삭제된 상품은 CASCADE로 문서도 함께 삭제됨
+
+        Args:
+            product_ids: 대상 상품 ID 목록
+        """
+        from ..search import build_document
+
+        products = Product.objects.filter(pk__in=list(product_ids)).select_related(
+            'category__parent'
+        ).prefetch_related('tags')
+        for product in products:
+            name_tokens, body_tokens = build_document(product)
+            cls.objects.update_or_create(
+                product=product,
+                defaults={'name_tokens': name_tokens, 'body_tokens': body_tokens}
+            )
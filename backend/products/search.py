@@ -0,0 +1,215 @@
+import html
+from django.db import connection
+from django.db.models import Case, When, IntegerField, Q
+from django.utils.html import strip_tags
+from config.search import tokenize, query_terms
+
+DOCUMENT_TABLE = 'products_productsearchdocument'
+FTS_TABLE = 'products_search_fts'
+
+# PostgreSQL GIN 인덱스와 검색 쿼리에서 동일하게 사용하는 tsvector 식 (상품명 가중치 A)
+POSTGRES_VECTOR = (
+    "(setweight(to_tsvector('simple', name_tokens), 'A') || "
+    "setweight(to_tsvector('simple', body_tokens), 'B'))"
+)
+
+# 검색 결과로 반환하는 최대 상품 수
+SEARCH_RESULT_LIMIT = 500
+
+
+def build_document(product):
+    """
+    상품 검색 문서 생성
+    - 상품명은 별도 컬럼으로 분리해 랭킹 가중치를 높게 적용
+    - 본문: 간단 설명, HTML을 제거한 상세 설명, 태그명, 카테고리 경로(상위 > 하위)
+
+    Args:
+        product: category / tags에 접근 가능한 Product 객체
+
+    Returns:
+        tuple: (name_tokens, body_tokens) 공백으로 구분된 토큰 문자열
+    """
+    category_path = []
+    category = product.category
+    while category is not None:
+        category_path.insert(0, category.name)
+        category = category.parent
+
+    body = ' '.join([
+        product.description or '',
+        html.unescape(strip_tags(product.product_detail_info or '')),
+        ' '.join(tag.name for tag in product.tags.all()),
+        ' '.join(category_path),
+    ])
+    return ' '.join(tokenize(product.name)), ' '.join(tokenize(body))
+
+
+class SQLiteSearchBackend:
+    """
+    SQLite FTS5 검색 백엔드 (개발/테스트)
+    - 검색 문서 테이블을 content로 사용하는 FTS5 테이블을 트리거로 동기화
+    - bm25 점수로 정렬 (상품명 가중치 10배)
+    """
+    def create_index(self, schema_editor):
+        """FTS5 가상 테이블과 동기화 트리거 생성"""
+        columns = 'name_tokens, body_tokens'
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"{columns}, content='{DOCUMENT_TABLE}', content_rowid='product_id', "
+            f"tokenize='unicode61')"
+        )
+        insert = (
+            f"INSERT INTO {FTS_TABLE}(rowid, {columns}) "
+            f"VALUES (new.product_id, new.name_tokens, new.body_tokens);"
+        )
+        delete = (
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.product_id, old.name_tokens, old.body_tokens);"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN {insert} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN {delete} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} "
+            f"BEGIN {delete} {insert} END"
+        )
+
+    def drop_index(self, schema_editor):
+        """FTS5 가상 테이블과 트리거 삭제"""
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+    def ranked_ids(self, terms):
+        """검색어와 일치하는 상품 ID를 관련도순으로 반환"""
+        match = ' '.join(
+            f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"ORDER BY bm25({FTS_TABLE}, 10.0, 1.0) LIMIT %s",
+                [match, SEARCH_RESULT_LIMIT]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend:
+    """
+    PostgreSQL 검색 백엔드 (운영)
+    - 검색 문서 tsvector 식에 GIN 인덱스, ts_rank로 정렬
+    - 일치하는 문서가 없으면 상품명 trigram 유사도로 대체 검색 (오타 대응)
+    """
+    def create_index(self, schema_editor):
+        """tsvector GIN 인덱스와 상품명 trigram 인덱스 생성"""
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX products_search_vector_gin ON {DOCUMENT_TABLE} "
+            f"USING gin ({POSTGRES_VECTOR})"
+        )
+        schema_editor.execute(
+            "CREATE INDEX products_product_name_trgm ON products_product "
+            "USING gin (name gin_trgm_ops)"
+        )
+
+    def drop_index(self, schema_editor):
+        """검색 인덱스 삭제"""
+        schema_editor.execute("DROP INDEX IF EXISTS products_search_vector_gin")
+        schema_editor.execute("DROP INDEX IF EXISTS products_product_name_trgm")
+
+    def ranked_ids(self, terms):
+        """검색어와 일치하는 상품 ID를 관련도순으로 반환"""
+        tsquery = ' & '.join(
+            f"{token}:*" if prefix else token for token, prefix in terms
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT product_id FROM {DOCUMENT_TABLE} "
+                f"WHERE {POSTGRES_VECTOR} @@ to_tsquery('simple', %s) "
+                f"ORDER BY ts_rank({POSTGRES_VECTOR}, to_tsquery('simple', %s)) DESC LIMIT %s",
+                [tsquery, tsquery, SEARCH_RESULT_LIMIT]
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            if ids:
+                return ids
+
+            query = ' '.join(token for token, _ in terms)
+            cursor.execute(
+                "SELECT id FROM products_product WHERE name %% %s "
+                "ORDER BY similarity(name, %s) DESC LIMIT %s",
+                [query, query, SEARCH_RESULT_LIMIT]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class SimpleSearchBackend:
+    """
+    전문 검색을 지원하지 않는 DB용 검색 백엔드
+    - 토큰화된 검색 문서에 대한 LIKE 검색 (상품명 일치 우선)
+    """
+    def create_index(self, schema_editor):
+        """별도 인덱스 없음"""
+
+    def drop_index(self, schema_editor):
+        """별도 인덱스 없음"""
+
+    def ranked_ids(self, terms):
+        """검색어와 일치하는 상품 ID 반환"""
+        from .models import ProductSearchDocument
+
+        documents = ProductSearchDocument.objects.all()
+        for token, _ in terms:
+            documents = documents.filter(
+                Q(name_tokens__contains=token) | Q(body_tokens__contains=token)
+            )
+        name_match = Q()
+        for token, _ in terms:
+            name_match &= Q(name_tokens__contains=token)
+        documents = documents.annotate(
+            name_rank=Case(When(name_match, then=0), default=1, output_field=IntegerField())
+        ).order_by('name_rank', 'product_id')
+        return list(documents.values_list('product_id', flat=True)[:SEARCH_RESULT_LIMIT])
+
+
+def get_search_backend(vendor=None):
+    """
+    DB에 맞는 검색 백엔드 반환
+
+    Args:
+        vendor: DB 종류 (기본값: 현재 연결의 vendor)
+    """
+    vendor = vendor or connection.vendor
+    if vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if vendor == 'sqlite':
+        return SQLiteSearchBackend()
+    return SimpleSearchBackend()
+
+
+def search_products(queryset, query):
+    """
+    검색어로 상품 쿼리셋 필터링 및 관련도순 정렬
+
+    Args:
+        queryset: Product 쿼리셋
+        query: 사용자 검색어
+
+    Returns:
+        QuerySet: 검색 결과 (관련도순)
+    """
+    terms = query_terms(query)
+    if not terms:
+        return queryset.none()
+
+    ids = get_search_backend().ranked_ids(terms)
+    if not ids:
+        return queryset.none()
+
+    rank = Case(
+        *[When(pk=pk, then=position) for position, pk in enumerate(ids)],
+        output_field=IntegerField()
+    )
+    return queryset.filter(pk__in=ids).order_by(rank)
@@ -1,12 +1,15 @@
 from rest_framework import serializers
+from config.images import SrcsetField, SrcsetListSerializer
 from ..models import Product, ProductImage, Category, Tag
 
 class ProductImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProductImage
-        fields = ['id', 'url', 'is_thumbnail']
+        fields = ['id', 'url', 'srcset', 'is_thumbnail']
+        list_serializer_class = SrcsetListSerializer
 
     url = serializers.SerializerMethodField()
+    srcset = SrcsetField(source='image')
 
     def get_url(self, obj):
         request = self.context.get('request')
@@ -16,20 +19,23 @@ class ProductImageSerializer(serializers.ModelSerializer):
 
 class ProductListSerializer(serializers.ModelSerializer):
     thumbnail = serializers.SerializerMethodField()
+    # 대표 이미지의 형식별 srcset
+    srcset = SrcsetField(source='thumbnail_image.image')
     category = serializers.CharField(source='category.name')
     tags = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
         fields = [
-            'id', 'name', 'category', 'thumbnail', 'tags',
+            'id', 'name', 'category', 'thumbnail', 'srcset', 'tags',
             'price', 'duration', 'status', 'created_at'
         ]
+        list_serializer_class = SrcsetListSerializer
 
     def get_thumbnail(self, obj):
         request = self.context.get('request')
-        # 먼저 is_thumbnail이 True인 이미지를 찾고, 없으면 첫 번째 이미지를 사용
-        image = obj.images.filter(is_thumbnail=True).first() or obj.images.first()
+        # 시그널로 관리되는 대표 이미지 포인터 사용 (이미지 테이블 조회 없음)
+        image = obj.thumbnail_image
         if image and image.image:
             return request.build_absolute_uri(image.image.url) if request else image.image.url
         return None
@@ -0,0 +1,35 @@
+import posixpath
+from django.conf import settings
+from rest_framework import serializers
+from config.storage import is_blob_path
+from ..models.media_asset import IMAGE_EXTENSIONS
+
+
+class MediaUploadSerializer(serializers.Serializer):
+    """브라우저 직접 업로드 요청 시리얼라이저 (파일 내용 대신 해시와 크기만 전달)"""
+    filename = serializers.CharField(max_length=200)
+    size = serializers.IntegerField(min_value=1)
+    sha256 = serializers.RegexField(r'^[0-9a-f]{64}$', help_text="파일 내용 SHA-256 해시 (16진수 소문자)")
+
+    def validate_filename(self, value):
+        if posixpath.splitext(value)[1].lower() not in IMAGE_EXTENSIONS:
+            raise serializers.ValidationError('이미지 파일만 업로드할 수 있습니다.')
+        return value
+
+    def validate_size(self, value):
+        if value > settings.MEDIA_DIRECT_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f'{settings.MEDIA_DIRECT_UPLOAD_MAX_SIZE // (1024 * 1024)}MB 이하 파일만 업로드할 수 있습니다.'
+            )
+        return value
+
+
+class MediaUploadCompleteSerializer(serializers.Serializer):
+    """브라우저 직접 업로드 완료 시리얼라이저"""
+    path = serializers.CharField(max_length=255, help_text="업로드 요청 응답의 path")
+    filename = serializers.CharField(max_length=200, required=False, default='', help_text="검색용 원본 파일명")
+
+    def validate_path(self, value):
+        if not is_blob_path(value):
+            raise serializers.ValidationError('올바르지 않은 파일 경로입니다.')
+        return value
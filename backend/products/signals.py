@@ -0,0 +1,180 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete, m2m_changed
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
+from config.cache import invalidate_cache_group
+from products.models.product import Product
+from products.models.product_image import ProductImage
+from products.models.category import Category
+from products.models.tag import Tag
+from products.models.product_search_document import ProductSearchDocument
+from products.models.product_image_rendition import renditions_generated
+from products.models.media_asset import MediaAsset
+from products.models.media_blob import MediaBlob, MEDIA_REFERENCES, RICH_TEXT_REFERENCES
+from products.tasks import generate_image_renditions
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def update_product_thumbnail(sender, instance, **kwargs):
+    """
+    상품 이미지 저장/삭제 시 상품의 대표 이미지 포인터와 수정일 갱신
+    - 수정일은 상세 조회 ETag / Last-Modified 계산에 사용
+    """
+    if instance.product_id:
+        ProductImage.sync_thumbnail(instance.product_id)
+        Product.objects.filter(pk=instance.product_id).update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def touch_product_on_tags_change(sender, instance, action, pk_set, **kwargs):
+    """상품 태그 연결 변경 시 상품 수정일 갱신"""
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, Product):
+        Product.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+    elif pk_set:
+        Product.objects.filter(pk__in=pk_set).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Category)
+def touch_products_on_category_change(sender, instance, created, **kwargs):
+    """카테고리 수정 시 해당 카테고리 상품들의 수정일 갱신"""
+    if not created:
+        Product.objects.filter(category=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def touch_products_on_tag_change(sender, instance, created=False, **kwargs):
+    """태그 수정/삭제 시 해당 태그가 연결된 상품들의 수정일 갱신"""
+    if not created:
+        Product.objects.filter(tags=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Product.tags.through)
+def invalidate_product_cache(sender, **kwargs):
+    """상품 관련 데이터 변경 시 상품 목록/상세 응답 캐시 무효화"""
+    if kwargs.get('action', 'post_').startswith('post_'):
+        invalidate_cache_group('products')
+
+
+@receiver(post_save, sender=Product)
+def index_product_on_save(sender, instance, **kwargs):
+    """상품 저장 시 검색 문서 갱신"""
+    ProductSearchDocument.refresh([instance.pk])
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def index_products_on_tags_change(sender, instance, action, pk_set, **kwargs):
+    """상품 태그 연결 변경 시 검색 문서 갱신"""
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, Product):
+        ProductSearchDocument.refresh([instance.pk])
+    elif pk_set:
+        ProductSearchDocument.refresh(pk_set)
+
+
+@receiver(post_save, sender=Category)
+def index_products_on_category_change(sender, instance, created, **kwargs):
+    """카테고리명 변경 시 해당 카테고리와 하위 카테고리 상품의 검색 문서 갱신"""
+    if not created:
+        ProductSearchDocument.refresh(
+            Product.objects.filter(
+                Q(category=instance) | Q(category__parent=instance)
+            ).values_list('pk', flat=True)
+        )
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tagged_products(sender, instance, **kwargs):
+    """태그 삭제 전 연결된 상품 ID 보관 (삭제 후 연결 정보가 사라지므로)"""
+    instance._tagged_product_ids = list(instance.products.values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def index_products_on_tag_change(sender, instance, created=False, **kwargs):
+    """태그명 변경/삭제 시 연결된 상품의 검색 문서 갱신"""
+    if created:
+        return
+    product_ids = getattr(instance, '_tagged_product_ids', None)
+    if product_ids is None:
+        product_ids = instance.products.values_list('pk', flat=True)
+    ProductSearchDocument.refresh(product_ids)
+
+
+@receiver(post_save, sender=ProductImage)
+def generate_product_image_renditions(sender, instance, **kwargs):
+    """상품 이미지 저장 시 커밋 후 rendition 생성 작업 등록 (이미 있으면 생략)"""
+    if instance.image:
+        generate_image_renditions.delay_on_commit(instance.image.name)
+
+
+@receiver(renditions_generated)
+def touch_products_on_renditions(sender, source, **kwargs):
+    """rendition 생성 시 해당 이미지를 쓰는 상품의 수정일 갱신 및 응답 캐시 무효화 (srcset 반영)"""
+    if Product.objects.filter(images__image=source).update(updated_at=timezone.now()):
+        invalidate_cache_group('products')
+
+
+def remember_media_references(sender, instance, **kwargs):
+    """수정 전 미디어 참조 값 보관 (파일 교체 / 본문 수정 시 이전 참조 해제용)"""
+    instance._previous_media = {}
+    if instance.pk:
+        fields = [field for field, html in MediaBlob.reference_fields(sender)]
+        instance._previous_media = sender.objects.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+def current_media_references(sender, instance):
+    """인스턴스의 현재 미디어 참조 값 ({필드명: 파일 경로 또는 본문 HTML})"""
+    values = {}
+    for field, html in MediaBlob.reference_fields(sender):
+        value = getattr(instance, field)
+        values[field] = getattr(value, 'name', value) or ''
+    return values
+
+
+def release_legacy_files(sender, previous, current):
+    """교체 / 삭제된 기존 경로 파일을 커밋 후 다른 곳에서 쓰지 않으면 삭제 (blob은 gc_media에서 삭제)"""
+    for field, html in MediaBlob.reference_fields(sender):
+        name = previous.get(field)
+        if not html and name and name != current.get(field):
+            transaction.on_commit(lambda name=name: MediaAsset.release(name))
+
+
+def update_media_references(sender, instance, **kwargs):
+    """미디어 참조 저장 시 새로 참조한 blob과 참조하지 않게 된 blob의 참조 수 갱신"""
+    previous = getattr(instance, '_previous_media', None) or {}
+    current = current_media_references(sender, instance)
+    previous_paths = MediaBlob.referenced_paths(sender, previous)
+    current_paths = MediaBlob.referenced_paths(sender, current)
+    MediaBlob.retain(current_paths - previous_paths)
+    MediaBlob.release(previous_paths - current_paths)
+    release_legacy_files(sender, previous, current)
+
+
+def release_media_references(sender, instance, **kwargs):
+    """미디어 참조 삭제 시 참조하던 blob의 참조 수 감소"""
+    current = current_media_references(sender, instance)
+    MediaBlob.release(MediaBlob.referenced_paths(sender, current))
+    release_legacy_files(sender, current, {})
+
+
+# 파일 필드 / 본문 HTML로 미디어를 참조하는 모델마다 참조 수 갱신 시그널 연결
+for label in dict.fromkeys(label for label, field in MEDIA_REFERENCES + RICH_TEXT_REFERENCES):
+    model = apps.get_model(label)
+    pre_save.connect(remember_media_references, sender=model, dispatch_uid=f'remember_media_{label}')
+    post_save.connect(update_media_references, sender=model, dispatch_uid=f'update_media_{label}')
+    post_delete.connect(release_media_references, sender=model, dispatch_uid=f'release_media_{label}')
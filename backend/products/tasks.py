@@ -0,0 +1,41 @@
+from celery import shared_task
+from django.core.files.storage import default_storage
+from PIL import UnidentifiedImageError
+from config.celery import RETRY_BACKOFF
+from products.models import MediaAsset, MediaBlob, ProductImageRendition
+
+
+@shared_task(
+    autoretry_for=(OSError,),
+    # 이미지가 아닌 파일은 재시도해도 실패하므로 제외
+    dont_autoretry_for=(UnidentifiedImageError,),
+    **RETRY_BACKOFF
+)
+def generate_image_renditions(source):
+    """
+    원본 이미지의 rendition 생성 (이미 있으면 생략)
+    - 상품 이미지 / 수업 썸네일 저장 시 커밋 후 실행
+
+    Args:
+        source: 원본 이미지 경로
+    """
+    ProductImageRendition.generate_missing(source)
+
+
+@shared_task(autoretry_for=(OSError,), **RETRY_BACKOFF)
+def record_media_asset(path, filename=''):
+    """
+    브라우저 직접 업로드 파일의 미디어 라이브러리 색인 갱신
+    - 색인 행은 완료 API에서 바로 등록(MediaBlob.complete_upload), 여기서는 이미지 크기를 채움
+    - 이미지 크기 확인을 위해 저장소에서 파일을 읽으므로 요청 밖에서 실행
+    - 저장소가 업로드 체크섬을 검사하지 않는 경우(MinIO 일부 버전 등)를 위해
+      실제 내용 해시가 경로의 해시와 다르면 파일과 blob 삭제
+
+    Args:
+        path: blob 경로
+        filename: 검색용 원본 파일명
+    """
+    asset = MediaAsset.record(path, name=filename or None)
+    if asset and asset.content_hash != MediaBlob.path_hash(path):
+        MediaBlob.objects.filter(path=path).delete()
+        default_storage.delete(path)
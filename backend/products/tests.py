@@ -1,3 +1,1156 @@
-from django.test import TestCase
+import hashlib
+from datetime import timedelta
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
+import os
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.files.base import ContentFile
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.storage import default_storage
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import status
+try:
+    from moto import mock_aws
+except ImportError:  # moto가 없으면 S3 저장소 테스트 생략
+    mock_aws = None
+from PIL import Image
+from config.images import available_formats, rendition_name
+from testing.query_plans import QueryPlanTestMixin
+from config.search import tokenize
+from .admin import ProductImageForm
+from .models import Product, ProductImage, ProductImageRendition, MediaAsset, MediaBlob, Category, Tag
+from .views.product_views import ProductListView
 
-# Create your tests here.
+
+class ProductListQueryTest(TestCase):
+    """
+    상품 목록 API 쿼리 수 테스트 클래스
+
+    상품 수와 관계없이 목록 조회 쿼리 수가 일정한지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('products:product-list')
+        self.category = Category.objects.create(name='DIY 키트')
+        self.tags = [
+            Tag.objects.create(name='초등'),
+            Tag.objects.create(name='코딩'),
+        ]
+
+    def _create_products(self, count):
+        """이미지 2장, 태그 2개를 가진 상품을 count개 생성하는 함수"""
+        for index in range(count):
+            product = Product.objects.create(
+                name=f'상품 {index}',
+                category=self.category,
+                description='- 상품 설명',
+                price=10000,
+                duration='2시간'
+            )
+            product.tags.set(self.tags)
+            ProductImage.objects.create(product=product, image=f'products/{index}_a.jpg')
+            ProductImage.objects.create(
+                product=product,
+                image=f'products/{index}_b.jpg',
+                is_thumbnail=True
+            )
+
+    def test_constant_query_count(self):
+        """상품 수가 늘어나도 쿼리 수가 일정한지 테스트 함수"""
+        # 전체 건수 COUNT, 상품 + 카테고리/대표 이미지 JOIN, 태그 prefetch, 대표 이미지 rendition 일괄 조회
+        self._create_products(1)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['meta']['total'], 1)
+
+        self._create_products(20)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['meta']['total'], 21)
+
+    def test_page_size_limit(self):
+        """페이지당 상품 수가 limit / 최대 100개로 제한되는지 테스트 함수"""
+        Product.objects.bulk_create(
+            Product(
+                name=f'상품 {index}',
+                category=self.category,
+                description='- 상품 설명',
+                price=10000,
+                duration='2시간'
+            )
+            for index in range(105)
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['data']['products']), 100)
+        self.assertEqual(response.data['data']['meta'], {'total': 105, 'pages': 2, 'current_page': 1})
+
+        response = self.client.get(self.url, {'limit': 1000, 'page': 2})
+        self.assertEqual(len(response.data['data']['products']), 5)
+        self.assertEqual(response.data['data']['meta']['current_page'], 2)
+
+        response = self.client.get(self.url, {'limit': 10, 'page': 3})
+        self.assertEqual(len(response.data['data']['products']), 10)
+        self.assertEqual(response.data['data']['meta']['pages'], 11)
+
+    def test_thumbnail_and_tags(self):
+        """대표 이미지와 태그를 올바르게 반환하는지 테스트 함수"""
+        self._create_products(1)
+        response = self.client.get(self.url)
+        product = response.data['data']['products'][0]
+
+        self.assertTrue(product['thumbnail'].endswith('/media/products/0_b.jpg'))
+        self.assertEqual(product['tags'], ['초등', '코딩'])
+        self.assertEqual(product['category'], 'DIY 키트')
+
+
+class ProductThumbnailSignalTest(TestCase):
+    """
+    상품 대표 이미지 포인터 테스트 클래스
+
+    ProductImage 저장/삭제 시 Product.thumbnail_image가 갱신되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        category = Category.objects.create(name='DIY 키트')
+        self.product = Product.objects.create(
+            name='상품',
+            category=category,
+            description='상품 설명',
+            price=10000,
+            duration='2시간'
+        )
+
+    def test_first_image_becomes_thumbnail(self):
+        """첫 번째 이미지가 대표 이미지로 지정되는지 테스트 함수"""
+        image = ProductImage.objects.create(product=self.product, image='products/a.jpg')
+        image.refresh_from_db()
+        self.product.refresh_from_db()
+
+        self.assertTrue(image.is_thumbnail)
+        self.assertEqual(self.product.thumbnail_image, image)
+
+    def test_single_thumbnail_per_product(self):
+        """새 대표 이미지 지정 시 기존 대표 이미지가 해제되는지 테스트 함수"""
+        first = ProductImage.objects.create(product=self.product, image='products/a.jpg')
+        second = ProductImage.objects.create(
+            product=self.product,
+            image='products/b.jpg',
+            is_thumbnail=True
+        )
+        first.refresh_from_db()
+        self.product.refresh_from_db()
+
+        self.assertFalse(first.is_thumbnail)
+        self.assertEqual(self.product.thumbnail_image, second)
+        self.assertEqual(self.product.images.filter(is_thumbnail=True).count(), 1)
+
+    def test_delete_thumbnail_promotes_next_image(self):
+        """대표 이미지 삭제 시 다음 이미지가 대표로 지정되는지 테스트 함수"""
+        first = ProductImage.objects.create(product=self.product, image='products/a.jpg')
+        second = ProductImage.objects.create(product=self.product, image='products/b.jpg')
+        first.delete()
+        second.refresh_from_db()
+        self.product.refresh_from_db()
+
+        self.assertTrue(second.is_thumbnail)
+        self.assertEqual(self.product.thumbnail_image, second)
+
+        second.delete()
+        self.product.refresh_from_db()
+        self.assertIsNone(self.product.thumbnail_image)
+
+    def test_delete_product_with_images(self):
+        """이미지가 있는 상품 삭제 테스트 함수"""
+        ProductImage.objects.create(product=self.product, image='products/a.jpg')
+        self.product.delete()
+
+        self.assertFalse(ProductImage.objects.exists())
+
+
+class ProductDetailConditionalTest(TestCase):
+    """
+    상품 상세 API 조건부 요청 테스트 클래스
+
+    ETag / Last-Modified 기반으로 변경이 없으면 304를 반환하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        category = Category.objects.create(name='DIY 키트')
+        self.product = Product.objects.create(
+            name='상품',
+            category=category,
+            description='- 상품 설명',
+            product_detail_info='<p>상세</p>',
+            price=10000,
+            duration='2시간'
+        )
+        self.url = reverse('products:product-detail', args=[self.product.pk])
+
+    def test_not_modified(self):
+        """변경이 없으면 쿼리 1번으로 304를 반환하는지 테스트 함수"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_related_change_invalidates_etag(self):
+        """이미지/태그 변경 시 ETag가 바뀌는지 테스트 함수"""
+        etag = self.client.get(self.url)['ETag']
+
+        ProductImage.objects.create(product=self.product, image='products/a.jpg')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['images']), 1)
+
+        etag = response['ETag']
+        self.product.tags.add(Tag.objects.create(name='코딩'))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['tags'], ['코딩'])
+
+    def test_missing_product(self):
+        """존재하지 않는 상품은 404를 반환하는지 테스트 함수"""
+        response = self.client.get(reverse('products:product-detail', args=[self.product.pk + 1]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ProductResponseCacheTest(TestCase):
+    """
+    상품 목록/상세 응답 캐시 테스트 클래스
+
+    비로그인 요청은 캐시에서 응답하고, 상품 관련 데이터 변경 시 무효화되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        cache.clear()
+        self.client = APIClient()
+        self.category = Category.objects.create(name='DIY 키트')
+        self.product = Product.objects.create(
+            name='상품',
+            category=self.category,
+            description='- 상품 설명',
+            price=10000,
+            duration='2시간'
+        )
+        self.list_url = reverse('products:product-list')
+        self.detail_url = reverse('products:product-detail', args=[self.product.pk])
+
+    def test_list_cache_hit_without_queries(self):
+        """같은 목록 요청은 쿼리 없이 캐시에서 응답하는지 테스트 함수"""
+        first = self.client.get(self.list_url, {'sort': 'latest', 'search': '상품'})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.list_url, {'search': '상품', 'sort': 'latest'})
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json(), first.json())
+
+        # 다른 쿼리 파라미터는 별도 캐시
+        response = self.client.get(self.list_url, {'search': '없는 상품'})
+        self.assertEqual(response.data['data']['meta']['total'], 0)
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'shop.example.com'])
+    def test_cache_separated_by_host_and_scheme(self):
+        """절대 URL이 다른 host / scheme 요청은 별도 캐시로 응답하는지 테스트 함수"""
+        self.client.get(self.list_url)
+        for extra in [{'HTTP_HOST': 'shop.example.com'}, {'secure': True}]:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.list_url, **extra)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertGreater(len(queries), 0, extra)
+
+    def test_detail_cache_keeps_conditional_query(self):
+        """상세 캐시 적중 시 ETag 확인 쿼리 1번만 실행되는지 테스트 함수"""
+        first = self.client.get(self.detail_url)
+
+        with self.assertNumQueries(1):
+            second = self.client.get(self.detail_url)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_related_changes_invalidate_cache(self):
+        """상품/카테고리/태그 변경 시 캐시가 무효화되는지 테스트 함수"""
+        self.client.get(self.list_url)
+        self.client.get(self.detail_url)
+
+        self.product.name = '새 상품명'
+        self.product.save()
+        self.assertEqual(self.client.get(self.list_url).data['data']['products'][0]['name'], '새 상품명')
+
+        self.category.name = '완성품'
+        self.category.save()
+        self.assertEqual(self.client.get(self.list_url).data['data']['products'][0]['category'], '완성품')
+
+        self.product.tags.add(Tag.objects.create(name='코딩'))
+        self.assertEqual(self.client.get(self.detail_url).data['data']['tags'], ['코딩'])
+
+
+class ProductSearchTest(TestCase):
+    """
+    상품 전문 검색 테스트 클래스
+
+    한글 bigram 색인으로 상품명/설명/상세 설명/태그/카테고리를 관련도순으로 검색하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('products:product-list')
+        parent = Category.objects.create(name='교구')
+        self.category = Category.objects.create(name='DIY 키트', parent=parent)
+        self.arduino = Product.objects.create(
+            name='아두이노 스마트홈 키트',
+            category=self.category,
+            description='센서로 집을 제어합니다.',
+            product_detail_info='<p>초음파 <b>센서</b>와 서보모터 포함</p>',
+            price=30000,
+            duration='3시간'
+        )
+        self.robot = Product.objects.create(
+            name='코딩 로봇',
+            category=self.category,
+            description='아두이노 호환 보드를 사용하는 로봇입니다.',
+            price=50000,
+            duration='2시간'
+        )
+
+    def _search(self, query, **params):
+        """검색 결과 상품명 목록 반환 함수"""
+        response = self.client.get(self.url, {'search': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [product['name'] for product in response.data['data']['products']]
+
+    def test_tokenize(self):
+        """한글 bigram / 영문 단어 토큰화 테스트 함수"""
+        self.assertEqual(tokenize('아두이노 AI키트'), ['아두', '두이', '이노', 'ai', '키트'])
+        self.assertEqual(tokenize('및 <p>'), ['및', 'p'])
+
+    def test_name_match_ranks_first(self):
+        """상품명 일치가 설명 일치보다 먼저 나오는지 테스트 함수"""
+        self.assertEqual(self._search('아두이노'), ['아두이노 스마트홈 키트', '코딩 로봇'])
+        # 정렬 조건이 있으면 정렬 조건 우선
+        self.assertEqual(self._search('아두이노', sort='price_desc'), ['코딩 로봇', '아두이노 스마트홈 키트'])
+
+    def test_search_detail_tags_and_category(self):
+        """상세 설명(HTML 제거), 태그, 상위 카테고리로 검색되는지 테스트 함수"""
+        self.assertEqual(self._search('서보모터'), ['아두이노 스마트홈 키트'])
+        self.assertEqual(len(self._search('교구')), 2)
+        self.assertEqual(self._search('<b>'), [])
+
+        self.robot.tags.add(Tag.objects.create(name='초등코딩'))
+        self.assertEqual(self._search('초등'), ['코딩 로봇'])
+
+    def test_partial_and_prefix_match(self):
+        """단어 일부와 한 글자 / 영문 접두어 검색 테스트 함수"""
+        self.assertEqual(self._search('스마트'), ['아두이노 스마트홈 키트'])
+        self.assertEqual(self._search('로'), ['코딩 로봇'])
+        self.assertEqual(self._search('없는상품'), [])
+
+    def test_index_updates_on_change(self):
+        """상품/태그/카테고리 변경 시 검색 문서가 갱신되는지 테스트 함수"""
+        self.robot.name = '마이크로비트 로봇'
+        self.robot.save()
+        self.assertEqual(self._search('마이크로비트'), ['마이크로비트 로봇'])
+
+        tag = Tag.objects.create(name='메이커')
+        self.arduino.tags.add(tag)
+        self.assertEqual(self._search('메이커'), ['아두이노 스마트홈 키트'])
+        tag.name = '발명'
+        tag.save()
+        self.assertEqual(self._search('메이커'), [])
+        self.assertEqual(self._search('발명'), ['아두이노 스마트홈 키트'])
+        tag.delete()
+        self.assertEqual(self._search('발명'), [])
+
+        self.category.parent.name = '완성품'
+        self.category.parent.save()
+        self.assertEqual(len(self._search('완성품')), 2)
+
+        self.robot.delete()
+        self.assertEqual(self._search('로봇'), [])
+
+
+class ProductQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """
+    상품 목록 쿼리 실행 계획 테스트 클래스
+
+    10만 건 이상의 상품에서 목록 필터/정렬 쿼리가 인덱스를 사용하는지 테스트합니다.
+    (전체 목록을 반환하는 API이므로 쿼리를 실행하지 않고 실행 계획만 검사)
+    """
+    table = Product._meta.db_table
+
+    @classmethod
+    def setUpTestData(cls):
+        """카테고리별 / 판매 상태별 상품 데이터 생성 및 통계 갱신"""
+        cls.categories = [Category.objects.create(name=f'카테고리 {index}') for index in range(20)]
+        statuses = [key for key, _ in Product._meta.get_field('status').choices]
+        cls.seed(Product, [
+            Product(
+                name=f'상품 {index}',
+                category=cls.categories[index % len(cls.categories)],
+                description='상품 설명',
+                price=1000 * (index + 1),
+                duration='2시간',
+                status=statuses[index % len(statuses)]
+            )
+            for index in range(400)
+        ])
+        cls.analyze()
+
+    def _list_queryset(self, params):
+        """상품 목록 API가 사용하는 쿼리셋 반환 함수"""
+        view = ProductListView()
+        view.request = Request(APIRequestFactory().get(reverse('products:product-list'), params))
+        return view.get_queryset()
+
+    def test_list_filters_and_sorts(self):
+        """카테고리 필터 / 최신순 / 가격순 정렬 실행 계획 테스트 함수"""
+        for params in [
+            {},
+            {'category': self.categories[0].pk},
+            {'category': self.categories[0].pk, 'sort': 'latest'},
+            {'sort': 'price_asc'},
+            {'sort': 'price_desc'},
+        ]:
+            with self.subTest(params=params):
+                self.assertIndexedQueryset([self.table], self._list_queryset(params))
+
+    def test_status_filter(self):
+        """관리자 판매 상태 필터 (최신순) 실행 계획 테스트 함수"""
+        self.assertIndexedQueryset([self.table], Product.objects.filter(status='out_of_stock'))
+
+
+class ProductImageRenditionTest(TestCase):
+    """
+    상품 이미지 rendition 테스트 클래스
+
+    이미지 저장 후 고정 너비 / 형식별 rendition이 생성되고 srcset으로 노출되는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (임시 MEDIA_ROOT 사용)"""
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.client = APIClient()
+        self.product = Product.objects.create(
+            name='상품',
+            category=Category.objects.create(name='DIY 키트'),
+            description='- 상품 설명',
+            price=10000,
+            duration='2시간'
+        )
+
+    def _save_image(self, name, size, mode='RGB'):
+        """테스트용 이미지를 storage에 저장하고 경로 반환"""
+        buffer = BytesIO()
+        Image.new(mode, size, 'red').save(buffer, 'PNG')
+        return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    def _create_image(self, name, size, **kwargs):
+        """이미지를 저장하고 커밋 후 작업(rendition 생성)까지 실행"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return ProductImage.objects.create(
+                product=self.product, image=self._save_image(name, size, **kwargs)
+            )
+
+    def test_generated_on_save(self):
+        """고정 너비 / 형식별 rendition이 원본 옆에 생성되는지 테스트 함수"""
+        image = self._create_image('products/photo.png', (1000, 500))
+        renditions = ProductImageRendition.objects.filter(source=image.image.name)
+
+        formats = available_formats()
+        self.assertIn('jpeg', formats)
+        self.assertEqual(renditions.count(), 3 * len(formats))
+        self.assertEqual(
+            sorted({(rendition.width, rendition.height) for rendition in renditions}),
+            [(200, 100), (400, 200), (800, 400)]
+        )
+        for rendition in renditions:
+            self.assertEqual(
+                rendition.file.name,
+                rendition_name(image.image.name, rendition.width, os.path.splitext(rendition.file.name)[1][1:])
+            )
+            with default_storage.open(rendition.file.name) as file, Image.open(file) as output:
+                self.assertEqual(output.size, (rendition.width, rendition.height))
+
+    def test_small_image_not_upscaled(self):
+        """원본이 가장 작은 너비보다 작으면 원본 너비로만 생성하는지 테스트 함수 (투명 PNG 포함)"""
+        image = self._create_image('products/icon.png', (120, 60), mode='RGBA')
+        widths = set(
+            ProductImageRendition.objects.filter(source=image.image.name).values_list('width', flat=True)
+        )
+        self.assertEqual(widths, {120})
+
+    def test_srcset_in_list_and_detail(self):
+        """목록 / 상세 응답에 형식별 srcset이 포함되는지 테스트 함수"""
+        image = self._create_image('products/photo.png', (1000, 500))
+
+        response = self.client.get(reverse('products:product-list'))
+        srcset = response.data['data']['products'][0]['srcset']
+        self.assertEqual(set(srcset), set(available_formats()))
+        candidates = srcset['webp'].split(', ')
+        self.assertEqual([candidate.rsplit(' ', 1)[1] for candidate in candidates], ['200w', '400w', '800w'])
+        self.assertTrue(candidates[0].startswith('http://testserver/media/blobs/'))
+
+        response = self.client.get(reverse('products:product-detail', args=[self.product.pk]))
+        self.assertEqual(response.data['data']['images'][0]['srcset'], srcset)
+
+        # rendition이 없는 이미지는 빈 srcset
+        image.delete()
+        ProductImage.objects.create(product=self.product, image='products/missing.jpg')
+        response = self.client.get(reverse('products:product-list'))
+        self.assertEqual(response.data['data']['products'][0]['srcset'], {})
+
+    def test_regenerate_replaces_files(self):
+        """다시 생성하면 기존 rendition 파일을 교체하고, 원본이 없으면 생성하지 않는지 테스트 함수"""
+        image = self._create_image('products/photo.png', (1000, 500))
+        old_files = list(ProductImageRendition.objects.values_list('file', flat=True))
+
+        ProductImageRendition.generate(image.image.name)
+        self.assertEqual(ProductImageRendition.objects.count(), len(old_files))
+        self.assertEqual(
+            sorted(ProductImageRendition.objects.values_list('file', flat=True)), sorted(old_files)
+        )
+
+        self.assertEqual(ProductImageRendition.generate('products/missing.jpg'), [])
+        self.assertFalse(ProductImageRendition.objects.filter(source='products/missing.jpg').exists())
+
+
+class MediaLibraryTest(TestCase):
+    """
+    미디어 라이브러리 색인 테스트 클래스
+
+    업로드 시 색인 등록, scan_media 증분 동기화, 관리자 선택기 검색 API를 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (임시 MEDIA_ROOT 사용)"""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+    def _image_bytes(self, size=(40, 30), color='red'):
+        """테스트용 PNG 바이트"""
+        buffer = BytesIO()
+        Image.new('RGB', size, color).save(buffer, 'PNG')
+        return buffer.getvalue()
+
+    def _write(self, name, content):
+        """storage를 거치지 않고 디스크에 직접 파일 생성 (FTP 등 외부 복사 상황)"""
+        full_path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as file:
+            file.write(content)
+
+    def _scan(self, *args):
+        """scan_media 실행 결과 출력 반환"""
+        output = StringIO()
+        call_command('scan_media', *args, stdout=output)
+        return output.getvalue()
+
+    def test_upload_records_asset(self):
+        """업로드 시 크기 / 해상도 / 해시가 색인에 등록되는지 테스트 함수"""
+        name = default_storage.save('uploads/photo.png', ContentFile(self._image_bytes()))
+        asset = MediaAsset.objects.get(path=name)
+        self.assertEqual((asset.width, asset.height), (40, 30))
+        self.assertEqual(asset.size, len(self._image_bytes()))
+        self.assertEqual(len(asset.content_hash), 64)
+        self.assertEqual(asset.directory, os.path.dirname(name))
+        self.assertEqual(asset.name, 'photo.png')
+
+        # rendition / 라이브러리 밖 파일은 색인하지 않음
+        default_storage.save('uploads/renditions/photo_200w.png', ContentFile(self._image_bytes()))
+        default_storage.save('etc/photo.png', ContentFile(self._image_bytes()))
+        self.assertEqual(MediaAsset.objects.count(), 1)
+
+        default_storage.delete(name)
+        self.assertFalse(MediaAsset.objects.exists())
+
+    def test_scan_only_changed_directories(self):
+        """변경된 폴더만 검사하고 사라진 파일 / 폴더를 정리하는지 테스트 함수"""
+        self._write('uploads/2024/a.png', self._image_bytes())
+        self._write('uploads/2025/b.png', self._image_bytes())
+        self.assertIn('폴더 3개 검사, 0개 변경 없음 / 파일 2개 등록', self._scan())
+        self.assertEqual(
+            sorted(MediaAsset.objects.values_list('path', flat=True)),
+            ['uploads/2024/a.png', 'uploads/2025/b.png']
+        )
+
+        self.assertIn('폴더 0개 검사, 3개 변경 없음 / 파일 0개 등록, 0개 삭제', self._scan())
+
+        self._write('uploads/2025/c.png', self._image_bytes())
+        os.remove(os.path.join(self.media_root, 'uploads/2025/b.png'))
+        self.assertIn('폴더 1개 검사, 2개 변경 없음 / 파일 1개 등록, 1개 삭제', self._scan())
+
+        shutil.rmtree(os.path.join(self.media_root, 'uploads/2024'))
+        self._scan()
+        self.assertEqual(list(MediaAsset.objects.values_list('path', flat=True)), ['uploads/2025/c.png'])
+
+    def test_full_scan_detects_rewritten_file(self):
+        """--full은 같은 이름으로 내용만 바뀐 파일도 갱신하는지 테스트 함수"""
+        self._write('uploads/a.png', self._image_bytes())
+        self._scan()
+        old_hash = MediaAsset.objects.get().content_hash
+
+        self._write('uploads/a.png', self._image_bytes(size=(80, 60), color='blue'))
+        self._scan('--full')
+        asset = MediaAsset.objects.get()
+        self.assertNotEqual(asset.content_hash, old_hash)
+        self.assertEqual((asset.width, asset.height), (80, 60))
+
+    def test_autocomplete_view(self):
+        """선택기 검색 API가 파일명 접두어로 페이지 단위 응답하는지 테스트 함수"""
+        for index in range(25):
+            self._write(f'uploads/Home_{index:02d}.png', self._image_bytes())
+        self._write('uploads/logo.png', self._image_bytes())
+        self._scan()
+
+        admin = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='password123'
+        )
+        self.client.force_login(admin)
+        url = reverse('admin:products_mediaasset_autocomplete')
+
+        response = self.client.get(url, {'term': 'home'})
+        data = response.json()
+        self.assertEqual(len(data['results']), 20)
+        self.assertTrue(data['pagination']['more'])
+        self.assertEqual(data['results'][0]['id'], 'uploads/Home_00.png')
+
+        data = self.client.get(url, {'term': 'home', 'page': 2}).json()
+        self.assertEqual(len(data['results']), 5)
+        self.assertFalse(data['pagination']['more'])
+
+        data = self.client.get(url, {'term': 'LOGO'}).json()
+        self.assertEqual(data['results'], [{'id': 'uploads/logo.png', 'text': 'uploads/logo.png'}])
+
+        self.client.logout()
+        self.assertNotEqual(self.client.get(url).status_code, 200)
+
+    def test_form_does_not_walk_media(self):
+        """이미지 폼이 디스크를 탐색하지 않고 선택된 파일만 렌더링하는지 테스트 함수"""
+        self._write('uploads/a.png', self._image_bytes())
+        self._scan()
+
+        with self.assertNumQueries(0):
+            html = ProductImageForm().as_p()
+        self.assertIn('admin-autocomplete', html)
+        self.assertNotIn('uploads/a.png', html)
+
+        product = Product.objects.create(
+            name='상품', category=Category.objects.create(name='DIY 키트'),
+            description='- 상품 설명', price=10000, duration='2시간'
+        )
+        form = ProductImageForm(
+            data={'media_file': 'uploads/missing.png'}, instance=ProductImage(product=product)
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn('media_file', form.errors)
+
+
+class MediaReuseTest(TestCase):
+    """
+    미디어 파일 재사용 테스트 클래스
+
+    같은 내용은 blob 하나로 저장하고, 선택한 미디어 파일을 복사하지 않고 참조하며,
+    참조가 모두 사라진 파일만 삭제하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (임시 MEDIA_ROOT 사용)"""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.product = Product.objects.create(
+            name='상품',
+            category=Category.objects.create(name='DIY 키트'),
+            description='- 상품 설명',
+            price=10000,
+            duration='2시간'
+        )
+        buffer = BytesIO()
+        Image.new('RGB', (40, 30), 'red').save(buffer, 'PNG')
+        self.content = buffer.getvalue()
+
+    def _pick(self, media_file):
+        """관리자 폼으로 미디어 파일을 선택하여 상품 이미지 생성"""
+        form = ProductImageForm(
+            data={'media_file': media_file}, instance=ProductImage(product=self.product)
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        with self.captureOnCommitCallbacks(execute=True):
+            return form.save()
+
+    def _files(self):
+        """MEDIA_ROOT 하위 파일 목록 (rendition 제외)"""
+        return sorted(
+            os.path.relpath(os.path.join(root, name), self.media_root)
+            for root, dirs, files in os.walk(self.media_root)
+            if 'renditions' not in root
+            for name in files
+        )
+
+    def _write(self, name, content=None):
+        """storage를 거치지 않고 디스크에 직접 파일 생성 (내용 주소 기반 저장 도입 전 파일)"""
+        full_path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as file:
+            file.write(self.content if content is None else content)
+        MediaAsset.record(name)
+        return name
+
+    def _command(self, name, *args):
+        """관리 명령어 실행 결과 출력 반환"""
+        output = StringIO()
+        call_command(name, *args, stdout=output)
+        return output.getvalue()
+
+    def test_identical_uploads_stored_once(self):
+        """같은 내용의 업로드가 파일명과 관계없이 blob 하나로 저장되는지 테스트 함수"""
+        first = default_storage.save('uploads/2024/01/01/a_home.png', ContentFile(self.content))
+        second = default_storage.save('products/home_1.png', ContentFile(self.content))
+        other = default_storage.save('products/home_2.png', ContentFile(self.content + b'\0'))
+
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith('blobs/'))
+        self.assertNotEqual(first, other)
+        self.assertEqual(self._files(), sorted([first, other]))
+        self.assertEqual(MediaBlob.objects.count(), 2)
+        self.assertEqual(MediaAsset.objects.get(path=first).name, 'a_home.png')
+
+        image = ProductImage.objects.create(product=self.product, image=ContentFile(self.content, name='copy.png'))
+        self.assertEqual(image.image.name, first)
+        self.assertEqual(MediaBlob.objects.get(path=first).ref_count, 1)
+
+    def test_pick_references_existing_file(self):
+        """선택한 파일을 새로 저장하지 않고 경로만 참조하는지 테스트 함수"""
+        name = default_storage.save('uploads/home_1.png', ContentFile(self.content))
+
+        first = self._pick(name)
+        second = self._pick(name)
+        self.assertEqual(first.image.name, name)
+        self.assertEqual(second.image.name, name)
+        self.assertEqual(self._files(), [name])
+        self.assertEqual(MediaAsset.objects.count(), 1)
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 2)
+
+        # 초기값으로 채워진 선택기를 그대로 저장해도 다시 처리하지 않음
+        form = ProductImageForm(
+            data={'media_file': name, 'is_thumbnail': 'on'}, instance=first, initial={'media_file': name}
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertNotIn('media_file', form.changed_data)
+        form.save()
+        self.assertEqual(self._files(), [name])
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 2)
+
+    def test_blob_collected_after_last_reference(self):
+        """마지막 참조가 사라진 blob을 유예 시간이 지난 뒤 gc_media가 삭제하는지 테스트 함수"""
+        name = default_storage.save('products/home_1.png', ContentFile(self.content))
+        first = self._pick(name)
+        second = self._pick(name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 1)
+        self.assertIn('0개 blob', self._command('gc_media', '--min-age', '0'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 0)
+        self.assertTrue(default_storage.exists(name))
+
+        # 유예 시간 안의 blob은 유지
+        self.assertIn('0개 blob', self._command('gc_media'))
+        self.assertIn('1개 blob', self._command('gc_media', '--min-age', '0', '--dry-run'))
+        self.assertTrue(default_storage.exists(name))
+
+        self.assertIn('1개 blob', self._command('gc_media', '--min-age', '0'))
+        self.assertFalse(default_storage.exists(name))
+        self.assertFalse(MediaBlob.objects.exists())
+        self.assertFalse(MediaAsset.objects.exists())
+        self.assertFalse(ProductImageRendition.objects.filter(source=name).exists())
+
+    def test_purge_skips_blob_referenced_after_lookup(self):
+        """gc 대상 조회 후 다시 참조되거나 업로드된 blob은 삭제하지 않는지 테스트 함수"""
+        name = default_storage.save('products/home_1.png', ContentFile(self.content))
+        no_delay = timedelta(0)
+
+        blob = MediaBlob.garbage(no_delay).get(path=name)
+        MediaBlob.retain([name])
+        self.assertFalse(blob.purge(no_delay))
+        self.assertTrue(default_storage.exists(name))
+
+        MediaBlob.release([name])
+        blob = MediaBlob.garbage(no_delay).get(path=name)
+        MediaBlob.register(name, blob.content_hash, blob.size)
+        self.assertFalse(blob.purge(timedelta(minutes=1)))
+        self.assertTrue(MediaBlob.objects.filter(path=name).exists())
+        self.assertTrue(default_storage.exists(name))
+
+        self.assertTrue(blob.purge(no_delay))
+        self.assertFalse(default_storage.exists(name))
+
+    def test_rich_text_references_counted(self):
+        """상품 상세 본문에서 참조하는 CKEditor 업로드 blob은 gc_media가 삭제하지 않는지 테스트 함수"""
+        name = default_storage.save('uploads/2024/01/01/detail.png', ContentFile(self.content))
+        self.product.product_detail_info = f'<p><img src="/media/{name}" /></p>'
+        self.product.save()
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 1)
+
+        # queryset.update로 바뀐 참조도 gc_media 실행 시 다시 계산
+        MediaBlob.objects.filter(path=name).update(ref_count=0)
+        self._command('gc_media', '--min-age', '0')
+        self.assertTrue(default_storage.exists(name))
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 1)
+
+        self.product.product_detail_info = '<p>이미지 없음</p>'
+        self.product.save()
+        self.assertEqual(MediaBlob.objects.get(path=name).ref_count, 0)
+        self._command('gc_media', '--min-age', '0')
+        self.assertFalse(default_storage.exists(name))
+
+    def test_replaced_legacy_image_released(self):
+        """기존 경로 이미지 교체 시 참조가 없어진 이전 파일을 바로 삭제하는지 테스트 함수"""
+        old_name = self._write('products/old.png')
+        new_name = default_storage.save('products/new.png', ContentFile(self.content))
+        image = self._pick(old_name)
+
+        image.image = new_name
+        with self.captureOnCommitCallbacks(execute=True):
+            image.save()
+        self.assertFalse(default_storage.exists(old_name))
+        self.assertTrue(default_storage.exists(new_name))
+        self.assertEqual(MediaBlob.objects.get(path=new_name).ref_count, 1)
+
+    def test_legacy_library_uploads_kept(self):
+        """기존 CKEditor 업로드 폴더 파일은 참조가 없어도 삭제하지 않는지 테스트 함수"""
+        name = self._write('uploads/home_1.png')
+        with self.captureOnCommitCallbacks(execute=True):
+            self._pick(name).delete()
+        self.assertTrue(default_storage.exists(name))
+
+    def test_dedupe_existing_media(self):
+        """기존 media 폴더의 중복 파일을 blob으로 합치고 참조를 바꾸는지 테스트 함수"""
+        first = self._write('products/a.png')
+        second = self._write('products/b.png')
+        detail = self._write('uploads/2024/c.png', self.content + b'\0')
+        self._write('uploads/2024/c_thumb.png')
+        ProductImage.objects.bulk_create([
+            ProductImage(product=self.product, image=first),
+            ProductImage(product=self.product, image=second),
+        ])
+        Product.objects.filter(pk=self.product.pk).update(
+            product_detail_info=f'<img src="http://testserver/media/{detail}"><img src="/media/etc/keep.png">'
+        )
+
+        output = self._command('dedupe_media', '--dry-run')
+        self.assertIn('3개 파일 → 2개 blob', output)
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, first)))
+
+        self._command('dedupe_media')
+        images = set(ProductImage.objects.values_list('image', flat=True))
+        self.assertEqual(len(images), 1)
+        blob = images.pop()
+        self.assertTrue(blob.startswith('blobs/'))
+        self.assertEqual(MediaBlob.objects.get(path=blob).ref_count, 2)
+
+        self.product.refresh_from_db()
+        detail_blob = MediaBlob.objects.exclude(path=blob).get()
+        self.assertIn(f'http://testserver/media/{detail_blob.path}', self.product.product_detail_info)
+        self.assertIn('/media/etc/keep.png', self.product.product_detail_info)
+        self.assertEqual(detail_blob.ref_count, 1)
+
+        self.assertEqual(self._files(), sorted([blob, detail_blob.path]))
+        self.assertEqual(
+            sorted(MediaAsset.objects.values_list('path', flat=True)), sorted([blob, detail_blob.path])
+        )
+
+
+@skipUnless(mock_aws, 'moto가 설치되어 있지 않습니다.')
+@override_settings(
+    STORAGES={**settings.STORAGES, 'default': {'BACKEND': 'config.storage.S3MediaStorage'}},
+    AWS_STORAGE_BUCKET_NAME='media-test',
+    AWS_S3_REGION_NAME='us-east-1',
+    AWS_S3_ENDPOINT_URL=None,
+    AWS_S3_CUSTOM_DOMAIN=None,
+)
+class S3MediaStorageTest(TestCase):
+    """
+    S3 호환 저장소 테스트 클래스
+
+    moto로 띄운 로컬 S3에서 내용 주소 기반 저장과 presigned URL 직접 업로드를 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (moto S3 버킷 생성)"""
+        credentials = mock.patch.dict(os.environ, {
+            'AWS_ACCESS_KEY_ID': 'testing',
+            'AWS_SECRET_ACCESS_KEY': 'testing',
+        })
+        credentials.start()
+        self.addCleanup(credentials.stop)
+        s3 = mock_aws()
+        s3.start()
+        self.addCleanup(s3.stop)
+        default_storage.client.create_bucket(Bucket='media-test')
+
+        self.product = Product.objects.create(
+            name='상품',
+            category=Category.objects.create(name='DIY 키트'),
+            description='- 상품 설명',
+            price=10000,
+            duration='2시간'
+        )
+        buffer = BytesIO()
+        Image.new('RGB', (40, 30), 'red').save(buffer, 'PNG')
+        self.content = buffer.getvalue()
+        self.admin = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='password123'
+        )
+
+    def _keys(self):
+        """버킷의 객체 키 목록 (rendition 제외)"""
+        response = default_storage.client.list_objects_v2(Bucket='media-test')
+        return sorted(item['Key'] for item in response.get('Contents', []) if 'renditions' not in item['Key'])
+
+    def _prepare(self, content, filename='direct.png'):
+        """직접 업로드 요청"""
+        return self.client.post(reverse('products:media-upload'), {
+            'filename': filename,
+            'size': len(content),
+            'sha256': hashlib.sha256(content).hexdigest(),
+        }, content_type='application/json')
+
+    def _complete(self, path, filename='direct.png'):
+        """직접 업로드 완료 요청 (커밋 후 작업까지 실행)"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('products:media-upload-complete'),
+                {'path': path, 'filename': filename},
+                content_type='application/json'
+            )
+
+    def test_upload_stored_once_in_bucket(self):
+        """서버를 거친 업로드도 버킷에 blob 하나로 저장되고 rendition이 생성되는지 테스트 함수"""
+        first = default_storage.save('products/a.png', ContentFile(self.content))
+        second = default_storage.save('uploads/2024/01/01/b.png', ContentFile(self.content))
+        self.assertEqual(first, second)
+        self.assertEqual(self._keys(), [first])
+        self.assertEqual(default_storage.url(first), f'https://s3.amazonaws.com/media-test/{first}')
+
+        head = default_storage.client.head_object(Bucket='media-test', Key=first)
+        self.assertEqual(head['ContentType'], 'image/png')
+        self.assertIn('immutable', head['CacheControl'])
+        asset = MediaAsset.objects.get(path=first)
+        self.assertEqual((asset.name, asset.width, asset.height), ('a.png', 40, 30))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ProductImage.objects.create(
+                product=self.product, image=ContentFile(self.content, name='copy.png')
+            )
+        self.assertEqual(image.image.name, first)
+        rendition = ProductImageRendition.objects.filter(source=first).first()
+        self.assertIsNotNone(rendition)
+        self.assertTrue(default_storage.exists(rendition.file.name))
+
+    def test_direct_upload(self):
+        """presigned URL로 업로드하고 완료 API로 blob과 색인이 등록되는지 테스트 함수"""
+        self.client.force_login(self.admin)
+
+        response = self._prepare(self.content)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()['data']
+        upload = data['upload']
+        self.assertEqual(upload['method'], 'PUT')
+        self.assertEqual(MediaBlob.objects.get(path=data['path']).ref_count, 0)
+
+        result = requests.put(upload['url'], data=self.content, headers=upload['headers'])
+        self.assertEqual(result.status_code, 200)
+        response = self._complete(data['path'])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        asset = MediaAsset.objects.get(path=data['path'])
+        self.assertEqual((asset.name, asset.width, asset.height), ('direct.png', 40, 30))
+        self.assertEqual(self._keys(), [data['path']])
+
+        # 같은 내용은 업로드 생략
+        response = self._prepare(self.content, filename='again.png')
+        self.assertEqual(response.json()['data']['path'], data['path'])
+        self.assertIsNone(response.json()['data']['upload'])
+
+    def test_direct_upload_selectable_before_task(self):
+        """색인 작업이 실행되기 전에도 완료된 업로드를 관리자 폼에서 선택할 수 있는지 테스트 함수"""
+        self.client.force_login(self.admin)
+        data = self._prepare(self.content).json()['data']
+        requests.put(data['upload']['url'], data=self.content, headers=data['upload']['headers'])
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(
+                reverse('products:media-upload-complete'),
+                {'path': data['path'], 'filename': 'direct.png'},
+                content_type='application/json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(callbacks), 1)
+        asset = MediaAsset.objects.get(path=data['path'])
+        self.assertEqual((asset.name, asset.size, asset.width), ('direct.png', len(self.content), None))
+
+        form = ProductImageForm(
+            data={'media_file': data['path']}, instance=ProductImage(product=self.product)
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+
+        # 작업 실행 후 이미지 크기 등록
+        callbacks[0]()
+        asset.refresh_from_db()
+        self.assertEqual((asset.width, asset.height), (40, 30))
+
+    def test_direct_upload_rejected(self):
+        """업로드되지 않았거나 내용이 다른 파일의 완료 요청을 거부 / 정리하는지 테스트 함수"""
+        self.client.force_login(self.admin)
+        data = self._prepare(self.content).json()['data']
+        self.assertEqual(self._complete(data['path']).status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 체크섬을 검사하지 않는 저장소에 다른 내용이 올라온 경우 색인 등록 시 삭제
+        tampered = bytes([self.content[0] ^ 1]) + self.content[1:]
+        requests.put(data['upload']['url'], data=tampered, headers=data['upload']['headers'])
+        self._complete(data['path'])
+        self.assertFalse(MediaBlob.objects.filter(path=data['path']).exists())
+        self.assertFalse(MediaAsset.objects.filter(path=data['path']).exists())
+        self.assertEqual(self._keys(), [])
+
+    def test_direct_upload_permissions(self):
+        """관리자만 직접 업로드할 수 있고, 로컬 저장소에서는 지원하지 않는지 테스트 함수"""
+        user = get_user_model().objects.create_user(
+            username='user', email='user@example.com', password='password123'
+        )
+        self.client.force_login(user)
+        self.assertEqual(self._prepare(self.content).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_login(self.admin)
+        response = self._prepare(self.content, filename='document.pdf')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('filename', response.json())
+
+        with override_settings(STORAGES={
+            **settings.STORAGES, 'default': {'BACKEND': 'config.storage.MediaLibraryStorage'}
+        }):
+            self.assertEqual(self._prepare(self.content).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class FileServingMiddlewareTest(TestCase):
+    """
+    정적 / 업로드 파일 응답 미들웨어 테스트 클래스
+
+    해시 파일명과 blob의 immutable 캐시, 조건부 응답, Range 요청, X-Accel-Redirect 위임을 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수 (임시 MEDIA_ROOT / STATIC_ROOT 사용)"""
+        self.media_root = tempfile.mkdtemp()
+        self.static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.static_root, ignore_errors=True)
+        file_settings = override_settings(
+            MEDIA_ROOT=self.media_root,
+            STATIC_ROOT=self.static_root,
+            SERVE_FILES=True,
+            FILE_SENDFILE_BACKEND=None,
+        )
+        file_settings.enable()
+        self.addCleanup(file_settings.disable)
+
+        self.content = bytes(range(256)) * 40
+        self.blob = default_storage.save('uploads/sample.bin', ContentFile(self.content))
+        for name in ('css/site.css', 'css/site.0123abcd.css'):
+            os.makedirs(os.path.join(self.static_root, 'css'), exist_ok=True)
+            with open(os.path.join(self.static_root, name), 'w') as file:
+                file.write('body { color: red; }')
+
+    def test_cache_control(self):
+        """해시 파일명 / blob은 immutable, 그 외 파일은 짧은 캐시"""
+        with mock.patch.object(
+            staticfiles_storage, 'hashed_files', {'css/site.css': 'css/site.0123abcd.css'}, create=True
+        ):
+            hashed = self.client.get('/static/css/site.0123abcd.css')
+            plain = self.client.get('/static/css/site.css')
+        self.assertEqual(hashed.status_code, 200)
+        self.assertIn('immutable', hashed['Cache-Control'])
+        self.assertEqual(plain['Cache-Control'], f'public, max-age={settings.STATIC_CACHE_SECONDS}')
+
+        response = self.client.get(f'/media/{self.blob}')
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_conditional_request(self):
+        """ETag가 같으면 304 응답"""
+        etag = self.client.get(f'/media/{self.blob}')['ETag']
+        response = self.client.get(f'/media/{self.blob}', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_range_request(self):
+        """Range 요청은 해당 구간만 206으로 응답, 범위를 벗어나면 416"""
+        size = len(self.content)
+        response = self.client.get(f'/media/{self.blob}', HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{size}')
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(b''.join(response.streaming_content), self.content[10:20])
+
+        response = self.client.get(f'/media/{self.blob}', HTTP_RANGE='bytes=-100')
+        self.assertEqual(b''.join(response.streaming_content), self.content[-100:])
+
+        response = self.client.get(f'/media/{self.blob}', HTTP_RANGE=f'bytes={size}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{size}')
+
+        # 바뀐 파일의 If-Range면 전체 응답
+        response = self.client.get(
+            f'/media/{self.blob}', HTTP_RANGE='bytes=10-19', HTTP_IF_RANGE='"stale"'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(FILE_SENDFILE_BACKEND='x-accel-redirect')
+    def test_x_accel_redirect(self):
+        """X-Accel-Redirect 설정 시 본문 없이 nginx 내부 경로 전달"""
+        response = self.client.get(f'/media/{self.blob}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Accel-Redirect'], f'/_protected/media/{self.blob}')
+        self.assertEqual(response.content, b'')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_missing_or_outside_files(self):
+        """없는 파일, MEDIA_ROOT 밖 경로, 업로드 중 임시 파일은 응답하지 않음"""
+        os.makedirs(os.path.join(self.media_root, 'blobs', 'tmp'), exist_ok=True)
+        with open(os.path.join(self.media_root, 'blobs', 'tmp', 'partial'), 'wb') as file:
+            file.write(b'partial')
+        for url in ['/media/uploads/missing.bin', '/media/..%2Fmanage.py', '/media/blobs/tmp/partial']:
+            self.assertEqual(self.client.get(url).status_code, 404, url)
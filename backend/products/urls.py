@@ -1,9 +1,12 @@
 from django.urls import path
 from products.views.product_views import ProductListView, ProductDetailView
+from products.views.upload_views import MediaUploadView, MediaUploadCompleteView
 
 app_name = 'products'
 
 urlpatterns = [
     path('', ProductListView.as_view(), name='product-list'),
     path('<int:pk>/', ProductDetailView.as_view(), name='product-detail'),
+    path('uploads/', MediaUploadView.as_view(), name='media-upload'),
+    path('uploads/complete/', MediaUploadCompleteView.as_view(), name='media-upload-complete'),
 ] 
\ No newline at end of file
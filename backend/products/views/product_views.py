@@ -1,37 +1,69 @@
 from rest_framework import generics
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.db.models import Q
 from ..models import Product
+from ..search import search_products
 from ..serializers.product_serializer import ProductListSerializer, ProductDetailSerializer
+from config.cache import cached_response
+from config.conditional import conditional_retrieve
+
+class ProductListPagination(PageNumberPagination):
+    """
+    상품 목록 페이지네이션 클래스
+    - 관련도/가격순 정렬을 유지하기 위해 cursor 대신 번호 페이지 (?page, ?limit)
+    - limit는 max_page_size를 넘을 수 없음
+    - 응답 형식: {'status', 'data': {'products', 'meta': {'total', 'pages', 'current_page'}}}
+    """
+    page_size = 100
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+    def get_paginated_response(self, data):
+        """기존 상품 목록 응답 형식으로 구성"""
+        return Response({
+            'status': 'success',
+            'data': {
+                'products': data,
+                'meta': {
+                    'total': self.page.paginator.count,
+                    'pages': self.page.paginator.num_pages,
+                    'current_page': self.page.number
+                }
+            }
+        })
+
 
 class ProductListView(generics.ListAPIView):
     """
     상품 목록 조회 API View
     - 로그인 없이 모든 사용자 접근 가능
     - 카테고리, 검색어, 정렬 기능 지원
+    - 페이지당 최대 100개 (?page, ?limit)
     """
     serializer_class = ProductListSerializer
     permission_classes = [AllowAny]  # 로그인 없이 접근 허용
+    pagination_class = ProductListPagination
 
     def get_queryset(self):
         """
         쿼리셋 필터링 및 정렬 처리
+        - 검색어가 있으면 관련도순 정렬 (sort 지정 시 sort 우선)
+        - 카테고리와 대표 이미지는 JOIN으로, 태그는 prefetch로 한 번에 조회 (N+1 방지)
         """
-        queryset = Product.objects.all()
+        queryset = Product.objects.select_related(
+            'category', 'thumbnail_image'
+        ).prefetch_related('tags')
         
         # 카테고리 필터링
         category = self.request.query_params.get('category', None)
         if category:
             queryset = queryset.filter(category=category)
         
-        # 검색어 필터링
+        # 검색어 필터링 (전문 검색 인덱스, 관련도순 정렬)
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) |
-                Q(description__icontains=search)
-            )
+            queryset = search_products(queryset, search)
         
         # 정렬
         sort = self.request.query_params.get('sort', None)
@@ -45,43 +77,34 @@ class ProductListView(generics.ListAPIView):
         
         return queryset
 
+    @cached_response('products')
     def list(self, request, *args, **kwargs):
         """
         상품 목록 응답 데이터 구성
+        - 비로그인 요청은 응답 캐시 사용 (상품/이미지/태그/카테고리 변경 시 무효화)
         """
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True, context={'request': request})
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True, context={'request': request})
-        return Response({
-            'status': 'success',
-            'data': {
-                'products': serializer.data,
-                'meta': {
-                    'total': queryset.count(),
-                    'pages': 1,
-                    'current_page': 1
-                }
-            }
-        })
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True, context={'request': request})
+        return self.get_paginated_response(serializer.data)
 
 class ProductDetailView(generics.RetrieveAPIView):
     """
     상품 상세 조회 API View
     - 로그인 없이 모든 사용자 접근 가능
     """
-    queryset = Product.objects.all()
+    queryset = Product.objects.select_related('category').prefetch_related('images', 'tags')
     serializer_class = ProductDetailSerializer
     permission_classes = [AllowAny]  # 로그인 없이 접근 허용
     lookup_field = 'pk'
 
+    @conditional_retrieve('updated_at')
+    @cached_response('products')
     def retrieve(self, request, *args, **kwargs):
         """
         상품 상세 정보 응답 데이터 구성
+        - updated_at 기반 ETag / Last-Modified, 변경이 없으면 304 반환
+        - 이미지/태그/카테고리 변경 시 시그널로 updated_at 갱신
+        - 비로그인 요청은 응답 캐시 사용 (변경 시 시그널로 무효화)
         """
         instance = self.get_object()
         serializer = self.get_serializer(instance, context={'request': request})
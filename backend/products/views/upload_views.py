@@ -0,0 +1,65 @@
+from django.core.files.storage import default_storage
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from ..models import MediaBlob
+from ..serializers.upload_serializer import MediaUploadSerializer, MediaUploadCompleteSerializer
+from ..tasks import record_media_asset
+
+
+class MediaUploadView(APIView):
+    """
+    브라우저 직접 업로드 요청 API View
+    - 관리자만 접근 가능 (관리자 페이지 세션 또는 JWT)
+    - 같은 내용의 파일이 이미 있으면 upload: null (업로드 생략)
+    - 없으면 presigned PUT 요청 정보 반환, 업로드 후 완료 API 호출
+    """
+    authentication_classes = [JWTAuthentication, SessionAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        if not hasattr(default_storage, 'presigned_upload'):
+            return Response(
+                {'error': '현재 저장소는 직접 업로드를 지원하지 않습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = MediaUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = MediaBlob.prepare_upload(
+            serializer.validated_data['filename'],
+            serializer.validated_data['sha256'],
+            serializer.validated_data['size'],
+        )
+        return Response({'status': 'success', 'data': upload})
+
+
+class MediaUploadCompleteView(APIView):
+    """
+    브라우저 직접 업로드 완료 API View
+    - 업로드된 객체를 확인하여 blob과 미디어 라이브러리 색인 등록
+    - 이미지 크기 확인 / 내용 검증은 작업 큐에서 처리
+    """
+    authentication_classes = [JWTAuthentication, SessionAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = MediaUploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        path = serializer.validated_data['path']
+        filename = serializer.validated_data['filename']
+        if (
+            not hasattr(default_storage, 'uploaded_checksum')
+            or MediaBlob.complete_upload(path, name=filename) is None
+        ):
+            return Response(
+                {'error': '업로드된 파일을 찾을 수 없거나 내용이 일치하지 않습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        record_media_asset.delay_on_commit(path, filename)
+        return Response(
+            {'status': 'success', 'data': {'path': path, 'url': default_storage.url(path)}},
+            status=status.HTTP_201_CREATED
+        )
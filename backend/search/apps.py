@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    """
+    통합 검색 앱 설정 클래스
+
+    수업/커리큘럼/문의는 하나의 역색인으로, 상품은 상품 검색 문서로 함께 검색합니다.
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+    verbose_name = '통합 검색'
+
+    def ready(self):
+        """앱이 시작될 때 색인 갱신 시그널 등록"""
+        from . import signals  # noqa: F401
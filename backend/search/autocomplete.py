@@ -0,0 +1,168 @@
+import threading
+from bisect import bisect_left, insort
+from django.db import transaction
+from config.cache import get_cache_version, bump_cache_version
+from config.search import decompose_hangul
+
+# 프로세스 간 자동완성 색인 동기화용 캐시 버전 그룹
+VERSION_GROUP = 'autocomplete'
+
+# 순위 계산을 위해 살펴보는 최대 접두어 일치 수
+SCAN_LIMIT = 1000
+
+
+def normalize(text):
+    """자동완성 비교 키 생성 (소문자, 공백 제거, 한글 자모 분해)"""
+    return decompose_hangul(''.join((text or '').lower().split()))
+
+
+class PrefixIndex:
+    """
+    정렬된 키 목록 기반 접두어 색인
+    - 라벨의 각 단어 시작 위치부터의 문자열을 자모 분해하여 키로 저장
+      (예: '아두이노 스마트홈' -> '아두이노스마트홈', '스마트홈')
+    - 조회는 이진 탐색 후 접두어가 일치하는 구간만 순회
+    """
+    def __init__(self):
+        self._keys = []
+        self._entries = {}
+
+    @classmethod
+    def build(cls, labels):
+        """
+        (종류, ID, 라벨) 목록으로 색인 생성
+        - 항목별 삽입 대신 키를 모아 한 번에 정렬
+        """
+        index = cls()
+        for kind, object_id, label in labels:
+            keys = index._register(kind, object_id, label)
+            index._keys.extend((key, kind, object_id) for key in keys)
+        index._keys.sort()
+        return index
+
+    def _register(self, kind, object_id, label):
+        """항목 정보를 등록하고 접두어 키 목록 반환"""
+        words = label.split()
+        keys = {normalize(' '.join(words[index:])) for index in range(len(words))}
+        keys.discard('')
+        self._entries[(kind, object_id)] = (label, keys, normalize(label))
+        return keys
+
+    def add(self, kind, object_id, label):
+        """항목 추가 (같은 항목이 있으면 교체)"""
+        self.remove(kind, object_id)
+        for key in self._register(kind, object_id, label):
+            insort(self._keys, (key, kind, object_id))
+
+    def remove(self, kind, object_id):
+        """항목 삭제"""
+        entry = self._entries.pop((kind, object_id), None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            index = bisect_left(self._keys, (key, kind, object_id))
+            del self._keys[index]
+
+    def complete(self, prefix, limit):
+        """
+        접두어와 일치하는 항목 상위 limit개 반환
+        - 라벨 전체가 접두어로 시작하는 항목 우선, 같은 조건이면 짧은 라벨 우선
+
+        Returns:
+            list: [{'type', 'id', 'label'}, ...]
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        matches = {}
+        index = bisect_left(self._keys, (prefix,))
+        while index < len(self._keys) and len(matches) < SCAN_LIMIT:
+            key, kind, object_id = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            label, _, label_key = self._entries[(kind, object_id)]
+            rank = (not label_key.startswith(prefix), len(label), label)
+            if (kind, object_id) not in matches or rank < matches[(kind, object_id)]:
+                matches[(kind, object_id)] = rank
+            index += 1
+
+        ranked = sorted(matches.items(), key=lambda item: item[1])[:limit]
+        return [
+            {'type': kind, 'id': object_id, 'label': self._entries[(kind, object_id)][0]}
+            for (kind, object_id), _ in ranked
+        ]
+
+
+def load_labels():
+    """
+    자동완성 대상 (종류, ID, 라벨) 목록 조회
+    - 상품명, 태그, 카테고리, 활성 수업 제목
+    """
+    from outreach_inquiries.models import InternalClass
+    from products.models import Product, Category, Tag
+
+    sources = [
+        ('product', Product.objects.values_list('pk', 'name')),
+        ('tag', Tag.objects.values_list('pk', 'name')),
+        ('category', Category.objects.values_list('pk', 'name')),
+        ('internal_class', InternalClass.objects.filter(is_active=True).values_list('pk', 'title')),
+    ]
+    return [
+        (kind, object_id, label)
+        for kind, queryset in sources
+        for object_id, label in queryset
+    ]
+
+
+class Autocomplete:
+    """
+    프로세스별 자동완성 색인 관리
+    - 첫 조회 시 DB에서 색인 생성, 이후 조회는 메모리에서만 처리 (DB 쿼리 없음)
+    - 변경 시 현재 프로세스는 증분 갱신, 다른 프로세스는 캐시 버전이 바뀌면 재생성
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._version = None
+
+    def _current_index(self):
+        """캐시 버전이 바뀌었으면 색인을 다시 생성하여 반환"""
+        version = get_cache_version(VERSION_GROUP)
+        if self._index is None or self._version != version:
+            self._index, self._version = PrefixIndex.build(load_labels()), version
+        return self._index
+
+    def complete(self, prefix, limit=10):
+        """접두어 자동완성 결과 반환"""
+        with self._lock:
+            return self._current_index().complete(prefix, limit)
+
+    def update(self, kind, object_id, label=None):
+        """
+        항목 증분 갱신 (label이 None이면 삭제)
+        - 현재 프로세스 색인이 최신이면 바로 반영하고 공유 버전만 증가
+        - 최신이 아니면 다음 조회 때 재생성
+        """
+        with self._lock:
+            up_to_date = (
+                self._index is not None
+                and self._version == get_cache_version(VERSION_GROUP)
+            )
+            version = bump_cache_version(VERSION_GROUP)
+            if not up_to_date or version != self._version + 1:
+                self._index = None
+                return
+
+            if label is None:
+                self._index.remove(kind, object_id)
+            else:
+                self._index.add(kind, object_id, label)
+            self._version = version
+
+    def update_on_commit(self, kind, object_id, label=None):
+        """트랜잭션 커밋 후 항목 증분 갱신 (롤백된 변경은 반영하지 않음)"""
+        transaction.on_commit(lambda: self.update(kind, object_id, label))
+
+
+autocomplete = Autocomplete()
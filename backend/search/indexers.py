@@ -0,0 +1,85 @@
+from inquiries.models import Inquiry
+from lessons.models import LessonInquiry
+from outreach_inquiries.models import OutreachInquiry, InternalClass, Curriculum
+from .models import SearchEntry
+
+
+def _internal_class_document(internal_class):
+    """수업 검색 문서: 제목, 강사, 설명 (비활성 수업은 제외)"""
+    if not internal_class.is_active:
+        return None
+    return internal_class.title, internal_class.instructor, [
+        (internal_class.title, 3),
+        (internal_class.instructor, 1),
+        (internal_class.description, 1),
+    ]
+
+
+def _curriculum_document(curriculum):
+    """커리큘럼 검색 문서: 차시 제목 (비활성 수업의 커리큘럼은 제외)"""
+    if not curriculum.internal_class.is_active:
+        return None
+    return curriculum.session_title, curriculum.internal_class.title, [
+        (curriculum.session_title, 3),
+    ]
+
+
+def _inquiry_document(inquiry):
+    """문의 검색 문서: 목록에 공개되는 제목과 요청자 이름만 사용"""
+    return inquiry.title, inquiry.requester_name, [
+        (inquiry.title, 3),
+        (inquiry.requester_name, 1),
+    ]
+
+
+# 종류별 (모델, 색인용 쿼리셋 함수, 검색 문서 생성 함수)
+# - 상품은 products.ProductSearchDocument로 검색하므로 제외
+INDEXERS = {
+    'internal_class': (InternalClass, InternalClass.objects.all, _internal_class_document),
+    'curriculum': (
+        Curriculum,
+        lambda: Curriculum.objects.select_related('internal_class'),
+        _curriculum_document,
+    ),
+    'inquiry': (Inquiry, Inquiry.objects.all, _inquiry_document),
+    'lesson_inquiry': (LessonInquiry, LessonInquiry.objects.all, _inquiry_document),
+    'outreach_inquiry': (OutreachInquiry, OutreachInquiry.objects.all, _inquiry_document),
+}
+
+
+def index_object(kind, obj):
+    """
+    객체 1개 색인 갱신
+    - 검색 대상이 아니면(비활성 수업 등) 색인에서 삭제
+    """
+    document = INDEXERS[kind][2](obj)
+    if document is None:
+        SearchEntry.remove(kind, obj.pk)
+        return
+    title, subtitle, fields = document
+    SearchEntry.index(kind, obj.pk, title, subtitle, fields)
+
+
+def index_objects(kind, object_ids):
+    """ID 목록에 해당하는 객체 색인 갱신"""
+    for obj in INDEXERS[kind][1]().filter(pk__in=list(object_ids)):
+        index_object(kind, obj)
+
+
+def rebuild(kinds=None):
+    """
+    색인 전체 재생성
+    - 원본이 삭제된 색인도 정리
+
+    Returns:
+        int: 재생성 후 색인된 객체 수
+    """
+    kinds = list(kinds or INDEXERS)
+    for kind in kinds:
+        model, queryset, _ = INDEXERS[kind]
+        for obj in queryset().iterator(chunk_size=500):
+            index_object(kind, obj)
+        SearchEntry.objects.filter(kind=kind).exclude(
+            object_id__in=model.objects.values('pk')
+        ).delete()
+    return SearchEntry.objects.filter(kind__in=kinds).count()
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from search.indexers import INDEXERS, rebuild
+
+
+class Command(BaseCommand):
+    """
+    통합 검색 색인 재생성 명령어
+    """
+    help = '수업/커리큘럼/문의 통합 검색 색인을 다시 생성합니다 (상품은 rebuild_product_search_index)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'kinds',
+            nargs='*',
+            help=f"재생성할 종류 (기본값: 전체, 선택: {', '.join(INDEXERS)})",
+        )
+
+    def handle(self, *args, **options):
+        """색인 재생성 메인 로직"""
+        invalid_kinds = [kind for kind in options['kinds'] if kind not in INDEXERS]
+        if invalid_kinds:
+            raise CommandError(f"지원하지 않는 종류입니다: {', '.join(invalid_kinds)}")
+
+        indexed_count = rebuild(options['kinds'] or None)
+        self.stdout.write(
+            self.style.SUCCESS(f'{indexed_count}개 객체를 색인했습니다.')
+        )
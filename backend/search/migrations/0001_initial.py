@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('product', '상품'), ('internal_class', '수업'), ('curriculum', '커리큘럼'), ('inquiry', '견적 문의'), ('lesson_inquiry', '수업 문의'), ('outreach_inquiry', '출강 교육 문의')], max_length=30, verbose_name='종류')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='원본 ID')),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('subtitle', models.CharField(blank=True, max_length=200, verbose_name='부제목')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='색인 갱신일')),
+            ],
+            options={
+                'verbose_name': '검색 색인',
+                'verbose_name_plural': '검색 색인 목록',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_entry')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=50, verbose_name='토큰')),
+                ('weight', models.PositiveIntegerField(default=1, verbose_name='가중치')),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='search.searchentry', verbose_name='색인 대상')),
+            ],
+            options={
+                'verbose_name': '검색 역색인',
+                'verbose_name_plural': '검색 역색인 목록',
+                'constraints': [models.UniqueConstraint(fields=('token', 'entry'), name='unique_search_posting')],
+            },
+        ),
+    ]
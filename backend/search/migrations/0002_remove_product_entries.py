@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def remove_product_entries(apps, schema_editor):
+    """상품 색인 삭제 (상품은 products.ProductSearchDocument로 검색, 역색인은 CASCADE로 함께 삭제)"""
+    SearchEntry = apps.get_model('search', 'SearchEntry')
+    SearchEntry.objects.filter(kind='product').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_product_entries, migrations.RunPython.noop),
+    ]
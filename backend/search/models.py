@@ -0,0 +1,209 @@
+from collections import Counter
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Sum, When
+from config.search import tokenize, query_terms
+
+
+class SearchEntry(models.Model):
+    """
+    통합 검색 색인 대상 모델
+    - 원본 객체(kind, object_id)별로 1개, 검색 결과 표시용 제목/부제목 보관
+    - 상품은 상품 검색 문서(products.ProductSearchDocument)로 검색하므로 색인하지 않음
+    """
+    KIND_CHOICES = [
+        ('product', '상품'),
+        ('internal_class', '수업'),
+        ('curriculum', '커리큘럼'),
+        ('inquiry', '견적 문의'),
+        ('lesson_inquiry', '수업 문의'),
+        ('outreach_inquiry', '출강 교육 문의'),
+    ]
+
+    kind = models.CharField(
+        max_length=30,
+        choices=KIND_CHOICES,
+        verbose_name='종류'
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name='원본 ID')
+    title = models.CharField(max_length=200, verbose_name='제목')
+    subtitle = models.CharField(max_length=200, blank=True, verbose_name='부제목')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='색인 갱신일')
+
+    class Meta:
+        verbose_name = '검색 색인'
+        verbose_name_plural = '검색 색인 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_entry'),
+        ]
+
+    def __str__(self):
+        return f"[{self.get_kind_display()}] {self.title}"
+
+    @classmethod
+    @transaction.atomic
+    def index(cls, kind, object_id, title, subtitle, fields):
+        """
+        객체 색인 생성/갱신
+        - 필드별 가중치를 토큰 점수로 합산하여 역색인(SearchPosting) 재작성
+
+        Args:
+            kind: 객체 종류 (KIND_CHOICES)
+            object_id: 원본 객체 ID
+            title: 검색 결과 제목
+            subtitle: 검색 결과 부제목
+            fields: (텍스트, 가중치) 목록
+        """
+        weights = Counter()
+        for text, weight in fields:
+            for token in tokenize(text):
+                weights[token[:SearchPosting.TOKEN_MAX_LENGTH]] += weight
+
+        entry, _ = cls.objects.update_or_create(
+            kind=kind,
+            object_id=object_id,
+            defaults={'title': title[:200], 'subtitle': (subtitle or '')[:200]}
+        )
+        entry.postings.all().delete()
+        SearchPosting.objects.bulk_create(
+            SearchPosting(entry=entry, token=token, weight=weight)
+            for token, weight in weights.items()
+        )
+        return entry
+
+    @classmethod
+    def remove(cls, kind, object_id):
+        """객체 색인 삭제 (역색인은 CASCADE로 함께 삭제)"""
+        cls.objects.filter(kind=kind, object_id=object_id).delete()
+
+    @classmethod
+    def search(cls, query, kinds=None, limit=5):
+        """
+        통합 검색
+        - 상품은 상품 검색 문서(ProductSearchDocument)의 DB 전문 검색 인덱스로 검색 (상품 목록 검색과 같은 순위)
+        - 그 외 종류는 역색인(SearchPosting)에서 검색어의 모든 토큰을 포함하는 객체만 토큰별 가중치 합으로 정렬
+        - 종류별 전체 건수와 상위 limit개 결과 반환
+
+        Args:
+            query: 사용자 검색어
+            kinds: 검색할 종류 목록 (기본값: 전체)
+            limit: 종류별 반환 결과 수
+
+        Returns:
+            dict: {종류: {'count': 건수, 'results': [결과, ...]}} (상품 결과의 score는 None)
+        """
+        kinds = kinds or [key for key, _ in cls.KIND_CHOICES]
+        groups = {kind: {'count': 0, 'results': []} for kind in kinds}
+
+        terms = query_terms(query)[:SearchPosting.MAX_QUERY_TERMS]
+        if not terms:
+            return groups
+
+        if 'product' in groups:
+            groups['product'] = cls.search_products(terms, limit)
+
+        matched = cls.matched_entries(terms, [kind for kind in kinds if kind != 'product'])
+        for kind in groups:
+            if kind == 'product':
+                continue
+            entries = matched.filter(entry__kind=kind)
+            groups[kind]['count'] = entries.count()
+            # 종류별 점수 높은순, 같은 점수는 색인 항목이 나중에 생성된 순 (대체로 최근 등록된 객체 우선)
+            top = list(entries.order_by('-score', '-entry_id')[:limit])
+            titles = cls.objects.in_bulk([row['entry_id'] for row in top])
+            groups[kind]['results'] = [
+                {
+                    'id': titles[row['entry_id']].object_id,
+                    'title': titles[row['entry_id']].title,
+                    'subtitle': titles[row['entry_id']].subtitle,
+                    'score': row['score'],
+                }
+                for row in top
+            ]
+        return groups
+
+    @staticmethod
+    def matched_entries(terms, kinds):
+        """
+        검색어의 모든 토큰과 일치하는 색인 대상별 점수 쿼리셋 (DB에서 집계)
+
+        Args:
+            terms: (토큰, 접두어 검색 여부) 목록
+            kinds: 검색할 종류 목록
+
+        Returns:
+            QuerySet: [{'entry_id', 'score'}, ...]
+        """
+        postings = SearchPosting.objects.filter(entry__kind__in=kinds)
+        any_term = Q()
+        term_scores = []
+        for token, prefix in terms:
+            if prefix:
+                condition = Q(token__gte=token, token__lt=token + '\uffff')
+            else:
+                condition = Q(token=token)
+            any_term |= condition
+            term_scores.append(Sum(Case(When(condition, then='weight'), default=0)))
+
+        names = [f'term_{index}' for index in range(len(term_scores))]
+        return postings.filter(any_term).values('entry_id').annotate(
+            **dict(zip(names, term_scores))
+        ).annotate(
+            score=sum((F(name) for name in names[1:]), F(names[0]))
+        ).filter(
+            **{f'{name}__gt': 0 for name in names}
+        ).values('entry_id', 'score')
+
+    @staticmethod
+    def search_products(terms, limit):
+        """
+        상품 검색 문서 기반 상품 검색 (관련도순, 건수는 최대 SEARCH_RESULT_LIMIT)
+
+        Returns:
+            dict: {'count': 건수, 'results': [결과, ...]}
+        """
+        from products.models import Product
+        from products.search import get_search_backend
+
+        ids = get_search_backend().ranked_ids(terms)
+        products = Product.objects.select_related('category').in_bulk(ids[:limit])
+        return {
+            'count': len(ids),
+            'results': [
+                {
+                    'id': product.pk,
+                    'title': product.name,
+                    'subtitle': product.category.name,
+                    'score': None,
+                }
+                for product in (products[pk] for pk in ids[:limit] if pk in products)
+            ],
+        }
+
+
+class SearchPosting(models.Model):
+    """
+    통합 검색 역색인 모델
+    - (토큰, 색인 대상)별 가중치 점수
+    """
+    TOKEN_MAX_LENGTH = 50
+    # 검색어에서 사용하는 최대 토큰 수
+    MAX_QUERY_TERMS = 10
+
+    entry = models.ForeignKey(
+        SearchEntry,
+        on_delete=models.CASCADE,
+        related_name='postings',
+        verbose_name='색인 대상'
+    )
+    token = models.CharField(max_length=TOKEN_MAX_LENGTH, verbose_name='토큰')
+    weight = models.PositiveIntegerField(default=1, verbose_name='가중치')
+
+    class Meta:
+        verbose_name = '검색 역색인'
+        verbose_name_plural = '검색 역색인 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['token', 'entry'], name='unique_search_posting'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} -> {self.entry_id} ({self.weight})"
@@ -0,0 +1,59 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from outreach_inquiries.models import InternalClass
+from products.models import Product, Category, Tag
+from .autocomplete import autocomplete
+from .indexers import INDEXERS, index_object, index_objects
+from .models import SearchEntry
+
+
+def _connect_indexer(kind, model):
+    """종류별 모델 저장/삭제 시 색인 갱신 핸들러 등록"""
+    def index_on_save(sender, instance, **kwargs):
+        index_object(kind, instance)
+
+    def remove_on_delete(sender, instance, **kwargs):
+        SearchEntry.remove(kind, instance.pk)
+
+    post_save.connect(index_on_save, sender=model, weak=False, dispatch_uid=f'search_index_{kind}')
+    post_delete.connect(remove_on_delete, sender=model, weak=False, dispatch_uid=f'search_remove_{kind}')
+
+
+for _kind, (_model, _queryset, _document) in INDEXERS.items():
+    _connect_indexer(_kind, _model)
+
+
+@receiver(post_save, sender=InternalClass)
+def index_curriculum_on_class_change(sender, instance, created, **kwargs):
+    """수업 제목/활성 여부 변경 시 커리큘럼 색인 갱신 (부제목, 검색 대상 여부)"""
+    if not created:
+        index_objects('curriculum', instance.curriculum_items.values_list('pk', flat=True))
+
+
+# 자동완성 대상 모델별 (종류, 라벨 필드)
+AUTOCOMPLETE_SOURCES = {
+    Product: ('product', 'name'),
+    Tag: ('tag', 'name'),
+    Category: ('category', 'name'),
+    InternalClass: ('internal_class', 'title'),
+}
+
+
+def update_autocomplete_on_save(sender, instance, **kwargs):
+    """자동완성 라벨 증분 갱신 (비활성 수업은 제외)"""
+    kind, field = AUTOCOMPLETE_SOURCES[sender]
+    label = getattr(instance, field)
+    if not getattr(instance, 'is_active', True):
+        label = None
+    autocomplete.update_on_commit(kind, instance.pk, label)
+
+
+def remove_autocomplete_on_delete(sender, instance, **kwargs):
+    """자동완성 라벨 삭제"""
+    kind, _ = AUTOCOMPLETE_SOURCES[sender]
+    autocomplete.update_on_commit(kind, instance.pk)
+
+
+for _model in AUTOCOMPLETE_SOURCES:
+    post_save.connect(update_autocomplete_on_save, sender=_model)
+    post_delete.connect(remove_autocomplete_on_delete, sender=_model)
@@ -0,0 +1,235 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from inquiries.models import Inquiry
+from lessons.models import LessonInquiry
+from outreach_inquiries.models import OutreachInquiry, InternalClass, Curriculum
+from products.models import Product, Category, Tag
+from .models import SearchEntry
+
+
+class UnifiedSearchTest(TestCase):
+    """
+    통합 검색 API 테스트 클래스
+
+    상품/수업/커리큘럼/문의를 종류별로 묶어 관련도순으로 반환하는지 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        self.client = APIClient()
+        self.url = reverse('search:search')
+        self.category = Category.objects.create(name='DIY 키트')
+        self.product = Product.objects.create(
+            name='아두이노 스마트홈 키트',
+            category=self.category,
+            description='센서로 집을 제어합니다.',
+            price=30000,
+            duration='3시간'
+        )
+        self.internal_class = InternalClass.objects.create(
+            title='아두이노 기초',
+            course_type='arduino',
+            instructor='박강사',
+            description='아두이노 보드로 배우는 피지컬 컴퓨팅'
+        )
+        self.curriculum = Curriculum.objects.create(
+            internal_class=self.internal_class,
+            session_number=1,
+            session_title='아두이노 개발환경 구축',
+            description='차시 설명'
+        )
+        Inquiry.objects.create(
+            title='아두이노 키트 견적 문의',
+            description='비공개 내용 서보모터',
+            requester_name='김교사'
+        )
+        LessonInquiry.objects.create(
+            title='방과후 코딩 수업 문의',
+            description='수업 문의 내용',
+            requester_name='이교사'
+        )
+        OutreachInquiry.objects.create(title='아두이노 출강 문의', requester_name='최교사')
+
+    def _search(self, **params):
+        """통합 검색 응답 반환 함수"""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_grouped_results_with_counts(self):
+        """종류별 건수와 결과를 한 번에 반환하는지 테스트 함수"""
+        data = self._search(q='아두이노')
+        results = data['results']
+
+        self.assertEqual(data['total'], 5)
+        self.assertEqual(results['product']['count'], 1)
+        self.assertEqual(results['product']['results'][0]['id'], self.product.pk)
+        self.assertEqual(results['product']['results'][0]['subtitle'], 'DIY 키트')
+        self.assertEqual(results['internal_class']['count'], 1)
+        self.assertEqual(results['curriculum']['results'][0]['subtitle'], '아두이노 기초')
+        self.assertEqual(results['inquiry']['count'], 1)
+        self.assertEqual(results['lesson_inquiry']['count'], 0)
+        self.assertEqual(results['outreach_inquiry']['count'], 1)
+
+    def test_ranking_limit_and_type_filter(self):
+        """제목 일치 우선 정렬, limit, types 필터 테스트 함수"""
+        other = Product.objects.create(
+            name='코딩 로봇',
+            category=self.category,
+            description='아두이노 호환 보드',
+            price=50000,
+            duration='2시간'
+        )
+        data = self._search(q='아두이노', types='product')
+        self.assertEqual(list(data['results']), ['product'])
+        self.assertEqual(
+            [item['id'] for item in data['results']['product']['results']],
+            [self.product.pk, other.pk]
+        )
+
+        data = self._search(q='아두이노', types='product', limit=1)
+        self.assertEqual(data['results']['product']['count'], 2)
+        self.assertEqual(len(data['results']['product']['results']), 1)
+
+    def test_private_fields_not_indexed(self):
+        """문의 본문 등 비공개 필드는 검색되지 않는지 테스트 함수"""
+        self.assertEqual(self._search(q='서보모터')['total'], 0)
+        self.assertEqual(self._search(q='김교사')['results']['inquiry']['count'], 1)
+
+    def test_incremental_updates(self):
+        """저장/삭제/태그/비활성화 시 색인이 갱신되는지 테스트 함수"""
+        self.product.tags.add(Tag.objects.create(name='메이커'))
+        self.assertEqual(self._search(q='메이커')['results']['product']['count'], 1)
+
+        self.internal_class.is_active = False
+        self.internal_class.save()
+        data = self._search(q='아두이노')
+        self.assertEqual(data['results']['internal_class']['count'], 0)
+        self.assertEqual(data['results']['curriculum']['count'], 0)
+
+        self.product.delete()
+        self.assertEqual(self._search(q='스마트홈')['total'], 0)
+
+    def test_invalid_params(self):
+        """검색어 누락, 잘못된 종류/limit 요청 시 400 테스트 함수"""
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'q': '아두이노', 'types': 'user'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'q': '아두이노', 'limit': 100})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command(self):
+        """색인 재생성 명령어 테스트 함수"""
+        SearchEntry.objects.all().delete()
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        # 상품은 상품 검색 문서로 검색하므로 통합 색인에 포함되지 않음
+        self.assertEqual(SearchEntry.objects.count(), 5)
+        self.assertFalse(SearchEntry.objects.filter(kind='product').exists())
+        self.assertEqual(self._search(q='아두이노')['total'], 5)
+
+    def test_product_results_match_catalog_search(self):
+        """상품 결과가 상품 목록 검색과 같은 순서인지 테스트 함수"""
+        for index in range(3):
+            Product.objects.create(
+                name=f'코딩 키트 {index}',
+                category=self.category,
+                description='아두이노 호환',
+                price=10000,
+                duration='1시간'
+            )
+        catalog = self.client.get(reverse('products:product-list'), {'search': '아두이노'})
+        catalog_ids = [item['id'] for item in catalog.data['data']['products']]
+
+        data = self._search(q='아두이노', types='product', limit=10)
+        self.assertEqual(data['results']['product']['count'], 4)
+        self.assertEqual([item['id'] for item in data['results']['product']['results']], catalog_ids)
+
+    def test_query_count_independent_of_matches(self):
+        """일치하는 역색인 수와 관계없이 같은 쿼리 수로 검색하는지 테스트 함수"""
+        with self.assertNumQueries(3):
+            data = self._search(q='아두이노 문의', types='outreach_inquiry')
+        self.assertEqual(data['results']['outreach_inquiry']['count'], 1)
+
+        OutreachInquiry.objects.bulk_create(
+            OutreachInquiry(title=f'아두이노 출강 문의 {index}') for index in range(50)
+        )
+        call_command('rebuild_search_index', 'outreach_inquiry', stdout=StringIO())
+        with self.assertNumQueries(3):
+            data = self._search(q='아두이노 문의', types='outreach_inquiry', limit=2)
+        self.assertEqual(data['results']['outreach_inquiry']['count'], 51)
+        self.assertEqual(len(data['results']['outreach_inquiry']['results']), 2)
+
+
+class AutocompleteTest(TestCase):
+    """
+    검색어 자동완성 API 테스트 클래스
+
+    자모 단위 접두어 일치, 증분 갱신, DB 쿼리 없는 조회를 테스트합니다.
+    """
+    def setUp(self):
+        """테스트 실행 전 초기화 함수"""
+        # 이전 테스트의 색인 버전을 버려 색인을 새로 생성
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('search:autocomplete')
+        self.category = Category.objects.create(name='DIY 키트')
+        self.product = Product.objects.create(
+            name='아두이노 스마트홈 키트',
+            category=self.category,
+            description='상품 설명',
+            price=30000,
+            duration='3시간'
+        )
+        self.tag = Tag.objects.create(name='아두이노')
+        self.internal_class = InternalClass.objects.create(title='과학 탐구 코딩')
+
+    def _labels(self, query, **params):
+        """자동완성 라벨 목록 반환 함수"""
+        response = self.client.get(self.url, {'q': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['label'] for item in response.data['suggestions']]
+
+    def test_prefix_and_partial_syllable(self):
+        """음절 / 입력 중인 자모 / 단어 중간 접두어 일치 테스트 함수"""
+        # 짧은 라벨 우선
+        self.assertEqual(self._labels('아두'), ['아두이노', '아두이노 스마트홈 키트'])
+        self.assertEqual(self._labels('앋'), ['아두이노', '아두이노 스마트홈 키트'])
+        self.assertEqual(self._labels('고'), ['과학 탐구 코딩'])
+        self.assertEqual(self._labels('스마트 홈'), ['아두이노 스마트홈 키트'])
+        self.assertEqual(self._labels('diy'), ['DIY 키트'])
+        # 라벨 전체가 접두어로 시작하는 항목 우선
+        self.assertEqual(self._labels('키'), ['DIY 키트', '아두이노 스마트홈 키트'])
+        self.assertEqual(self._labels('아두', limit=1), ['아두이노'])
+        self.assertEqual(self._labels(' '), [])
+
+    def test_warm_lookup_without_queries(self):
+        """색인 생성 후 조회는 DB 쿼리가 없는지 테스트 함수"""
+        self._labels('아두')
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self._labels('아두')), 2)
+
+    def test_incremental_updates(self):
+        """저장/삭제/비활성화가 커밋 후 반영되는지 테스트 함수"""
+        self._labels('아두')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product.name = '마이크로비트 키트'
+            self.product.save()
+            self.tag.delete()
+            self.internal_class.is_active = False
+            self.internal_class.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._labels('아두'), [])
+            self.assertEqual(self._labels('마이'), ['마이크로비트 키트'])
+            self.assertEqual(self._labels('과학'), [])
+
+    def test_invalid_limit(self):
+        """잘못된 limit 요청 시 400 테스트 함수"""
+        response = self.client.get(self.url, {'q': '아두', 'limit': 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,12 @@
+from django.urls import path
+from . import views
+
+app_name = 'search'
+
+urlpatterns = [
+    # 통합 검색
+    path('', views.search, name='search'),
+
+    # 검색어 자동완성
+    path('autocomplete/', views.autocomplete_suggestions, name='autocomplete'),
+]
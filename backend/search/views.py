@@ -0,0 +1,88 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+
+from .autocomplete import autocomplete
+from .models import SearchEntry
+
+# 종류별 반환 결과 수 기본값 / 최대값
+DEFAULT_RESULT_LIMIT = 5
+MAX_RESULT_LIMIT = 20
+
+# 자동완성 반환 결과 수 기본값 / 최대값
+DEFAULT_SUGGESTION_LIMIT = 10
+MAX_SUGGESTION_LIMIT = 20
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def search(request):
+    """
+    상품/수업/커리큘럼/문의 통합 검색 함수
+
+    GET /api/v1/search/?q=아두이노&types=product,internal_class&limit=5
+    종류별 건수와 관련도순 상위 결과를 한 번에 반환합니다.
+    문의는 목록에 공개되는 제목과 요청자 이름만 검색합니다.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response(
+            {'error': '검색어(q)를 입력해주세요.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    valid_kinds = [key for key, _ in SearchEntry.KIND_CHOICES]
+    kinds = [kind for kind in request.query_params.get('types', '').split(',') if kind]
+    invalid_kinds = [kind for kind in kinds if kind not in valid_kinds]
+    if invalid_kinds:
+        return Response(
+            {'error': f"지원하지 않는 검색 종류입니다: {', '.join(invalid_kinds)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        limit = int(request.query_params.get('limit', DEFAULT_RESULT_LIMIT))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_RESULT_LIMIT:
+        return Response(
+            {'error': f'limit는 1~{MAX_RESULT_LIMIT} 사이의 숫자여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    groups = SearchEntry.search(query, kinds=kinds or valid_kinds, limit=limit)
+    return Response({
+        'query': query,
+        'total': sum(group['count'] for group in groups.values()),
+        'results': groups,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def autocomplete_suggestions(request):
+    """
+    검색어 자동완성 함수
+
+    GET /api/v1/search/autocomplete/?q=아두&limit=10
+    상품명/태그/카테고리/수업 제목 중 접두어가 일치하는 항목을 반환합니다.
+    입력 중인 글자(예: '앋')도 자모 단위로 비교하여 '아두이노'와 일치합니다.
+    색인은 메모리에 있으므로 조회 시 DB 쿼리가 없습니다.
+    """
+    query = request.query_params.get('q', '')
+
+    try:
+        limit = int(request.query_params.get('limit', DEFAULT_SUGGESTION_LIMIT))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_SUGGESTION_LIMIT:
+        return Response(
+            {'error': f'limit는 1~{MAX_SUGGESTION_LIMIT} 사이의 숫자여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response({
+        'query': query,
+        'suggestions': autocomplete.complete(query, limit) if query.strip() else [],
+    })
@@ -0,0 +1,91 @@
+// 미디어 파일 직접 업로드 (S3 호환 저장소)
+// - 브라우저에서 SHA-256 해시를 계산하여 업로드 요청, 같은 내용의 파일이 있으면 업로드 생략
+// - presigned PUT URL로 저장소에 바로 업로드하고 완료 API 호출 후 미디어 파일 선택기에 반영
+(function() {
+    function csrfToken() {
+        const input = document.querySelector('input[name="csrfmiddlewaretoken"]');
+        return input ? input.value : '';
+    }
+
+    async function sha256(file) {
+        const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+        return Array.from(new Uint8Array(digest)).map(byte => byte.toString(16).padStart(2, '0')).join('');
+    }
+
+    async function postJSON(url, data) {
+        const response = await fetch(url, {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {'Content-Type': 'application/json', 'X-CSRFToken': csrfToken()},
+            body: JSON.stringify(data),
+        });
+        const body = await response.json();
+        if (!response.ok) {
+            throw new Error(body.error || JSON.stringify(body));
+        }
+        return body.data;
+    }
+
+    async function upload(select, file, status) {
+        status.textContent = '업로드 준비 중...';
+        const prepared = await postJSON(select.dataset.directUploadUrl, {
+            filename: file.name,
+            size: file.size,
+            sha256: await sha256(file),
+        });
+        if (prepared.upload) {
+            status.textContent = '업로드 중...';
+            const response = await fetch(prepared.upload.url, {
+                method: prepared.upload.method,
+                headers: prepared.upload.headers,
+                body: file,
+            });
+            if (!response.ok) {
+                throw new Error('저장소 업로드 실패 (' + response.status + ')');
+            }
+        }
+        const completed = await postJSON(select.dataset.directUploadCompleteUrl, {
+            path: prepared.path,
+            filename: file.name,
+        });
+
+        const option = new Option(file.name, completed.path, true, true);
+        select.appendChild(option);
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        if (window.django && django.jQuery) {
+            django.jQuery(select).trigger('change.select2');
+        }
+        status.textContent = prepared.upload ? '업로드 완료' : '같은 파일이 있어 업로드를 생략했습니다';
+    }
+
+    function attach(select) {
+        // 인라인 빈 폼 템플릿은 복사된 뒤 연결
+        if (select.dataset.directUploadAttached || select.name.includes('__prefix__')) {
+            return;
+        }
+        select.dataset.directUploadAttached = 'true';
+
+        const input = document.createElement('input');
+        input.type = 'file';
+        input.accept = 'image/*';
+        const status = document.createElement('span');
+        status.className = 'help';
+        select.parentNode.append(input, status);
+
+        input.addEventListener('change', function() {
+            if (!input.files.length) {
+                return;
+            }
+            upload(select, input.files[0], status)
+                .catch(error => { status.textContent = error.message; })
+                .finally(() => { input.value = ''; });
+        });
+    }
+
+    function attachAll(root) {
+        root.querySelectorAll('select[data-direct-upload-url]').forEach(attach);
+    }
+
+    document.addEventListener('DOMContentLoaded', () => attachAll(document));
+    document.addEventListener('formset:added', event => attachAll(event.target));
+})();
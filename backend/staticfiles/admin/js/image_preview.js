@@ -16,7 +16,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     
                     // 1. 미리보기 업데이트
                     if (previewCell) {
-                        const imageUrl = '/media/' + this.value;
+                        const imageUrl = (this.dataset.mediaUrl || '/media/') + this.value;
                         previewCell.innerHTML = `
                             <a href="${imageUrl}" target="_blank">
                                 <img src="${imageUrl}" width="100" height="100" style="object-fit: cover;" />
@@ -0,0 +1,160 @@
+import json
+import re
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+# SQLite EXPLAIN QUERY PLAN의 인덱스 없는 전체 스캔 (예: 'SCAN products_product')
+SQLITE_FULL_SCAN_RE = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+# SQLite EXPLAIN QUERY PLAN의 인덱스 없는 정렬
+SQLITE_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+
+def explain(sql, params=None, using='default'):
+    """
+    쿼리 실행 계획 조회
+
+    Args:
+        sql: SELECT 쿼리
+        params: 쿼리 파라미터 (sql에 값이 채워져 있으면 None)
+        using: DB 별칭
+
+    Returns:
+        list: SQLite는 EXPLAIN QUERY PLAN의 detail 문자열 목록, PostgreSQL은 JSON 실행 계획 노드 목록
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return [node['Plan'] for node in plan]
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def _plan_nodes(plan):
+    """PostgreSQL 실행 계획의 모든 노드 순회"""
+    nodes = list(plan)
+    while nodes:
+        node = nodes.pop()
+        yield node
+        nodes.extend(node.get('Plans', []))
+
+
+def sequential_scans(sql, params=None, using='default'):
+    """
+    인덱스를 사용하지 않고 전체 스캔하는 테이블 목록 반환
+    - SQLite: 'SCAN 테이블' (인덱스 순서로 읽는 'SCAN 테이블 USING INDEX'는 제외)
+    - PostgreSQL: 'Seq Scan' 노드
+
+    Returns:
+        set: 전체 스캔 대상 테이블명
+    """
+    plan = explain(sql, params, using)
+    if connections[using].vendor == 'postgresql':
+        return {
+            node['Relation Name'] for node in _plan_nodes(plan)
+            if node.get('Node Type') == 'Seq Scan'
+        }
+
+    tables = set()
+    for detail in plan:
+        match = SQLITE_FULL_SCAN_RE.match(detail)
+        if match:
+            tables.add(match.group(1))
+    return tables
+
+
+def has_unindexed_sort(sql, params=None, using='default'):
+    """
+    ORDER BY를 인덱스 순서 대신 별도 정렬로 처리하는지 확인
+    - SQLite: 'USE TEMP B-TREE FOR ORDER BY'
+    - PostgreSQL: 'Sort' 노드
+    """
+    plan = explain(sql, params, using)
+    if connections[using].vendor == 'postgresql':
+        return any(node.get('Node Type') == 'Sort' for node in _plan_nodes(plan))
+    return SQLITE_SORT in plan
+
+
+class QueryPlanTestMixin:
+    """
+    API 쿼리 실행 계획 검사용 테스트 믹스인
+    - seed()로 대량 데이터를 만들고 analyze()로 통계를 갱신한 뒤 실제 쿼리를 EXPLAIN
+    - 지정한 테이블을 인덱스 없이 전체 스캔하거나 ORDER BY를 별도 정렬로 처리하면 실패
+    """
+    # 실행 계획 검사용 최소 행 수
+    seed_rows = 100000
+
+    @classmethod
+    def seed(cls, model, objects, using='default'):
+        """
+        objects를 저장한 뒤 테이블 행을 복제하여 seed_rows 이상으로 증식
+        - ORM으로 행마다 INSERT하지 않고 INSERT ... SELECT로 행 수를 두 배씩 늘림
+        - objects는 필터 / 정렬 값이 골고루 분포하도록 다양한 값으로 구성
+
+        Args:
+            model: 데이터를 생성할 모델 (unique 제약이 없는 모델)
+            objects: 복제 원본 모델 객체 목록
+        """
+        model.objects.using(using).bulk_create(objects)
+        connection = connections[using]
+        table = connection.ops.quote_name(model._meta.db_table)
+        columns = ', '.join(
+            connection.ops.quote_name(field.column)
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+        )
+        rows = model.objects.using(using).count()
+        with connection.cursor() as cursor:
+            while rows < cls.seed_rows:
+                cursor.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}')
+                rows *= 2
+
+    @classmethod
+    def analyze(cls, using='default'):
+        """시드 데이터 기준으로 DB 통계 갱신"""
+        with connections[using].cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def _assert_indexed(self, tables, sql, params=None, using='default'):
+        """쿼리가 tables를 전체 스캔하거나 인덱스 없이 정렬하면 실행 계획과 함께 실패"""
+        scanned = sequential_scans(sql, params, using) & set(tables)
+        if scanned:
+            message = f"전체 스캔 발생 ({', '.join(sorted(scanned))})"
+        elif has_unindexed_sort(sql, params, using):
+            message = '인덱스 없는 정렬 발생'
+        else:
+            return
+        plan = '\n'.join(map(str, explain(sql, params, using)))
+        self.fail(f'{message}:\n{sql}\n{plan}')
+
+    def assertIndexedQueries(self, tables, func, *args, using='default', **kwargs):
+        """
+        func 실행 중의 SELECT 쿼리가 tables를 전체 스캔하거나 인덱스 없이 정렬하지 않는지 검사
+
+        Args:
+            tables: 전체 스캔을 허용하지 않는 테이블명 목록
+            func: 검사할 요청을 실행하는 함수
+
+        Returns:
+            func의 반환값
+        """
+        with CaptureQueriesContext(connections[using]) as context:
+            result = func(*args, **kwargs)
+
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].lstrip().upper().startswith('SELECT')
+        ]
+        self.assertTrue(selects, '실행된 SELECT 쿼리가 없습니다.')
+        for sql in selects:
+            self._assert_indexed(tables, sql, using=using)
+        return result
+
+    def assertIndexedQueryset(self, tables, queryset):
+        """쿼리셋을 실행하지 않고 실행 계획만 검사 (전체 목록처럼 실행 비용이 큰 쿼리용)"""
+        sql, params = queryset.query.sql_with_params()
+        self._assert_indexed(tables, sql, params, using=queryset.db)